@@ -0,0 +1,181 @@
+# file: bench_pipeline.py
+# brief: 解析 -> 生成今日课表 -> 生成配置 -> 写入 整条流程的性能测试
+# time: 2026.10.17
+#
+# 用法(在仓库根目录下):
+#   python benchmarks/bench_pipeline.py [--sizes 1 100 1000] [--full-cycle] [-o 结果文件]
+#
+# 随机生成指定班级数的课表(所有班级共用仓库中的timetable.txt), 分别统计每个阶段的耗时,
+# 并单独跑一遍统计内存峰值(tracemalloc会拖慢速度, 不与计时放在一起), 结果保存为json方便对比
+
+import os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from   class_manager import ClassTable, TimeTable
+from   json_writer   import ALL_CLASSES, JsonManager
+from   weektime      import WeekTime
+from   typing        import Any
+from   loguru        import logger
+import argparse, datetime, platform, random, tempfile, time, tracemalloc, orjson
+
+STAGES: tuple[str, ...] = ("parseClassTable", "parseTimeTable", "getClassTableToday", "generateOverAllDict", "writeJsonFile")
+DAYS: list[str] = ["周一", "周二", "周三", "周四", "周五"]
+
+
+def writeSyntheticClasses(dirPath: str, count: int, seed: int) -> list[str]:
+    """
+    随机生成count个班级的课表文件
+
+    Returns:
+        list[str]: 课表文件路径
+    """
+
+    rng = random.Random(seed)
+    paths: list[str] = []
+    for i in range(count):
+        lines: list[str] = []
+        for day in DAYS:
+            lines.append(f"{day}:" + ",".join(rng.choice(ALL_CLASSES) for _ in range(9)))
+        for week in range(1, 4):
+            lines.append(f"周六{week}:" + ",".join(rng.choice(ALL_CLASSES) for _ in range(4)))
+        for week in range(1, 4):
+            lines.append(f"晚课{week}:" + ",".join(rng.choice(ALL_CLASSES) for _ in range(5)))
+
+        path: str = os.path.join(dirPath, f"classes_{i}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        paths.append(path)
+
+    return paths
+
+def runPipeline(classPaths: list[str], timetablePath: str, outDir: str, fullCycle: bool,
+                timing: dict[str, float]) -> int:
+    """
+    依次处理每个班级, 各阶段耗时(秒)累加到timing中
+
+    Returns:
+        int: 写入的配置文件总大小(字节)
+    """
+
+    weekTime: WeekTime = WeekTime(0, 0)
+    jsonManager: JsonManager = JsonManager(weekTime, assignedUUID={})
+    jsonManager.assignUUID()
+    jsonManager.setFullCycle(fullCycle)
+    jsonManager.digestFilePath = ""
+    jsonManager.invalidateFragmentCache()                               # 每次都从冷缓存开始
+
+    outputSize: int = 0
+    for i, classPath in enumerate(classPaths):
+        classTable: ClassTable = ClassTable(weekTime)
+        timeTable: TimeTable = TimeTable()
+        outPath: str = os.path.join(outDir, f"{i}.json")
+
+        t0 = time.perf_counter()
+        classTable.parseClassTable(classPath)
+        t1 = time.perf_counter()
+        timeTable.parseTimeTable(timetablePath)
+        t2 = time.perf_counter()
+        classTable.getClassTableToday()
+        t3 = time.perf_counter()
+        jsonManager.generateOverAllDict(classTable, timeTable)
+        t4 = time.perf_counter()
+        jsonManager.writeJsonFile(outPath, force=True)
+        t5 = time.perf_counter()
+
+        for stage, elapsed in zip(STAGES, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4)):
+            timing[stage] += elapsed
+        if os.path.exists(outPath):
+            outputSize += os.path.getsize(outPath)
+
+    return outputSize
+
+def benchSize(count: int, timetablePath: str, fullCycle: bool, seed: int) -> dict[str, Any]:
+    """
+    测试一种班级数
+
+    Returns:
+        dict[str, Any]: 测试结果
+    """
+
+    with tempfile.TemporaryDirectory() as tmpDir:
+        classPaths: list[str] = writeSyntheticClasses(tmpDir, count, seed)
+        outDir: str = os.path.join(tmpDir, "output")
+        os.makedirs(outDir)
+
+        # 计时
+        timing: dict[str, float] = {stage: 0.0 for stage in STAGES}
+        start = time.perf_counter()
+        outputSize: int = runPipeline(classPaths, timetablePath, outDir, fullCycle, timing)
+        total: float = time.perf_counter() - start
+
+        # 内存峰值
+        tracemalloc.start()
+        runPipeline(classPaths, timetablePath, outDir, fullCycle, {stage: 0.0 for stage in STAGES})
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "classes": count,
+        "stages": {
+            stage: {
+                "total_ms": round(elapsed * 1000, 3),
+                "per_class_us": round(elapsed / count * 1e6, 3),
+                "classes_per_s": round(count / elapsed, 1) if elapsed > 0 else None
+            }
+            for stage, elapsed in timing.items()
+        },
+        "total_ms": round(total * 1000, 3),
+        "classes_per_s": round(count / total, 1) if total > 0 else None,
+        "peak_memory_bytes": peak,
+        "output_bytes": outputSize,
+        "output_bytes_per_class": outputSize // count if count > 0 else 0
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="课表生成流程性能测试")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 1000], help="班级数, 默认为 1 100 1000")
+    parser.add_argument("--timetable", default="./timetable.txt", help="所有班级共用的时间表文件")
+    parser.add_argument("--full-cycle", action="store_true", help="生成完整轮换周期的课表")
+    parser.add_argument("--seed", type=int, default=0, help="随机课表的种子")
+    parser.add_argument("-o", "--output", default="", help="结果json路径, 默认为 benchmarks/results/pipeline-<时间>.json")
+    args = parser.parse_args()
+
+    logger.remove()                                                     # 不输出测试过程中的日志
+
+    fullCycle: bool = args.full_cycle
+    if not fullCycle and datetime.date.today().weekday() == 6:
+        print("今天是周日, 不会生成今日课表, 改为测试完整轮换周期")
+        fullCycle = True
+
+    results: list[dict[str, Any]] = []
+    for count in args.sizes:
+        result: dict[str, Any] = benchSize(count, args.timetable, fullCycle, args.seed)
+        results.append(result)
+
+        print(f"\n{count} 个班级: 总耗时 {result['total_ms']:.1f} ms ({result['classes_per_s']} 班/秒), "
+              f"内存峰值 {result['peak_memory_bytes'] / 1024 / 1024:.2f} MB, 输出 {result['output_bytes'] / 1024:.1f} KB")
+        for stage, stat in result["stages"].items():
+            print(f"  {stage:<22}{stat['total_ms']:>12.2f} ms{stat['per_class_us']:>12.1f} us/班")
+
+    report: dict[str, Any] = {
+        "time": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "orjson": orjson.__version__,
+        "fullCycle": fullCycle,
+        "seed": args.seed,
+        "results": results
+    }
+
+    outPath: str = args.output
+    if outPath == "":
+        resultDir: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+        os.makedirs(resultDir, exist_ok=True)
+        outPath = os.path.join(resultDir, f"pipeline-{datetime.datetime.now():%Y%m%d-%H%M%S}.json")
+    with open(outPath, "wb") as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    print(f"\n结果已保存到 '{outPath}'")
+
+
+if __name__ == '__main__':
+    main()
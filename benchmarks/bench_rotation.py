@@ -0,0 +1,111 @@
+# file: bench_rotation.py
+# brief: 比较逐日计算与calendar_vec批量计算一段日期在所有偏移量下的周数/课表行的耗时
+# time: 2026.10.17
+#
+# 用法(在仓库根目录下, 需要先运行 pip install -r requirements-bench.txt 安装numpy):
+#   python benchmarks/bench_rotation.py [--days 365] [-n 重复次数]
+#
+# 两种方法都使用同一个节假日日历(有 ./data/holidays.json 时读取它, 否则使用sampleHolidays中的示例),
+# 比较的是修正后的结果(执行周几的课表, 周数, 课表行)
+
+import os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from   calendar_index import CalendarIndex
+from   holidays       import DayOverride, HolidayCalendar, loadHolidays
+from   rotation       import presetRules
+from   loguru         import logger
+import argparse, datetime, timeit, calendar_vec
+
+PERIOD_1, PERIOD_2 = (rule.period for rule in presetRules())
+OFFSETS: list[tuple[int, int]] = [(o1, o2) for o1 in range(PERIOD_1) for o2 in range(PERIOD_2)]
+
+
+def sampleHolidays(start: datetime.date) -> HolidayCalendar:
+    """
+    示例节假日日历: 一段7天的假期, 假期后周日补上周五的课, 以及一个按三周轮换第3周上课的周六
+    """
+
+    holiday: datetime.date = start + datetime.timedelta(days=30)
+    makeUp: datetime.date = holiday + datetime.timedelta(days=7 + (6 - (holiday + datetime.timedelta(days=7)).weekday()))
+    saturday: datetime.date = makeUp + datetime.timedelta(days=6)
+    return HolidayCalendar([
+        DayOverride("假期", holiday, holiday + datetime.timedelta(days=6), noClass=True),
+        DayOverride("调休", makeUp, makeUp, weekday=4),
+        DayOverride("补周六课", saturday, saturday, weekCount2=2)
+    ])
+
+def scalarLoop(dates: list[datetime.date], holidays: HolidayCalendar) -> list[list[tuple[int, ...]]]:
+    """
+    逐日计算(每种偏移量一个CalendarIndex, 日期在索引范围外, 走直接计算的路径)
+
+    Returns:
+        list[list[tuple[int, ...]]]: 每种偏移量下每天的(周几, 执行周几的课表, 单双周数, 三周周数, 表, 行, 晚课行)
+    """
+
+    results = []
+    for o1, o2 in OFFSETS:
+        calendar: CalendarIndex = CalendarIndex(dates[0], 0, o1, o2, holidays=holidays)
+        rows = []
+        for date in dates:
+            info = calendar.lookup(date)
+            if info.noClass:
+                table, row, eveningRow = calendar_vec.TABLE_NONE, -1, -1
+            elif info.scheduleWeekday == 5:
+                table, row, eveningRow = calendar_vec.TABLE_SATURDAY, info.weekCount2, -1
+            else:
+                table, row, eveningRow = calendar_vec.TABLE_WEEKDAY, info.scheduleWeekday, info.weekCount2
+            rows.append((info.weekday, info.scheduleWeekday, info.weekCount1, info.weekCount2, table, row, eveningRow))
+        results.append(rows)
+    return results
+
+def vectorized(dates, holidays: HolidayCalendar) -> "calendar_vec.DateResolution":
+    """
+    批量计算, 偏移量按(6, 1)的形状与日期广播
+    """
+
+    offset1 = [[o1] for o1, _ in OFFSETS]
+    offset2 = [[o2] for _, o2 in OFFSETS]
+    return calendar_vec.resolveDates(dates, offset1, offset2, holidays)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="逐日计算与批量计算的耗时对比")
+    parser.add_argument("--days", type=int, default=365, help="日期数量, 默认为一年")
+    parser.add_argument("-n", "--number", type=int, default=20, help="重复次数")
+    args = parser.parse_args()
+
+    logger.remove()                                                     # 不输出CalendarIndex构建日志
+
+    if calendar_vec.requireNumpy() is None:
+        print("未安装numpy, 无法测试, 请先运行 pip install -r requirements-bench.txt")
+        return
+
+    start: datetime.date = datetime.date.today()
+    dates: list[datetime.date] = [start + datetime.timedelta(days=i) for i in range(args.days)]
+    npDates = calendar_vec.dateRange(start, args.days)
+
+    holidays: HolidayCalendar = loadHolidays()
+    if len(holidays) == 0:
+        holidays = sampleHolidays(start)
+
+    # 先确认两种方法结果一致
+    expected = scalarLoop(dates, holidays)
+    result = vectorized(npDates, holidays)
+    for i, rows in enumerate(expected):
+        actual = list(zip(*(field[i].tolist() for field in result)))
+        if actual != rows:
+            print(f"偏移量 {OFFSETS[i]} 下的结果不一致")
+            return
+
+    scalarUs: float = timeit.timeit(lambda: scalarLoop(dates, holidays), number=args.number) / args.number * 1e6
+    vectorUs: float = timeit.timeit(lambda: vectorized(npDates, holidays), number=args.number) / args.number * 1e6
+
+    total: int = args.days * len(OFFSETS)
+    print(f"{args.days} 天 x {len(OFFSETS)} 种偏移量 = {total} 次计算, 节假日/调休 {len(holidays)} 项, 结果一致")
+    print(f"  逐日计算 {scalarUs:>12.1f} us  ({scalarUs / total * 1000:.1f} ns/次)")
+    print(f"  批量计算 {vectorUs:>12.1f} us  ({vectorUs / total * 1000:.1f} ns/次)")
+    print(f"  加速比   {scalarUs / vectorUs:>12.1f} x")
+
+
+if __name__ == '__main__':
+    main()
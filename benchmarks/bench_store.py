@@ -0,0 +1,71 @@
+# file: bench_store.py
+# brief: 比较pickle与store模块保存时间表/uuid的读取耗时和文件大小
+# time: 2026.10.17
+#
+# 用法(在仓库根目录下):
+#   python benchmarks/bench_store.py [时间表文件] [-n 重复次数]
+
+import os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from   class_manager import TimeTable
+from   json_writer   import JsonManager
+from   weektime      import WeekTime
+from   loguru        import logger
+import argparse, pickle, tempfile, timeit, store
+
+
+def bench(number: int, load) -> float:
+    """
+    重复读取number次, 返回单次的平均耗时(微秒)
+    """
+
+    return timeit.timeit(load, number=number) / number * 1e6
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="pickle与store格式的读取耗时/文件大小对比")
+    parser.add_argument("timetable", nargs="?", default="./timetable.txt", help="用于测试的时间表文件")
+    parser.add_argument("-n", "--number", type=int, default=2000, help="重复次数")
+    args = parser.parse_args()
+
+    logger.remove()                                                     # 不输出测试过程中的日志
+
+    timeTable = TimeTable()
+    timeTable.parseTimeTable(args.timetable)
+
+    with tempfile.TemporaryDirectory() as tmpDir:
+        # 生成uuid, 不读写uuid文件
+        jsonManager = JsonManager(WeekTime(0, 0), assignedUUID={})
+        jsonManager.assignUUID()
+
+        files: dict[str, str] = {name: os.path.join(tmpDir, name) for name in
+                                 ("timetable.pickle", "timetable.cic", "uuid.pickle", "uuid.cic")}
+        with open(files["timetable.pickle"], "wb") as f:
+            pickle.dump(timeTable, f)
+        timeTable.saveTimeTable(files["timetable.cic"])
+        with open(files["uuid.pickle"], "wb") as f:
+            pickle.dump(jsonManager.assignedUUID, f)
+        store.saveUUIDMap(files["uuid.cic"], jsonManager.assignedUUID)
+
+        def loadPickle(path: str):
+            with open(path, "rb") as f:
+                return pickle.load(f)
+
+        results: list[tuple[str, int, float]] = [
+            ("时间表 pickle", os.path.getsize(files["timetable.pickle"]),
+             bench(args.number, lambda: loadPickle(files["timetable.pickle"]))),
+            ("时间表 store",  os.path.getsize(files["timetable.cic"]),
+             bench(args.number, lambda: TimeTable().loadTimeTable(files["timetable.cic"]))),
+            ("uuid   pickle", os.path.getsize(files["uuid.pickle"]),
+             bench(args.number, lambda: loadPickle(files["uuid.pickle"]))),
+            ("uuid   store",  os.path.getsize(files["uuid.cic"]),
+             bench(args.number, lambda: store.loadUUIDMap(files["uuid.cic"]))),
+        ]
+
+    print(f"{'格式':<14}{'大小(字节)':>12}{'读取耗时(us)':>16}")
+    for name, size, elapsed in results:
+        print(f"{name:<14}{size:>12}{elapsed:>16.2f}")
+
+
+if __name__ == '__main__':
+    main()
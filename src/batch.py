@@ -0,0 +1,403 @@
+# file: batch.py
+# brief: 无界面的多班级批量生成模块
+# time: 2026.10.17
+# TODOs:
+#   暂无
+#
+# 用法:
+#   python src/batch.py <班级目录/清单文件/全校课表文件> [-o 输出目录] [-j 进程数] [--full-cycle] [--force] [--report 报告路径]
+#
+# 班级目录模式: 目录下每个子目录为一个班级, 子目录中需含有 classes.txt 和 timetable.txt,
+#              输出到 <输出目录>/<班级名>/Default.json
+# 清单文件模式: json文件, 格式如下(相对路径以清单文件所在目录为基准, output可省略):
+#   {
+#       "classes": [
+#           {"name": "高一1班", "classes": "g1c1/classes.txt", "timetable": "g1c1/timetable.txt", "output": "..."},
+#           ......
+#       ]
+#   }
+# 全校课表模式: 非json的单个文件, 所有班级的课表写在同一个文件中, 格式见school_parser模块,
+#              输出到 <输出目录>/<班级名>/Default.json
+
+from   concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
+from   class_manager      import ClassTable, TimeTable
+from   json_writer        import JsonManager
+from   school_parser      import SchoolClass, parseSchoolFile
+from   weektime           import WeekTime
+from   typing             import Any, Optional
+from   loguru             import logger
+import argparse, datetime, fanout, json, os, sys, time, traceback, uuid, orjson, validator
+
+
+def collectJobs(source: str, outDir: str) -> list[dict[str, str]]:
+    """
+    收集所有班级的生成任务
+
+    Args:
+        source (str): 班级目录或清单文件路径
+        outDir (str): 输出目录
+
+    Returns:
+        list[dict[str, str]]: 任务列表, 每个任务含有name, classes, timetable, output四项
+    """
+
+    jobs: list[dict[str, str]] = []
+
+    # 清单文件模式
+    if os.path.isfile(source):
+        baseDir: str = os.path.dirname(os.path.abspath(source))
+        with open(source, "r", encoding="utf-8") as manifestFile:
+            manifest: dict = json.load(manifestFile)
+
+        for entry in manifest.get("classes", []):
+            name: str = entry.get("name", "")
+            if name == "" or "classes" not in entry or "timetable" not in entry:
+                logger.warning(f"清单中存在缺少 name/classes/timetable 的条目, 已跳过: {entry}")
+                continue
+            if any(job["name"] == name for job in jobs):                # 同名班级会互相覆盖输出和报告
+                logger.warning(f"清单中的班级名 '{name}' 重复, 已跳过: {entry}")
+                continue
+            jobs.append({
+                "name": name,
+                "classes": os.path.join(baseDir, entry["classes"]),
+                "timetable": os.path.join(baseDir, entry["timetable"]),
+                "output": os.path.join(baseDir, entry["output"]) if "output" in entry
+                          else os.path.join(outDir, name, "Default.json")
+            })
+    # 班级目录模式
+    elif os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            classDir: str = os.path.join(source, name)
+            classesPath: str   = os.path.join(classDir, "classes.txt")
+            timetablePath: str = os.path.join(classDir, "timetable.txt")
+            if not os.path.isdir(classDir):
+                continue
+            if not os.path.exists(classesPath) or not os.path.exists(timetablePath):
+                logger.warning(f"目录 '{classDir}' 缺少 classes.txt 或 timetable.txt, 已跳过")
+                continue
+            jobs.append({
+                "name": name,
+                "classes": classesPath,
+                "timetable": timetablePath,
+                "output": os.path.join(outDir, name, "Default.json")
+            })
+    else:
+        logger.error(f"批量生成时路径 '{source}' 不存在")
+
+    return jobs
+
+def initWorker() -> None:
+    """
+    子进程初始化, 只输出警告以上的日志, 避免几百个班级的日志刷屏
+    """
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+def buildProfile(result: dict[str, Any], weekTime: WeekTime, classTable: ClassTable, timeTable: TimeTable,
+                 assignedUUID: dict[str, uuid.UUID], fullCycle: bool, force: bool) -> None:
+    """
+    根据已解析好的课表和时间表生成并写入课表配置文件, 状态和耗时写入result
+
+    Args:
+        result (dict[str, Any]): 生成结果, 见generateClassProfile
+        weekTime (WeekTime): 周数计算实例
+        classTable (ClassTable): 课表
+        timeTable (TimeTable): 时间表
+        assignedUUID (dict[str, uuid.UUID]): 主进程分配好的uuid
+        fullCycle (bool): 是否生成完整轮换周期的课表
+        force (bool): 内容未变化时是否仍然写入
+    """
+
+    timing: dict[str, float] = result["timing"]
+
+    jsonManager: JsonManager = JsonManager(weekTime, assignedUUID=assignedUUID)
+    jsonManager.setFullCycle(fullCycle)
+    jsonManager.digestFilePath = ""                                     # 多进程不共用哈希记录, 直接与已有文件比较
+
+    t1 = time.perf_counter()
+    classTable.getClassTableToday()
+    jsonManager.generateOverAllDict(classTable, timeTable)
+    t2 = time.perf_counter()
+
+    if jsonManager.overAllDict == {}:
+        if not fullCycle and weekTime.calendar.noClass(weekTime.curDateTime.date()):
+            result["status"] = "skipped"
+            result["error"] = "今天没有课程"
+        else:
+            result["status"] = "failed"
+            errors: list[str] = [issue.message for issue in validator.errorsOf(jsonManager.lastIssues)]
+            result["error"] = "; ".join(errors) if len(errors) > 0 else "生成的课表配置为空, 请检查课表/时间表文件"
+    else:
+        os.makedirs(os.path.dirname(os.path.abspath(result["output"])), exist_ok=True)
+        if not jsonManager.writeJsonFile(result["output"], force):
+            writeResults: list[dict[str, Any]] = jsonManager.lastWriteResults
+            if len(writeResults) > 0 and writeResults[0]["kind"] == fanout.TARGET_PRIMARY and writeResults[0]["status"] != "ok":
+                result["status"] = "failed"
+                result["error"] = writeResults[0]["error"]
+            else:
+                result["status"] = "unchanged"
+    t3 = time.perf_counter()
+
+    timing["generate"] = round((t2 - t1) * 1000, 3)
+    timing["write"]    = round((t3 - t2) * 1000, 3)
+
+def newResult(name: str, output: str) -> dict[str, Any]:
+    return {
+        "name": name,
+        "output": output,
+        "status": "ok",
+        "error": "",
+        "timing": {}
+    }
+
+def generateClassProfile(job: dict[str, str], weekOffset1: int, weekOffset2: int,
+                         assignedUUID: dict[str, uuid.UUID], fullCycle: bool = False,
+                         force: bool = False) -> dict[str, Any]:
+    """
+    生成单个班级的课表配置文件(在子进程中执行)
+
+    Args:
+        job (dict[str, str]): 任务, 见collectJobs
+        weekOffset1 (int): 单双周偏移量
+        weekOffset2 (int): 三周轮换偏移量
+        assignedUUID (dict[str, uuid.UUID]): 主进程分配好的uuid
+        fullCycle (bool, optional): 是否生成完整轮换周期的课表. Defaults to False.
+        force (bool, optional): 内容未变化时是否仍然写入. Defaults to False.
+
+    Returns:
+        dict[str, Any]: 生成结果, 含有班级名, 状态, 错误信息和各阶段耗时(毫秒)
+    """
+
+    result: dict[str, Any] = newResult(job["name"], job["output"])
+    timing: dict[str, float] = result["timing"]
+
+    try:
+        start = time.perf_counter()
+
+        weekTime: WeekTime = WeekTime(weekOffset1, weekOffset2)
+        classTable: ClassTable = ClassTable(weekTime)
+        timeTable: TimeTable = TimeTable()
+
+        t0 = time.perf_counter()
+        classTable.parseClassTable(job["classes"])
+        timeTable.parseTimeTable(job["timetable"])
+        timing["parse"] = round((time.perf_counter() - t0) * 1000, 3)
+
+        buildProfile(result, weekTime, classTable, timeTable, assignedUUID, fullCycle, force)
+        timing["total"] = round((time.perf_counter() - start) * 1000, 3)
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+
+    return result
+
+def generateSchoolClassProfile(schoolClass: SchoolClass, output: str, assignedUUID: dict[str, uuid.UUID],
+                               fullCycle: bool = False, force: bool = False) -> dict[str, Any]:
+    """
+    生成全校课表文件中一个班级的课表配置文件(在子进程中执行)
+
+    Args:
+        schoolClass (SchoolClass): 已解析好的班级
+        output (str): 输出路径
+        assignedUUID (dict[str, uuid.UUID]): 主进程分配好的uuid
+        fullCycle (bool, optional): 是否生成完整轮换周期的课表. Defaults to False.
+        force (bool, optional): 内容未变化时是否仍然写入. Defaults to False.
+
+    Returns:
+        dict[str, Any]: 生成结果, 同generateClassProfile, 另含有格式错误的行(warnings)
+    """
+
+    result: dict[str, Any] = newResult(schoolClass.name, output)
+    result["warnings"] = [f"第 {lineNumber} 行: {error}" for lineNumber, error in schoolClass.errors]
+
+    try:
+        start = time.perf_counter()
+        buildProfile(result, schoolClass.classTable.myTime, schoolClass.classTable, schoolClass.timeTable,
+                     assignedUUID, fullCycle, force)
+        result["timing"]["total"] = round((time.perf_counter() - start) * 1000, 3)
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+
+    return result
+
+def logResult(result: dict[str, Any]) -> None:
+    """
+    输出单个班级的生成结果
+    """
+
+    for warning in result.get("warnings", []):
+        logger.warning(f"[{result['name']}] {warning}")
+
+    if result["status"] == "ok":
+        logger.success(f"[{result['name']}] 生成完成, 耗时 {result['timing'].get('total', 0):.1f} ms")
+    elif result["status"] == "unchanged":
+        logger.info(f"[{result['name']}] 内容未变化, 跳过写入, 耗时 {result['timing'].get('total', 0):.1f} ms")
+    elif result["status"] == "skipped":
+        logger.info(f"[{result['name']}] 已跳过: {result['error']}")
+    else:
+        logger.error(f"[{result['name']}] 生成失败: {result['error']}")
+
+def runBatch(jobs: list[dict[str, str]], weekTime: WeekTime, assignedUUID: dict[str, uuid.UUID],
+             workers: Optional[int] = None, fullCycle: bool = False, force: bool = False) -> list[dict[str, Any]]:
+    """
+    用进程池并行生成所有班级的课表配置
+
+    Args:
+        jobs (list[dict[str, str]]): 任务列表
+        weekTime (WeekTime): 周数计算实例(只使用其偏移量)
+        assignedUUID (dict[str, uuid.UUID]): uuid
+        workers (int, optional): 进程数, 为None时使用CPU核心数. Defaults to None.
+        fullCycle (bool, optional): 是否生成完整轮换周期的课表. Defaults to False.
+        force (bool, optional): 内容未变化时是否仍然写入. Defaults to False.
+
+    Returns:
+        list[dict[str, Any]]: 每个班级的生成结果, 顺序与jobs一致
+    """
+
+    results: list[dict[str, Any]] = [{} for _ in jobs]                  # 按任务下标保存, 与jobs顺序一致
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initWorker) as executor:
+        futures = {
+            executor.submit(generateClassProfile, job, weekTime.weekOffset1, weekTime.weekOffset2, assignedUUID,
+                            fullCycle, force): index
+            for index, job in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            index: int = futures[future]
+            job = jobs[index]
+            try:
+                result: dict[str, Any] = future.result()
+            except Exception as e:                                      # 子进程崩溃等情况
+                result = newResult(job["name"], job["output"])
+                result["status"] = "failed"
+                result["error"] = f"{type(e).__name__}: {e}"
+
+            logResult(result)
+            results[index] = result
+
+    return results
+
+def runSchoolBatch(filePath: str, outDir: str, weekTime: WeekTime, assignedUUID: dict[str, uuid.UUID],
+                   workers: Optional[int] = None, fullCycle: bool = False, force: bool = False) -> list[dict[str, Any]]:
+    """
+    流式解析全校课表文件, 边解析边用进程池生成, 同时在处理中的班级不超过进程数的2倍, 内存占用与班级数量无关
+
+    Args:
+        filePath (str): 全校课表文件路径
+        outDir (str): 输出目录, 输出到 <输出目录>/<班级名>/Default.json
+        其余参数同runBatch
+
+    Returns:
+        list[dict[str, Any]]: 每个班级的生成结果, 顺序与文件中一致
+    """
+
+    results: list[dict[str, Any]] = []
+    names: set[str] = set()                                             # 已提交的班级名, 同名班级会写入同一个输出文件
+    maxPending: int = (workers or os.cpu_count() or 1) * 2
+
+    def collect(future: Future) -> None:
+        index, name, output = pending.pop(future)
+        try:
+            result: dict[str, Any] = future.result()
+        except Exception as e:                                          # 子进程崩溃等情况
+            result = newResult(name, output)
+            result["status"] = "failed"
+            result["error"] = f"{type(e).__name__}: {e}"
+        logResult(result)
+        results[index] = result
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initWorker) as executor:
+        pending: dict[Future, tuple[int, str, str]] = {}
+        for schoolClass in parseSchoolFile(filePath, weekTime):
+            if schoolClass.name in names:
+                logger.warning(f"全校课表文件中的班级名 '{schoolClass.name}' 重复, 只生成第一次出现的班级, 已跳过第 {schoolClass.lineNumber} 行的班级")
+                continue
+            names.add(schoolClass.name)
+
+            if len(pending) >= maxPending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+
+            output: str = os.path.join(outDir, schoolClass.name, "Default.json")
+            results.append({})
+            future = executor.submit(generateSchoolClassProfile, schoolClass, output, assignedUUID, fullCycle, force)
+            pending[future] = (len(results) - 1, schoolClass.name, output)
+
+        for future in list(pending):
+            collect(future)
+
+    return results
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    批量生成入口
+
+    Returns:
+        int: 进程退出码, 有班级生成失败时为1
+    """
+
+    parser = argparse.ArgumentParser(description="CIConfig 多班级批量生成课表配置文件")
+    parser.add_argument("source", help="班级目录(每个子目录含 classes.txt 和 timetable.txt), json清单文件或全校课表文件")
+    parser.add_argument("-o", "--output", default="./output/batch", help="输出目录, 默认为 ./output/batch")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="并行进程数, 默认为CPU核心数")
+    parser.add_argument("--uuid", default="./data/uuid.cic", help="uuid文件路径, 所有班级共用, 默认为 ./data/uuid.cic")
+    parser.add_argument("--full-cycle", action="store_true", help="生成完整轮换周期的课表, 整个学期只需写入一次")
+    parser.add_argument("--force", action="store_true", help="内容未变化时也重新写入")
+    parser.add_argument("--report", default="", help="将每个班级的耗时/错误报告写入该json文件")
+    args = parser.parse_args(argv)
+
+    schoolMode: bool = os.path.isfile(args.source) and not args.source.lower().endswith(".json")
+    jobs: list[dict[str, str]] = [] if schoolMode else collectJobs(args.source, args.output)
+    if not schoolMode and len(jobs) == 0:
+        logger.error("没有找到需要生成的班级")
+        return 1
+
+    uuidDir: str = os.path.dirname(os.path.abspath(args.uuid))
+    os.makedirs(uuidDir, exist_ok=True)
+
+    # uuid和偏移量在主进程中统一准备, 子进程只读
+    weekTime: WeekTime = WeekTime()
+    jsonManager: JsonManager = JsonManager(weekTime, args.uuid)
+
+    start = time.perf_counter()
+    if schoolMode:
+        logger.info(f"开始从全校课表文件 '{args.source}' 批量生成课表配置")
+        results: list[dict[str, Any]] = runSchoolBatch(args.source, args.output, weekTime, jsonManager.assignedUUID,
+                                                         args.jobs, args.full_cycle, args.force)
+        if len(results) == 0:
+            logger.error("没有找到需要生成的班级")
+            return 1
+    else:
+        logger.info(f"开始批量生成 {len(jobs)} 个班级的课表配置")
+        results = runBatch(jobs, weekTime, jsonManager.assignedUUID, args.jobs, args.full_cycle, args.force)
+    elapsed: float = time.perf_counter() - start
+
+    okCount: int      = sum(1 for r in results if r["status"] in ("ok", "unchanged"))
+    skippedCount: int = sum(1 for r in results if r["status"] == "skipped")
+    failedCount: int  = sum(1 for r in results if r["status"] == "failed")
+    logger.info(f"批量生成结束, 共 {len(results)} 个班级, 成功 {okCount}, 跳过 {skippedCount}, 失败 {failedCount}, "
+                f"总耗时 {elapsed:.2f} s")
+
+    if args.report != "":
+        report: dict[str, Any] = {
+            "time": datetime.datetime.now().isoformat(timespec="seconds"),
+            "elapsed": round(elapsed * 1000, 3),
+            "ok": okCount,
+            "skipped": skippedCount,
+            "failed": failedCount,
+            "results": results
+        }
+        with open(args.report, "wb") as reportFile:
+            reportFile.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        logger.success(f"批量生成报告已写入 '{args.report}'")
+
+    return 1 if failedCount > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
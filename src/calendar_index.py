@@ -0,0 +1,336 @@
+# file: calendar_index.py
+# brief: 学期日历索引模块, 预先计算每天的星期/轮换周数/时间表
+# time: 2026.10.17
+# TODOs:
+#   暂无
+
+from   array    import array
+from   clock    import Clock, SYSTEM_CLOCK
+from   holidays import HolidayCalendar
+from   rotation import ANCHOR_DATE, RotationRule, RotationTable, presetRules
+from   typing   import Iterator, Optional
+from   loguru   import logger
+import datetime, math
+
+TERM_DAYS: int = 366                                                    # 默认索引覆盖的天数
+
+# 时间表的键名, 与JsonManager.assignedUUID中的键一致, 下标即为索引中存放的值
+LAYOUT_KEYS: list[str] = ["平日-单", "平日-双", "周六-单", "周六-双", ""]
+NO_LAYOUT: int = 4                                                      # 周日无课, 没有对应的时间表
+NO_CLASS: int = -1                                                      # DayInfo.scheduleWeekday的值, 表示当天不上课
+
+
+def layoutIndex(weekday: int, weekCount1: int) -> int:
+    """
+    根据周几和单双周数获取时间表在LAYOUT_KEYS中的下标
+
+    Args:
+        weekday (int): 周几(0-6, 0=周一)
+        weekCount1 (int): 修正后的单双周数(0=单周, 1=双周)
+
+    Returns:
+        int: LAYOUT_KEYS的下标
+    """
+
+    if weekday == 6:
+        return NO_LAYOUT
+    elif weekday == 5:
+        return 2 + weekCount1                                           # 周六-单/周六-双
+    else:
+        return weekCount1                                               # 平日-单/平日-双
+
+
+def weekStart(date: datetime.date) -> datetime.date:
+    """
+    获取date所在周的周一
+    """
+
+    return date - datetime.timedelta(days=date.weekday())
+
+def nextDayStart(now: datetime.datetime) -> datetime.datetime:
+    """
+    获取now之后的下一个零点
+
+    Args:
+        now (datetime.datetime): 当前时间
+
+    Returns:
+        datetime.datetime: 下一个零点
+    """
+
+    return datetime.datetime.combine(now.date() + datetime.timedelta(days=1), datetime.time.min)
+
+def nextWeekStart(now: datetime.datetime) -> datetime.datetime:
+    """
+    获取now之后的下一个周一零点(周数在每周一切换)
+
+    Args:
+        now (datetime.datetime): 当前时间
+
+    Returns:
+        datetime.datetime: 下一个周一零点
+    """
+
+    return datetime.datetime.combine(now.date() + datetime.timedelta(days=7 - now.weekday()), datetime.time.min)
+
+
+class DayInfo:
+    """
+    某一天的日历信息
+    """
+
+    date: datetime.date
+    weekday: int                                                        # 实际是周几(0-6, 0=周一)
+    scheduleWeekday: int                                                # 执行周几的课表(调休时与weekday不同), 不上课时为NO_CLASS
+    noClass: bool                                                       # 不上课(周日或节假日)
+    holiday: str                                                        # 节假日/调休的名称, 没有时为""
+    weekCount1: int                                                     # 修正后的单双周数(0=单周, 1=双周), 已按调休修正
+    weekCount2: int                                                     # 修正后的三周周数(0 ~ 周期-1), 已按调休修正
+    layoutKey: str                                                      # 当天使用的时间表键名, 不上课时为""
+
+    def __init__(self, date: datetime.date, weekday: int, weekCount1: int, weekCount2: int, layoutKey: str,
+                 scheduleWeekday: Optional[int] = None, holiday: str = "") -> None:
+        self.date = date
+        self.weekday = weekday
+        self.scheduleWeekday = scheduleWeekday if scheduleWeekday is not None else (weekday if weekday != 6 else NO_CLASS)
+        self.noClass = self.scheduleWeekday == NO_CLASS
+        self.holiday = holiday
+        self.weekCount1 = weekCount1
+        self.weekCount2 = weekCount2
+        self.layoutKey = layoutKey
+
+
+class CalendarIndex:
+    """
+    学期日历索引, 每学期(偏移量修改时)构建一次, 之后按日期查询均为O(1)
+
+    所有"今天是单周还是双周/三周轮换的第几周/用哪个时间表"的计算都应通过本类完成,
+    周数由rotation模块的规则计算, 单双周和三周轮换即为其中的两条规则(presetRules),
+    节假日/调休由holidays模块的日历修正, "今天上不上课/上哪天的课"也应通过本类查询, 不要直接判断周日
+    """
+
+    startDate: datetime.date                                            # 索引的第一天
+    days: int                                                           # 索引覆盖的天数
+    weekOffset1: int = 0                                                # 单双周偏移量
+    weekOffset2: int = 0                                                # 3周课表轮换偏移
+    customRules: list[RotationRule]                                     # 规则文件中的规则, 决定三周轮换的周期
+    holidays: HolidayCalendar                                           # 节假日/调休日历
+
+    weekPeriod1: int                                                    # 单双周的周期(2)
+    weekPeriod2: int                                                    # 三周轮换的周期(默认为3, 可在规则文件中修改)
+    cycleWeeks: int                                                     # 单双周与三周轮换的完整周期(周)
+
+    rotation: RotationTable                                             # 单双周/三周轮换规则的索引表
+
+    # 以下数组下标为 (日期 - startDate).days, 均已按节假日/调休修正
+    _weekday:    array
+    _schedule:   array                                                  # 执行周几的课表, 不上课时为NO_CLASS
+    _weekCount1: array
+    _weekCount2: array
+    _layout:     array                                                  # 存放LAYOUT_KEYS的下标
+
+    def __init__(self, startDate: Optional[datetime.date] = None, days: int = TERM_DAYS,
+                 weekOffset1: int = 0, weekOffset2: int = 0, customRules: Optional[list[RotationRule]] = None,
+                 holidays: Optional[HolidayCalendar] = None, clock: Clock = SYSTEM_CLOCK) -> None:
+        """
+        初始化并构建索引
+
+        Args:
+            startDate (datetime.date, optional): 索引起始日期, 为None时取clock所在的本周一. Defaults to None.
+            days (int, optional): 索引覆盖的天数. Defaults to TERM_DAYS.
+            weekOffset1 (int, optional): 单双周偏移量. Defaults to 0.
+            weekOffset2 (int, optional): 3周课表轮换偏移. Defaults to 0.
+            customRules (list[RotationRule], optional): 规则文件中的规则, 见rotation.loadRules. Defaults to None.
+            holidays (HolidayCalendar, optional): 节假日/调休日历, 见holidays.loadHolidays. Defaults to None.
+            clock (Clock, optional): 时钟, 未给出startDate时用于确定本周一. Defaults to SYSTEM_CLOCK.
+        """
+
+        if startDate is None:
+            startDate = weekStart(clock.today())
+        self.startDate = startDate
+        self.days = max(days, 0)
+        self.customRules = list(customRules) if customRules is not None else []
+        self.weekPeriod1, self.weekPeriod2 = (rule.period for rule in presetRules(customRules=self.customRules))
+        self.cycleWeeks = math.lcm(self.weekPeriod1, self.weekPeriod2)
+        self.weekOffset1 = weekOffset1 % self.weekPeriod1
+        self.weekOffset2 = weekOffset2 % self.weekPeriod2
+        self.holidays = holidays if holidays is not None else HolidayCalendar()
+
+        # 规则文件修改周期后, 超出周期的调休周数在课表中没有对应的行
+        outOfRange: list[str] = [o.name for o in self.holidays.overrides if o.weekCount2 is not None and o.weekCount2 >= self.weekPeriod2]
+        if len(outOfRange) > 0:
+            logger.warning(f"调休 {outOfRange} 的weekCount2超出三周轮换的周期({self.weekPeriod2} 周), 已跳过")
+            self.holidays = HolidayCalendar([o for o in self.holidays.overrides if o.name not in outOfRange])
+
+        self.build()
+
+    def build(self) -> None:
+        """
+        构建索引
+        """
+
+        self.rotation = RotationTable(presetRules(self.weekOffset1, self.weekOffset2, self.customRules),
+                                      self.startDate, self.days)
+
+        self._weekday    = array("b")
+        self._schedule   = array("b")
+        self._weekCount1 = array("b")
+        self._weekCount2 = array("b")
+        self._layout     = array("b")
+
+        for i in range(self.days):
+            weekday, schedule, weekCount1, weekCount2, layout = self._resolve(
+                self.startDate + datetime.timedelta(days=i), self.rotation.combos[self.rotation.table[i]]
+            )
+            self._weekday.append(weekday)
+            self._schedule.append(schedule)
+            self._weekCount1.append(weekCount1)
+            self._weekCount2.append(weekCount2)
+            self._layout.append(layout)
+
+        logger.debug(f"日历索引构建完成, 起始日期: {self.startDate}, 天数: {self.days}, "
+                     f"偏移量: ({self.weekOffset1}, {self.weekOffset2}), 三周轮换周期: {self.weekPeriod2} 周, "
+                     f"节假日/调休: {len(self.holidays)} 项")
+
+    def _resolve(self, date: datetime.date, values: tuple[int, ...]) -> tuple[int, int, int, int, int]:
+        """
+        按轮换规则的值和节假日日历计算某一天的信息(构建索引和查询索引范围外的日期时使用)
+
+        Args:
+            date (datetime.date): 日期
+            values (tuple[int, ...]): 当天所有轮换规则的值, 见RotationTable.lookup
+
+        Returns:
+            tuple[int, int, int, int, int]: 周几, 执行周几的课表, 单双周数, 三周周数, 时间表下标
+        """
+
+        weekday: int = date.weekday()
+        schedule: int = weekday if weekday != 6 else NO_CLASS
+        weekCount1, weekCount2 = values[0], values[1]
+
+        override = self.holidays.resolve(date)
+        if override is not None:
+            if override.noClass:
+                schedule = NO_CLASS
+            elif override.weekday is not None:
+                schedule = override.weekday
+            if override.weekCount1 is not None:
+                weekCount1 = override.weekCount1
+            if override.weekCount2 is not None:
+                weekCount2 = override.weekCount2
+
+        layout: int = NO_LAYOUT if schedule == NO_CLASS else layoutIndex(schedule, weekCount1)
+        return (weekday, schedule, weekCount1, weekCount2, layout)
+
+    def setWeekOffset(self, weekOffset1: int, weekOffset2: int) -> None:
+        """
+        修改偏移量并重新构建索引
+
+        Args:
+            weekOffset1 (int): 单双周偏移量
+            weekOffset2 (int): 3周课表轮换偏移
+        """
+
+        if weekOffset1 % self.weekPeriod1 == self.weekOffset1 and weekOffset2 % self.weekPeriod2 == self.weekOffset2:
+            return
+
+        self.weekOffset1 = weekOffset1 % self.weekPeriod1
+        self.weekOffset2 = weekOffset2 % self.weekPeriod2
+        self.build()
+
+    def cycleWeekCounts(self, cycleWeek: int) -> tuple[int, int]:
+        """
+        获取完整轮换周期中第cycleWeek周(从基准日期所在周起算)修正后的周数
+
+        Args:
+            cycleWeek (int): 周期内的第几周(0 ~ cycleWeeks-1)
+
+        Returns:
+            tuple[int, int]: 单双周数, 三周周数
+        """
+
+        weekCount1, weekCount2 = self.rotation.rules[0], self.rotation.rules[1]
+        return ((cycleWeek + weekCount1.offset) % weekCount1.period, (cycleWeek + weekCount2.offset) % weekCount2.period)
+
+    def cycleWeek(self, date: datetime.date) -> int:
+        """
+        获取某一天在完整轮换周期中是第几周(从0开始)
+        """
+
+        return ((date - ANCHOR_DATE).days // 7) % self.cycleWeeks
+
+    def _index(self, date: datetime.date) -> int:
+        """
+        获取日期在索引中的下标, 不在索引范围内时返回-1
+        """
+
+        i: int = (date - self.startDate).days
+        return i if 0 <= i < self.days else -1
+
+    def _get(self, date: datetime.date) -> tuple[int, int, int, int, int]:
+        """
+        Returns:
+            tuple[int, int, int, int, int]: 周几, 执行周几的课表, 单双周数, 三周周数, 时间表下标
+        """
+
+        i: int = self._index(date)
+        if i == -1:                                                     # 索引范围外的日期直接计算
+            return self._resolve(date, self.rotation.resolve(date))
+        return (self._weekday[i], self._schedule[i], self._weekCount1[i], self._weekCount2[i], self._layout[i])
+
+    def lookup(self, date: datetime.date) -> DayInfo:
+        """
+        查询某一天的日历信息
+
+        Args:
+            date (datetime.date): 日期
+
+        Returns:
+            DayInfo: 日历信息
+        """
+
+        weekday, schedule, weekCount1, weekCount2, layout = self._get(date)
+        override = self.holidays.resolve(date)
+        return DayInfo(date, weekday, weekCount1, weekCount2, LAYOUT_KEYS[layout], schedule,
+                       override.name if override is not None else "")
+
+    def weekday(self, date: datetime.date) -> int:
+        return self._get(date)[0]
+
+    def scheduleWeekday(self, date: datetime.date) -> int:
+        return self._get(date)[1]
+
+    def noClass(self, date: datetime.date) -> bool:
+        return self._get(date)[1] == NO_CLASS
+
+    def weekCount1(self, date: datetime.date) -> int:
+        return self._get(date)[2]
+
+    def weekCount2(self, date: datetime.date) -> int:
+        return self._get(date)[3]
+
+    def timeLayoutKey(self, date: datetime.date) -> str:
+        return LAYOUT_KEYS[self._get(date)[4]]
+
+    def iterDays(self, start: Optional[datetime.date] = None, end: Optional[datetime.date] = None) -> Iterator[DayInfo]:
+        """
+        按顺序遍历一段日期(含首尾)的日历信息, 默认遍历整个索引
+
+        Args:
+            start (datetime.date, optional): 起始日期. Defaults to None.
+            end (datetime.date, optional): 终止日期. Defaults to None.
+
+        Yields:
+            DayInfo: 每一天的日历信息
+        """
+
+        if start is None:
+            start = self.startDate
+        if end is None:
+            end = self.startDate + datetime.timedelta(days=self.days - 1)
+
+        date: datetime.date = start
+        oneDay = datetime.timedelta(days=1)
+        while date <= end:
+            yield self.lookup(date)
+            date += oneDay
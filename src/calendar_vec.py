@@ -0,0 +1,175 @@
+# file: calendar_vec.py
+# brief: 基于numpy的批量日期轮换计算, 一次计算一整段日期在各种偏移量下的周数和课表行
+# time: 2026.10.17
+# TODOs:
+#   暂无
+#
+# numpy为可选依赖(见requirements-bench.txt, 主程序不需要), 只在调用本模块的函数时才导入, 未安装时函数返回None
+# 给出同一个节假日日历时, 结果与CalendarIndex逐日查询的结果一致, 用于学期规划等需要一次回答大量日期的场景, 例如:
+#   "接下来200个上课日在每一种三周偏移量下分别是第几周"(三周轮换的周期period2默认为3, 见rotation.weekPeriod2)
+#       dates = schoolDays(today, 200)
+#       result = resolveDates(dates, weekOffset2=[[o] for o in range(period2)], customRules=rules)
+#                                                                       <- result.weekCount2的形状为(period2, 200)
+
+from   calendar_index import NO_CLASS
+from   holidays       import HolidayCalendar
+from   rotation       import ANCHOR_DATE, RotationRule, presetRules
+from   typing         import Any, NamedTuple, Optional
+from   loguru         import logger
+import datetime
+
+EPOCH: datetime.date = datetime.date(1970, 1, 1)                        # numpy datetime64[D]的起点, 周四
+EPOCH_WEEKDAY: int = EPOCH.weekday()
+ANCHOR_DAYS: int = (ANCHOR_DATE - EPOCH).days
+EPOCH_ORDINAL: int = EPOCH.toordinal()
+
+# ClassTable中当天白天课程所在的表
+TABLE_NONE: int     = 0                                                 # 周日或节假日, 没有课
+TABLE_WEEKDAY: int  = 1                                                 # classTable1[周几]
+TABLE_SATURDAY: int = 2                                                 # classTable2[三周周数]
+
+_numpy: Any = None
+
+
+def requireNumpy() -> Any:
+    """
+    按需导入numpy
+
+    Returns:
+        Any: numpy模块, 未安装时为None
+    """
+
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            logger.error("批量日期计算需要numpy, 请先运行 pip install -r requirements-bench.txt")
+            return None
+        _numpy = numpy
+    return _numpy
+
+
+class DateResolution(NamedTuple):
+    """
+    批量计算的结果, 所有数组的形状为日期数组与偏移量广播后的形状
+    """
+
+    weekday: Any                                                        # 实际的周几(0-6, 0=周一)
+    scheduleWeekday: Any                                                # 执行周几的课表, 不上课时为NO_CLASS
+    weekCount1: Any                                                     # 修正后的单双周数(0=单周, 1=双周)
+    weekCount2: Any                                                     # 修正后的三周周数(0 ~ 周期-1)
+    table: Any                                                          # 白天课程所在的表, 见TABLE_*
+    row: Any                                                            # 白天课程在该表中的行(classTable1为周几, classTable2为三周周数), 不上课时为-1
+    eveningRow: Any                                                     # 晚课在classTable3中的行(三周周数, 列为周几), 周六和不上课时为-1
+
+
+def toDays(dates: Any) -> Any:
+    """
+    把日期数组(datetime.date序列或datetime64数组)转为距EPOCH的天数
+
+    Args:
+        dates (Any): 日期数组
+
+    Returns:
+        Any: int64数组, 未安装numpy时为None
+    """
+
+    np = requireNumpy()
+    if np is None:
+        return None
+    return np.asarray(dates, dtype="datetime64[D]").astype(np.int64)
+
+def dateRange(start: datetime.date, days: int) -> Any:
+    """
+    从start起连续days天的datetime64数组
+    """
+
+    np = requireNumpy()
+    if np is None:
+        return None
+    return np.arange(np.datetime64(start, "D"), np.datetime64(start, "D") + max(days, 0))
+
+def schoolDays(start: datetime.date, count: int) -> Any:
+    """
+    从start起(含)的count个上课日(周一至周六)的datetime64数组
+    """
+
+    np = requireNumpy()
+    if np is None:
+        return None
+    candidates = dateRange(start, count // 6 * 7 + 7)                   # 每7天有6个上课日, 多取一周保证足够
+    weekday = (candidates.astype(np.int64) + EPOCH_WEEKDAY) % 7
+    return candidates[weekday != 6][: max(count, 0)]
+
+def resolveDates(dates: Any, weekOffset1: Any = 0, weekOffset2: Any = 0, holidays: Optional[HolidayCalendar] = None,
+                 customRules: Optional[list[RotationRule]] = None) -> Optional[DateResolution]:
+    """
+    批量计算每个日期的周几/周数/课表行, 与使用同样的节假日日历和轮换规则的CalendarIndex.lookup逐日计算的结果相同
+
+    偏移量可以是整数, 也可以是能与日期数组广播的数组, 例如weekOffset2=[[0], [1], [2]]会得到每种偏移量下的结果
+
+    Args:
+        dates (Any): 日期数组(datetime.date序列或datetime64数组)
+        weekOffset1 (Any, optional): 单双周偏移量. Defaults to 0.
+        weekOffset2 (Any, optional): 3周课表轮换偏移. Defaults to 0.
+        holidays (HolidayCalendar, optional): 节假日/调休日历, 为None时不考虑节假日. Defaults to None.
+        customRules (list[RotationRule], optional): 规则文件中的规则(决定三周轮换的周期), 见rotation.loadRules. Defaults to None.
+
+    Returns:
+        Optional[DateResolution]: 计算结果, 未安装numpy时为None
+    """
+
+    np = requireNumpy()
+    if np is None:
+        return None
+
+    days = toDays(dates)
+    offset1 = np.asarray(weekOffset1, dtype=np.int64)
+    offset2 = np.asarray(weekOffset2, dtype=np.int64)
+    days, offset1, offset2 = np.broadcast_arrays(days, offset1, offset2)
+
+    weekday = ((days + EPOCH_WEEKDAY) % 7).astype(np.int8)
+    period1, period2 = (rule.period for rule in presetRules(customRules=customRules))
+    weekdiff = np.floor_divide(days - ANCHOR_DAYS, 7)                   # 向下取整, 基准之前的日期同样适用
+    weekCount1 = ((weekdiff + offset1) % period1).astype(np.int8)
+    weekCount2 = ((weekdiff + offset2) % period2).astype(np.int8)
+    schedule = np.where(weekday == 6, NO_CLASS, weekday).astype(np.int8)
+
+    if holidays is not None and len(holidays) > 0:
+        schedule, weekCount1, weekCount2 = applyHolidays(np, days, schedule, weekCount1, weekCount2, holidays)
+
+    noClass = schedule == NO_CLASS
+    saturday = schedule == 5
+    table = np.where(noClass, TABLE_NONE, np.where(saturday, TABLE_SATURDAY, TABLE_WEEKDAY)).astype(np.int8)
+    row = np.where(noClass, -1, np.where(saturday, weekCount2, schedule)).astype(np.int8)
+    eveningRow = np.where(noClass | saturday, -1, weekCount2).astype(np.int8)
+
+    return DateResolution(weekday, schedule, weekCount1, weekCount2, table, row, eveningRow)
+
+def applyHolidays(np: Any, days: Any, schedule: Any, weekCount1: Any, weekCount2: Any,
+                  holidays: HolidayCalendar) -> tuple[Any, Any, Any]:
+    """
+    按节假日日历修正执行的课表和周数, 与HolidayCalendar.resolve相同, 用二分查找确定每天所在的区间
+
+    Returns:
+        tuple[Any, Any, Any]: 修正后的执行周几的课表, 单双周数, 三周周数
+    """
+
+    starts = np.asarray(holidays.starts, dtype=np.int64) - EPOCH_ORDINAL
+    ends = np.asarray(holidays.ends, dtype=np.int64) - EPOCH_ORDINAL
+    # 每个区间的修正值, 未指定的项为-2(不会与NO_CLASS混淆)
+    noClass = np.array([o.noClass for o in holidays.overrides], dtype=bool)
+    overrideWeekday = np.array([-2 if o.weekday is None else o.weekday for o in holidays.overrides], dtype=np.int8)
+    overrideWeekCount1 = np.array([-2 if o.weekCount1 is None else o.weekCount1 for o in holidays.overrides], dtype=np.int8)
+    overrideWeekCount2 = np.array([-2 if o.weekCount2 is None else o.weekCount2 for o in holidays.overrides], dtype=np.int8)
+
+    i = np.searchsorted(starts, days, side="right") - 1
+    safe = np.clip(i, 0, len(starts) - 1)
+    hit = (i >= 0) & (days <= ends[safe])
+
+    schedule = np.where(hit & noClass[safe], NO_CLASS,
+                        np.where(hit & (overrideWeekday[safe] != -2), overrideWeekday[safe], schedule)).astype(np.int8)
+    weekCount1 = np.where(hit & (overrideWeekCount1[safe] != -2), overrideWeekCount1[safe], weekCount1).astype(np.int8)
+    weekCount2 = np.where(hit & (overrideWeekCount2[safe] != -2), overrideWeekCount2[safe], weekCount2).astype(np.int8)
+    return (schedule, weekCount1, weekCount2)
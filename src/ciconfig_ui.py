@@ -10,7 +10,7 @@
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
-from mypath import resPath
+import resources
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -21,14 +21,14 @@ class Ui_MainWindow(object):
         font.setPointSize(12)
         MainWindow.setFont(font)
         icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap(resPath("res\\used_icons\\icon.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        icon.addPixmap(resources.pixmap("res\\used_icons\\icon.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
         MainWindow.setWindowIcon(icon)
         self.centralwidget = QtWidgets.QWidget(MainWindow)
         self.centralwidget.setObjectName("centralwidget")
         self.b_import_ct = QtWidgets.QPushButton(self.centralwidget)
         self.b_import_ct.setGeometry(QtCore.QRect(710, 20, 121, 51))
         icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap(resPath("res\\used_icons\\导入.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        icon1.addPixmap(resources.pixmap("res\\used_icons\\导入.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
         self.b_import_ct.setIcon(icon1)
         self.b_import_ct.setIconSize(QtCore.QSize(32, 32))
         self.b_import_ct.setAutoDefault(False)
@@ -36,7 +36,7 @@ class Ui_MainWindow(object):
         self.b_export_ct = QtWidgets.QPushButton(self.centralwidget)
         self.b_export_ct.setGeometry(QtCore.QRect(850, 20, 121, 51))
         icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap(resPath("res\\used_icons\\导出.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        icon2.addPixmap(resources.pixmap("res\\used_icons\\导出.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
         self.b_export_ct.setIcon(icon2)
         self.b_export_ct.setIconSize(QtCore.QSize(30, 30))
         self.b_export_ct.setAutoDefault(False)
@@ -51,7 +51,7 @@ class Ui_MainWindow(object):
         self.l_icon_classop = QtWidgets.QLabel(self.centralwidget)
         self.l_icon_classop.setGeometry(QtCore.QRect(540, 30, 41, 41))
         self.l_icon_classop.setText("")
-        self.l_icon_classop.setPixmap(QtGui.QPixmap(resPath("res\\used_icons\\课表.png")))
+        self.l_icon_classop.setPixmap(resources.pixmap("res\\used_icons\\课表.png"))
         self.l_icon_classop.setScaledContents(True)
         self.l_icon_classop.setObjectName("l_icon_classop")
         self.b_import_tt = QtWidgets.QPushButton(self.centralwidget)
@@ -76,7 +76,7 @@ class Ui_MainWindow(object):
         self.l_icon_timeop = QtWidgets.QLabel(self.centralwidget)
         self.l_icon_timeop.setGeometry(QtCore.QRect(536, 83, 48, 48))
         self.l_icon_timeop.setText("")
-        self.l_icon_timeop.setPixmap(QtGui.QPixmap(resPath("res\\used_icons\\时间表.png")))
+        self.l_icon_timeop.setPixmap(resources.pixmap("res\\used_icons\\时间表.png"))
         self.l_icon_timeop.setScaledContents(True)
         self.l_icon_timeop.setObjectName("l_icon_timeop")
         self.b_generate_json = QtWidgets.QPushButton(self.centralwidget)
@@ -88,14 +88,14 @@ class Ui_MainWindow(object):
         self.b_settings = QtWidgets.QPushButton(self.centralwidget)
         self.b_settings.setGeometry(QtCore.QRect(840, 480, 141, 51))
         icon3 = QtGui.QIcon()
-        icon3.addPixmap(QtGui.QPixmap(resPath("res\\used_icons\\设置.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        icon3.addPixmap(resources.pixmap("res\\used_icons\\设置.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
         self.b_settings.setIcon(icon3)
         self.b_settings.setIconSize(QtCore.QSize(33, 33))
         self.b_settings.setObjectName("b_settings")
         self.b_exit = QtWidgets.QPushButton(self.centralwidget)
         self.b_exit.setGeometry(QtCore.QRect(840, 550, 141, 51))
         icon4 = QtGui.QIcon()
-        icon4.addPixmap(QtGui.QPixmap(resPath("res\\used_icons\\退出.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        icon4.addPixmap(resources.pixmap("res\\used_icons\\退出.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
         self.b_exit.setIcon(icon4)
         self.b_exit.setIconSize(QtCore.QSize(30, 30))
         self.b_exit.setObjectName("b_exit")
@@ -110,7 +110,7 @@ class Ui_MainWindow(object):
         self.l_icon_ctinfo = QtWidgets.QLabel(self.centralwidget)
         self.l_icon_ctinfo.setGeometry(QtCore.QRect(150, 10, 47, 47))
         self.l_icon_ctinfo.setText("")
-        self.l_icon_ctinfo.setPixmap(QtGui.QPixmap(resPath("res\\used_icons\\information.png")))
+        self.l_icon_ctinfo.setPixmap(resources.pixmap("res\\used_icons\\information.png"))
         self.l_icon_ctinfo.setScaledContents(True)
         self.l_icon_ctinfo.setObjectName("l_icon_ctinfo")
         self.cb_ctinfo = QtWidgets.QComboBox(self.centralwidget)
@@ -125,7 +125,7 @@ class Ui_MainWindow(object):
         self.l_icon_config = QtWidgets.QLabel(self.centralwidget)
         self.l_icon_config.setGeometry(QtCore.QRect(556, 235, 41, 41))
         self.l_icon_config.setText("")
-        self.l_icon_config.setPixmap(QtGui.QPixmap(resPath("res\\used_icons\\配置.png")))
+        self.l_icon_config.setPixmap(resources.pixmap("res\\used_icons\\配置.png"))
         self.l_icon_config.setScaledContents(True)
         self.l_icon_config.setObjectName("l_icon_config")
         self.l_config = QtWidgets.QLabel(self.centralwidget)
@@ -173,13 +173,13 @@ class Ui_MainWindow(object):
         self.l_icon_offset1 = QtWidgets.QLabel(self.centralwidget)
         self.l_icon_offset1.setGeometry(QtCore.QRect(553, 289, 32, 32))
         self.l_icon_offset1.setText("")
-        self.l_icon_offset1.setPixmap(QtGui.QPixmap(resPath("res\\used_icons\\偏移.png")))
+        self.l_icon_offset1.setPixmap(resources.pixmap("res\\used_icons\\偏移.png"))
         self.l_icon_offset1.setScaledContents(True)
         self.l_icon_offset1.setObjectName("l_icon_offset1")
         self.l_icon_offset2 = QtWidgets.QLabel(self.centralwidget)
         self.l_icon_offset2.setGeometry(QtCore.QRect(553, 338, 32, 32))
         self.l_icon_offset2.setText("")
-        self.l_icon_offset2.setPixmap(QtGui.QPixmap(resPath("res\\used_icons\\偏移.png")))
+        self.l_icon_offset2.setPixmap(resources.pixmap("res\\used_icons\\偏移.png"))
         self.l_icon_offset2.setScaledContents(True)
         self.l_icon_offset2.setObjectName("l_icon_offset2")
         self.cb_offset1 = QtWidgets.QComboBox(self.centralwidget)
@@ -211,7 +211,7 @@ class Ui_MainWindow(object):
         self.l_icon_doc = QtWidgets.QLabel(self.centralwidget)
         self.l_icon_doc.setGeometry(QtCore.QRect(554, 390, 30, 30))
         self.l_icon_doc.setText("")
-        self.l_icon_doc.setPixmap(QtGui.QPixmap(resPath("res\\used_icons\\档案.png")))
+        self.l_icon_doc.setPixmap(resources.pixmap("res\\used_icons\\档案.png"))
         self.l_icon_doc.setScaledContents(True)
         self.l_icon_doc.setObjectName("l_icon_doc")
         self.label = QtWidgets.QLabel(self.centralwidget)
@@ -2,17 +2,64 @@
 # brief: 课表及时间表管理模块
 # time: 2025.8.19
 # TODOs:
-#   1. parseClassTable, writeClassTable, parseTimetable, writeTimeTable的xlsx模式支持
+#   1. writeClassTable, writeTimeTable的xlsx模式支持
 #   2. TimeTable缺少writeTimeTable
 #   3. TimeTable加入特殊标识符区分间操, 午饭, 晚自习等
 
-import pickle   # TODO: 写保存模块, 避免使用pickle
-import time, datetime, math, os, orjson, json
+import store, validator, xlsx_reader
+import os, orjson, json
+from   array  import array
+from   collections.abc import MutableSequence
 from   enum   import IntEnum
-from   typing import Literal
-from   mytime import MyTime
+from   typing import Iterable, Iterator, Literal, Optional, TYPE_CHECKING
 from   loguru import logger
 
+if TYPE_CHECKING:                                                       # 只用于类型标注, 运行时不导入Qt
+    from mytime import MyTime
+
+# 课程名称/老师姓名的驻留表, SingleClass中只存放名称的编号
+# 编号0固定为空字符串, 同一进程内所有课表共用
+NAME_TABLE: list[str] = [""]                                            # 编号 -> 名称
+NAME_IDS: dict[str, int] = {"": 0}                                      # 名称 -> 编号
+
+def internName(name: str) -> int:
+    """
+    获取名称的编号, 第一次出现时分配新编号
+
+    Args:
+        name (str): 课程名称或老师姓名
+
+    Returns:
+        int: 编号
+    """
+
+    nameID: Optional[int] = NAME_IDS.get(name)
+    if nameID is None:
+        nameID = len(NAME_TABLE)
+        NAME_TABLE.append(name)
+        NAME_IDS[name] = nameID
+    return nameID
+
+
+def splitTeacherName(text: str) -> tuple[str, str]:
+    """
+    拆分课表文件中"课程名(老师姓名)"格式的课程, 括号可以是全角或半角
+
+    Args:
+        text (str): 课程文本, 如"数学(张三)"或"数学"
+
+    Returns:
+        tuple[str, str]: 课程名称, 老师姓名(没有时为"")
+    """
+
+    text = text.strip()
+    if len(text) > 0 and text[-1] in ")）":
+        p: int = max(text.rfind("("), text.rfind("（"))
+        if p > 0:
+            return (text[:p].strip(), text[p + 1 : -1].strip())
+    return (text, "")
+
+
 class SingleClass:
     """
     单节课课表类
@@ -24,11 +71,17 @@ class SingleClass:
         evenBreak      = 2              # 晚饭休息
         exercise       = 3              # 间操
 
-    name: str
-    nameInitial: str
-    teacherName: str
-    isOutdoor: bool = False
-    specID: int = 0                                                     # 特殊标识符
+    # 课表中会有大量的SingleClass, 使用__slots__并只保存名称编号以节省内存
+    __slots__ = ("nameID", "teacherID", "isOutdoor", "specID")
+
+    nameID: int                                                         # 课程名称的编号, 见NAME_TABLE
+    teacherID: int                                                      # 任课老师姓名的编号
+    isOutdoor: bool
+    specID: int                                                         # 特殊标识符
+
+    # 打包为整数时各字段的位置(见pack)
+    ID_BITS: int = 20
+    ID_MASK: int = (1 << 20) - 1
 
     def __init__(self, name: str, teacherName: str = "", isOutdoor: bool = False) -> None:
         """
@@ -40,30 +93,182 @@ class SingleClass:
             isOutdoor (bool, optional): 是否为户外课程. Defaults to False.
         """
 
-        self.name = name
-
         # 模糊识别
-        if self.name == "英语":
-            self.name = "外语"
-        if self.name == "信息":
-            self.name = "信息技术"
+        if name == "英语":
+            name = "外语"
+        if name == "信息":
+            name = "信息技术"
 
-        if name != "":
-            self.nameInitial = name[0]
-        else:
-            self.nameInitial = ""
-        self.teacherName = teacherName
+        self.nameID = internName(name)
+        self.teacherID = internName(teacherName)
         self.isOutdoor = isOutdoor
+        self.specID = 0
+
+    @property
+    def name(self) -> str:
+        return NAME_TABLE[self.nameID]
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self.nameID = internName(value)
+
+    @property
+    def nameInitial(self) -> str:
+        return NAME_TABLE[self.nameID][:1]
+
+    @property
+    def label(self) -> str:
+        """
+        课表文件中的写法, 有老师时为"课程名(老师姓名)", 见splitTeacherName
+        """
+
+        if self.teacherID == 0:
+            return NAME_TABLE[self.nameID]
+        return f"{NAME_TABLE[self.nameID]}({NAME_TABLE[self.teacherID]})"
+
+    @classmethod
+    def fromLabel(cls, text: str, isOutdoor: bool = False) -> "SingleClass":
+        """
+        从课表文件中的写法创建, 见label
+        """
+
+        name, teacherName = splitTeacherName(text)
+        return cls(name=name, teacherName=teacherName, isOutdoor=isOutdoor)
+
+    @property
+    def teacherName(self) -> str:
+        return NAME_TABLE[self.teacherID]
+
+    @teacherName.setter
+    def teacherName(self, value: str) -> None:
+        self.teacherID = internName(value)
+
+    def pack(self) -> int:
+        """
+        打包为一个整数(DaySchedule中存放的值)
+
+        Returns:
+            int: 低20位为课程名称编号, 之后20位为老师姓名编号, 再之后1位为是否户外, 其余为特殊标识符
+        """
+
+        return (self.nameID | (self.teacherID << self.ID_BITS) | (int(self.isOutdoor) << (2 * self.ID_BITS))
+                | (self.specID << (2 * self.ID_BITS + 1)))
+
+    @classmethod
+    def unpack(cls, code: int) -> "SingleClass":
+        """
+        从pack的结果还原
+        """
+
+        singleClass: SingleClass = cls.__new__(cls)
+        singleClass.nameID    = code & cls.ID_MASK
+        singleClass.teacherID = (code >> cls.ID_BITS) & cls.ID_MASK
+        singleClass.isOutdoor = bool((code >> (2 * cls.ID_BITS)) & 1)
+        singleClass.specID    = code >> (2 * cls.ID_BITS + 1)
+        return singleClass
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SingleClass):
+            return NotImplemented
+        return self.pack() == other.pack()
+
+    def __hash__(self) -> int:
+        return self.pack()
+
+    def __repr__(self) -> str:
+        return f"SingleClass({self.name!r})"
+
+    def __getstate__(self) -> tuple[str, str, bool, int]:
+        # 编号只在当前进程内有效, 序列化(如传给批量生成的子进程)时保存名称
+        return (self.name, self.teacherName, self.isOutdoor, self.specID)
+
+    def __setstate__(self, state: tuple[str, str, bool, int]) -> None:
+        name, teacherName, self.isOutdoor, self.specID = state
+        self.nameID = internName(name)
+        self.teacherID = internName(teacherName)
+
+
+class DaySchedule(MutableSequence):
+    """
+    一天(或一周的晚课)的课表, 用法同list[SingleClass]
+    内部用整数数组存放打包后的SingleClass(见SingleClass.pack), 复制时只需复制数组
+    取出的SingleClass是新建的对象, 修改它不会影响课表, 需要重新赋值回去
+    """
+
+    __slots__ = ("codes", )
+
+    codes: array                                                        # 打包后的SingleClass
+
+    def __init__(self, classes: Iterable[SingleClass] = ()) -> None:
+        if isinstance(classes, DaySchedule):
+            self.codes = array("Q", classes.codes)
+        else:
+            self.codes = array("Q", [singleClass.pack() for singleClass in classes])
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            day: DaySchedule = DaySchedule()
+            day.codes = self.codes[index]
+            return day
+        return SingleClass.unpack(self.codes[index])
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            self.codes[index] = DaySchedule(value).codes
+        else:
+            self.codes[index] = value.pack()
+
+    def __delitem__(self, index) -> None:
+        del self.codes[index]
+
+    def __iter__(self) -> Iterator[SingleClass]:
+        return map(SingleClass.unpack, self.codes)
+
+    def insert(self, index: int, value: SingleClass) -> None:
+        self.codes.insert(index, value.pack())
+
+    def append(self, value: SingleClass) -> None:
+        self.codes.append(value.pack())
+
+    def extend(self, values: Iterable[SingleClass]) -> None:
+        if isinstance(values, DaySchedule):
+            self.codes.extend(values.codes)
+        else:
+            self.codes.extend(value.pack() for value in values)
+
+    def copy(self) -> "DaySchedule":
+        return DaySchedule(self)
+
+    def names(self) -> list[str]:
+        return [NAME_TABLE[code & SingleClass.ID_MASK] for code in self.codes]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DaySchedule):
+            return self.codes == other.codes
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"DaySchedule({self.names()!r})"
+
+    def __reduce__(self):
+        return (DaySchedule, (list(self), ))
 
 
 class TimePeriod:
     """
-    表示一段时间的类, 内部存放开始时间和终止时间, 并描述了时间段类型
+    表示一段时间的类, 内部存放开始时间和终止时间(从0点开始的分钟数), 并描述了时间段类型
     """
-    
-    start:  list[int] = [0, 0]                                  # 开始时间: [时, 分]
-    finish: list[int] = [0, 0]                                  # 终止时间: [时, 分]
-    timeType: int = 0                                           # 时间段类型, 0=上课, 1=课间, 2=分割线
+
+    __slots__ = ("startMinute", "finishMinute", "timeType")
+
+    startMinute: int                                            # 开始时间, 从0点开始的分钟数
+    finishMinute: int                                           # 终止时间, 从0点开始的分钟数
+    timeType: int                                               # 时间段类型, 0=上课, 1=课间, 2=分割线
     
     def __init__(self, start: list[int], finish: list[int], timetype = 0) -> None:
         """
@@ -75,6 +280,10 @@ class TimePeriod:
             timetype (int, optional): 时间段类型, 0=上课, 1=课间, 2=分割线. Defaults to 0.
         """
 
+        self.startMinute = 0
+        self.finishMinute = 0
+        self.timeType = 0
+
         # 检查输入数据
         if len(start) != 2 or len(finish) != 2:
             logger.error("初始化时间段时遇到无法解析的时间格式")
@@ -83,26 +292,87 @@ class TimePeriod:
             logger.error(f"初始化时间段时遇到不支持的时间段类型, 支持的值为0, 1, 2, 但输入值为 {timetype}!")
             return
 
-        self.start  = start
-        self.finish = finish
+        self.startMinute  = start[0] * 60 + start[1]
+        self.finishMinute = finish[0] * 60 + finish[1]
         self.timeType = timetype
 
+    @classmethod
+    def fromMinutes(cls, startMinute: int, finishMinute: int, timeType: int = 0) -> "TimePeriod":
+        """
+        直接用分钟数创建时间段(不做检查, 用于读取已保存的数据)
+        """
+
+        timePeriod: TimePeriod = cls.__new__(cls)
+        timePeriod.startMinute = startMinute
+        timePeriod.finishMinute = finishMinute
+        timePeriod.timeType = timeType
+        return timePeriod
+
+    @property
+    def start(self) -> list[int]:
+        """
+        开始时间: [时, 分]
+        """
+        return [self.startMinute // 60, self.startMinute % 60]
+
+    @start.setter
+    def start(self, value: list[int]) -> None:
+        self.startMinute = value[0] * 60 + value[1]
+
+    @property
+    def finish(self) -> list[int]:
+        """
+        终止时间: [时, 分]
+        """
+        return [self.finishMinute // 60, self.finishMinute % 60]
+
+    @finish.setter
+    def finish(self, value: list[int]) -> None:
+        self.finishMinute = value[0] * 60 + value[1]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TimePeriod):
+            return NotImplemented
+        return (self.startMinute, self.finishMinute, self.timeType) == (other.startMinute, other.finishMinute, other.timeType)
+
+    def __repr__(self) -> str:
+        return f"TimePeriod({self.start}, {self.finish}, {self.timeType})"
+
+    def __getstate__(self) -> tuple[int, int, int]:
+        return (self.startMinute, self.finishMinute, self.timeType)
+
+    def __setstate__(self, state) -> None:
+        if isinstance(state, dict):                                     # 旧版本pickle保存的时间段
+            start: list[int] = state.get("start", [0, 0])
+            finish: list[int] = state.get("finish", [0, 0])
+            self.startMinute = start[0] * 60 + start[1]
+            self.finishMinute = finish[0] * 60 + finish[1]
+            self.timeType = state.get("timeType", 0)
+        else:
+            self.startMinute, self.finishMinute, self.timeType = state
+
 
 class ClassTable:
     """
     课表管理类, 可以从文件读取课表并保存课表
     """
 
-    myTime: MyTime
+    myTime: "MyTime"
 
-    classTable1: list[list[SingleClass]] = []                   # 周一到周五课表, 外层下标=周几, 内层下标=第几节课
-    classTable2: list[list[SingleClass]] = []                   # 周六课表, 外层下标=第几周, 内层下标=第几节课
-    classTable3: list[list[SingleClass]] = [[], [], []]         # 晚课课表, 外层下标=第几周, 内层下标=周几晚课
-    classTableToday: list[SingleClass] = []                     # 今天实际应该执行的课表
+    classTable1: list[DaySchedule]                              # 周一到周五课表, 外层下标=周几, 内层下标=第几节课
+    classTable2: list[DaySchedule]                              # 周六课表, 外层下标=第几周, 内层下标=第几节课
+    classTable3: list[DaySchedule]                              # 晚课课表, 外层下标=第几周, 内层下标=周几晚课
+    classTableToday: DaySchedule                                # 今天实际应该执行的课表
 
-    def __init__(self, myTime: MyTime):
+    def __init__(self, myTime: "MyTime"):
         self.myTime = myTime
 
+        # 每个实例使用自己的列表, 避免批量生成时多个课表共用类属性
+        self.classTable1 = []
+        self.classTable2 = []
+        self.classTable3 = [DaySchedule(), DaySchedule(), DaySchedule()]
+        self.classTableToday = DaySchedule()
+
     def modifyDayClass(self, dayInWeek: int, dailyClass: list[SingleClass], allowAppend: bool = True) -> None:
         """
         修改每日课表
@@ -119,9 +389,9 @@ class ClassTable:
             else:
                 # 长度不够就向后添加空列表
                 for _ in range(0, dayInWeek - len(self.classTable1) + 1):
-                    self.classTable1.append([])
+                    self.classTable1.append(DaySchedule())
         
-        self.classTable1[dayInWeek] = dailyClass
+        self.classTable1[dayInWeek] = DaySchedule(dailyClass)
         return
     
     def modifySingleClass(self, dayInWeek: int, classIndex: int, singleClass: SingleClass, allowAppend: bool = False) -> None:
@@ -165,9 +435,9 @@ class ClassTable:
                 return
             else:
                 for _ in range(0, weekCount - len(self.classTable2) + 1):
-                    self.classTable2.append([])
+                    self.classTable2.append(DaySchedule())
                     
-        self.classTable2[weekCount] = satClass
+        self.classTable2[weekCount] = DaySchedule(satClass)
         return
     
     def modifyEvenClass(self, weekCount: int, weekEvenClass: list[SingleClass], allowAppend: bool = True) -> None:
@@ -185,9 +455,9 @@ class ClassTable:
                 return
             else:
                 for _ in range(0, weekCount - len(self.classTable3) + 1):
-                    self.classTable3.append([])
+                    self.classTable3.append(DaySchedule())
                     
-        self.classTable3[weekCount] = weekEvenClass
+        self.classTable3[weekCount] = DaySchedule(weekEvenClass)
         return
                 
     def modifyEvenDayClass(self, weekCount: int, dayInWeek: int, dayEvenClass: SingleClass, allowAppend: bool = False) -> None:
@@ -216,98 +486,119 @@ class ClassTable:
         self.classTable3[weekCount][dayInWeek] = dayEvenClass
         return
     
-    def parseClassTable(self, filePath: str = "./classes.txt", mode: str = "txt") -> None:
+    def parseClassTable(self, filePath: str = "./classes.txt", mode: str = "txt", timeTable: Optional["TimeTable"] = None) -> bool:
         """
         读取和解析课表
 
         Args:
             filePath (str, optional): 课表文件地址. Defaults to "./classes.txt".
             mode (str, optional): 从什么文件读取, 支持txt和xlsx两种模式. Defaults to "txt".
+            timeTable (TimeTable, optional): 已导入的时间表, 给出时导入后校验每天的课程数. Defaults to None.
+
+        Returns:
+            bool: 是否完整读取且没有格式错误的行(文件不存在, 损坏或读到一半时为False)
         """
 
         logger.info(f"开始从路径 '{filePath}' 导入/解析课表")
 
         if not os.path.exists(filePath):
             logger.error(f"导入/解析课表时路径 '{filePath}' 不存在")
-            return
+            return False
 
+        readErrors: list[str] = []                                      # 文件损坏等读取错误
+        lineErrors: list[tuple[int, str]] = []                          # 格式错误的行
         # txt模式
         if mode.lower() == "txt" or mode.lower() == ".txt":
-            with open(filePath, "r", encoding="utf-8") as ctf:          # ctf: ClassTableFile, 存放课表信息的文件, 只读模式
-                lines: list[str] = ctf.readlines()
-                count: int     = 0                                      # 行号计数
-                normCount: int = 0                                      # 平日课表计数
-                satCount:  int = 0                                      # 周六课表计数
-                evenCount: int = 0                                      # 晚课课表计数
-
-                # 遍历每行内容
-                for line in lines:
-                    p1 = line.find(":")                                 # 找第一个":"的位置
-                    prefix = line[0 : p1]                               # 前导字符串("周五", "晚课1"等)
-
-                    if prefix == "":
-                        logger.warning(f"导入/解析课表时课表时遇到了空行, Line Number: {count + 1}")
-                        continue
-
-                    # 平日课表
-                    if "周六" not in prefix and "晚课" not in prefix:
-                        dailyClass: list[SingleClass] = []              # 每天课表(一行就是一天的课)
-
-                        tmp: str = line[p1 + 1 : len(line) - 1]         # 截掉开头无用字符和末尾换行符
-                        classes: list[str] = tmp.split(",")             # 按逗号划分
-                        # 遍历一行中的每一节课
-                        for _class in classes:
-                            _class.strip()                              # 去除前导空格
-                            singleClass: SingleClass = SingleClass(name=_class, isOutdoor=(True if _class == "体育" else False))
-                            dailyClass.append(singleClass)              # 添加到日课表
-                        self.modifyDayClass(dayInWeek=normCount, dailyClass=dailyClass)         # 写入每日课表
-                        normCount += 1
-                        
-                    # 周六课表
-                    elif "周六" in prefix and "晚课" not in prefix: 
-                        satClass: list[SingleClass] = []                # 周六课表
-                        
-                        tmp: str = line[p1 + 1 : len(line) - 1]         # 截掉开头无用字符
-                        classes: list[str] = tmp.split(",")             # 按逗号划分
-                        # 遍历一行中的每一节课
-                        for _class in classes:
-                            _class.strip()                              # 去除前导空格
-                            singleClass: SingleClass = SingleClass(name=_class, isOutdoor=False)
-                            satClass.append(singleClass)                # 添加到周六课表
-                        self.modifySatDayClass(weekCount=(satCount), satClass=satClass)    # 写入周六课表
-                        satCount += 1
-                        
-                    # 11-13行, 读晚课课表
-                    elif "周六" not in prefix and "晚课" in prefix:
-                        weekEvenClass: list[SingleClass] = []           # 晚课课表(一行是一周的晚课)
-                        
-                        tmp: str = line[p1 + 1 : len(line) - 1]         # 截掉开头无用字符
-                        classes: list[str] = tmp.split(",")             # 按逗号划分
-                        # 遍历一行中的每一节课
-                        for _class in classes:
-                            _class.strip()                              # 去除前导空格
-                            singleClass: SingleClass = SingleClass(name=_class, isOutdoor=False)
-                            weekEvenClass.append(singleClass)           # 添加到一周的晚课课表
-                        self.modifyEvenClass(weekCount=evenCount, weekEvenClass=weekEvenClass)   # 写入晚课课表
-                        evenCount += 1
-
-                    else:
-                        logger.warning(f"解析课表时解析到格式不正确的行! Line Number: {count + 1}")
-                    
-                    count += 1
+            try:
+                with open(filePath, "r", encoding="utf-8") as ctf:      # ctf: ClassTableFile, 存放课表信息的文件, 只读模式
+                    lineErrors = self.parseClassTableLines(enumerate(ctf, 1))   # 逐行读取, 不一次性读入整个文件
+            except (OSError, UnicodeDecodeError) as e:                  # 如编辑器保存到一半时截断在多字节字符中间
+                logger.error(f"读取课表文件 '{filePath}' 失败: {type(e).__name__}: {e}")
+                readErrors.append(str(e))
         # xlsx模式
-        elif mode.lower() == "xlsx" or mode.lower() == "xls" or mode.lower() == ".xlsx" or mode.lower() == ".xls":
-            pass
-            # TODO: parseClassTable xlsx模式
+        elif mode.lower() == "xlsx" or mode.lower() == ".xlsx":
+            lineErrors = self.parseClassTableLines(xlsx_reader.iterClassTableLines(filePath, readErrors))
+        elif mode.lower() == "xls" or mode.lower() == ".xls":
+            logger.error("不支持旧版的xls格式, 请在Excel中另存为xlsx后再导入")
+            return False
         # 都不是
         else:
             logger.error("导入/解析课表时遇到不支持的模式")
-            return
+            return False
 
-        logger.success("导入/解析课表成功")
+        if len(readErrors) > 0 or len(lineErrors) > 0:
+            logger.warning(f"导入/解析课表完成, 但有 {len(readErrors)} 处读取错误和 {len(lineErrors)} 行格式错误")
+        else:
+            logger.success("导入/解析课表成功")
+        if timeTable is not None and timeTable.isLoaded():                 # 时间表还未导入时不校验
+            validator.logIssues(validator.validateClassTable(self, timeTable), "导入课表")
 
-        return
+        return len(readErrors) == 0 and len(lineErrors) == 0
                 
+    def parseClassTableLines(self, lines: Iterable[tuple[int, str]]) -> list[tuple[int, str]]:
+        """
+        逐行解析课表内容, 格式错误的行会被跳过并记录下来
+
+        Args:
+            lines (Iterable[tuple[int, str]]): (行号, 行内容), 可以是文件对象的enumerate等任意可迭代对象
+
+        Returns:
+            list[tuple[int, str]]: 格式错误的行, (行号, 错误信息)
+        """
+
+        errors: list[tuple[int, str]] = []
+        normCount: int = 0                                              # 平日课表计数
+        satCount:  int = 0                                              # 周六课表计数
+        evenCount: int = 0                                              # 晚课课表计数
+
+        for lineNumber, line in lines:
+            line = line.rstrip("\r\n")                                 # 去掉末尾换行符
+            if line.strip() == "":
+                continue
+
+            p1: int = line.find(":")                                    # 找第一个":"的位置
+            prefix: str = line[0 : p1] if p1 != -1 else ""              # 前导字符串("周五", "晚课1"等)
+            if prefix == "":
+                logger.warning(f"解析课表时解析到格式不正确的行! Line Number: {lineNumber}")
+                errors.append((lineNumber, "缺少前缀(如'周一:')"))
+                continue
+
+            # 平日课表(一行就是一天的课)
+            if "周六" not in prefix and "晚课" not in prefix:
+                self.modifyDayClass(dayInWeek=normCount, dailyClass=self.parseClassNames(line[p1 + 1 :], True))
+                normCount += 1
+            # 周六课表
+            elif "周六" in prefix and "晚课" not in prefix:
+                self.modifySatDayClass(weekCount=satCount, satClass=self.parseClassNames(line[p1 + 1 :]))
+                satCount += 1
+            # 晚课课表(一行是一周的晚课)
+            elif "周六" not in prefix and "晚课" in prefix:
+                self.modifyEvenClass(weekCount=evenCount, weekEvenClass=self.parseClassNames(line[p1 + 1 :]))
+                evenCount += 1
+            else:
+                logger.warning(f"解析课表时解析到格式不正确的行! Line Number: {lineNumber}")
+                errors.append((lineNumber, f"无法识别的前缀 '{prefix}'"))
+
+        return errors
+
+    def parseClassNames(self, text: str, markOutdoor: bool = False) -> list[SingleClass]:
+        """
+        解析一行中用逗号分隔的课程, 每节课可以写为"课程名(老师姓名)"
+
+        Args:
+            text (str): 冒号之后的内容
+            markOutdoor (bool, optional): 是否把体育课标记为户外课程. Defaults to False.
+
+        Returns:
+            list[SingleClass]: 课程列表
+        """
+
+        classes: list[SingleClass] = []
+        for _class in text.split(","):
+            name, teacherName = splitTeacherName(_class)                # 去除前后空格, 拆出"数学(张三)"中的老师
+            classes.append(SingleClass(name=name, teacherName=teacherName, isOutdoor=(markOutdoor and name == "体育")))
+        return classes
+
     def writeClassTable(self, outPath: str = "./classes.txt", mode: str = "txt") -> None:
         """
         将(修改过后的)课程数据写入课表文件
@@ -339,9 +630,9 @@ class ClassTable:
                         if classIndex == 0:
                             line += tmp.get(dayInWeek, "") + ":"        # 格式: "周一:"
                         if classIndex != len(self.classTable1[dayInWeek]) - 1:
-                            line += self.classTable1[dayInWeek][classIndex].name + ","
+                            line += self.classTable1[dayInWeek][classIndex].label + ","
                         else:
-                            line += self.classTable1[dayInWeek][classIndex].name + "\n"
+                            line += self.classTable1[dayInWeek][classIndex].label + "\n"
                             ctf.write(line)                             # 写入文件
                 
                 ctf.write("\n")                                         # 写入空行分割
@@ -353,9 +644,9 @@ class ClassTable:
                         if classIndex == 0:
                             line += "周六" + str(weekCount + 1) + ":"     # 格式: "周六1:"
                         if classIndex != len(self.classTable2[weekCount]) - 1:
-                            line += self.classTable2[weekCount][classIndex].name + ","
+                            line += self.classTable2[weekCount][classIndex].label + ","
                         else:
-                            line += self.classTable2[weekCount][classIndex].name + "\n"
+                            line += self.classTable2[weekCount][classIndex].label + "\n"
                             ctf.write(line)                             # 写入文件
                             
                 ctf.write("\n")                                         # 写入空行分割
@@ -367,9 +658,9 @@ class ClassTable:
                         if dayInWeek == 0:
                             line += "晚课" + str(weekCount + 1) + ":"     # 格式: "晚课1:"
                         if dayInWeek != len(self.classTable3[weekCount]) - 1:
-                            line += self.classTable3[weekCount][dayInWeek].name + ","
+                            line += self.classTable3[weekCount][dayInWeek].label + ","
                         else:
-                            line += self.classTable3[weekCount][dayInWeek].name + "\n"
+                            line += self.classTable3[weekCount][dayInWeek].label + "\n"
                             ctf.write(line)                             # 写入文件
         # xlsx模式
         elif mode.lower() == "xlsx" or mode.lower() == "xls" or mode.lower() == ".xlsx" or mode.lower() == ".xls":
@@ -396,9 +687,9 @@ class ClassTable:
 
         data = {
             "data":[
-                [[self.classTable1[i][j].name for j in range(len(self.classTable1[i]))] for i in range(len(self.classTable1))],
-                [[self.classTable2[i][j].name for j in range(len(self.classTable2[i]))] for i in range(len(self.classTable2))],
-                [[self.classTable3[i][j].name for j in range(len(self.classTable3[i]))] for i in range(len(self.classTable3))]
+                [[self.classTable1[i][j].label for j in range(len(self.classTable1[i]))] for i in range(len(self.classTable1))],
+                [[self.classTable2[i][j].label for j in range(len(self.classTable2[i]))] for i in range(len(self.classTable2))],
+                [[self.classTable3[i][j].label for j in range(len(self.classTable3[i]))] for i in range(len(self.classTable3))]
             ]
         }
 
@@ -431,81 +722,86 @@ class ClassTable:
         for i in range(len(l[0])):
             dayClass: list[SingleClass] = []
             for j in range(len(l[0][i])):
-                singleClass: SingleClass = SingleClass(l[0][i][j])
+                singleClass: SingleClass = SingleClass.fromLabel(l[0][i][j])
                 dayClass.append(singleClass)
-            self.classTable1.append(dayClass)
+            self.classTable1.append(DaySchedule(dayClass))
         for i in range(len(l[1])):
             satDayClass: list[SingleClass] = []
             for j in range(len(l[1][i])):
-                singleClass: SingleClass = SingleClass(l[1][i][j])
+                singleClass: SingleClass = SingleClass.fromLabel(l[1][i][j])
                 satDayClass.append(singleClass)
             self.modifySatDayClass(i, satDayClass)
         for i in range(len(l[2])):
             for j in range(len(l[2][i])):
-                singleClass: SingleClass = SingleClass(l[2][i][j])
+                singleClass: SingleClass = SingleClass.fromLabel(l[2][i][j])
                 self.modifyEvenDayClass(i, j, singleClass, True)
 
         logger.success("加载课表完成")
 
         return
                 
-    def getClassTableToday(self) -> None:
+    def getClassTableOfDay(self, dayInWeek: int, weekCount2: int) -> DaySchedule:
         """
-        获取今天的课表
+        获取指定周几和三周轮换周数下实际执行的课表
 
         Args:
-            timeTable (TimeTable): 时间表实例
-        """
-
-        time_20250707: int = 1751817600                                 # 以2025/07/07 00:00:00为时间基准(此时为单周)
-        timenow: int  = int(time.time())                                # 当前的时间戳
-        curDateTime = datetime.datetime.now()
-        secdiff: int = timenow - time_20250707
+            dayInWeek (int): 周几(0-6, 0=周一)
+            weekCount2 (int): 修正后的三周轮换周数(0 ~ 周期-1)
 
-        SEC_PER_DAY: int = 86400
-        daydiff = math.ceil(secdiff / SEC_PER_DAY)                      # 差的天数
-        
-        weekcount = self.myTime.weekCount2                              # 3周轮换
+        Returns:
+            DaySchedule: 当天的课表, 周日或课表不完整时返回空课表
+        """
 
-        if curDateTime.weekday() == 6:
-            logger.info("今天没有课程, 停止生成今日课表")
-            return
+        if dayInWeek == 6:
+            return DaySchedule()
 
-        # 计算今日课表
         # 先计算白天课表
-        self.classTableToday = []
-        success: bool = True                                            # 是否成功生成课表
-        if curDateTime.weekday() != 5:                                  # 如果不是周六
-            if curDateTime.weekday() >= len(self.classTable1):
+        dayClass: DaySchedule = DaySchedule()
+        if dayInWeek != 5:                                              # 如果不是周六
+            if dayInWeek >= len(self.classTable1):
                 logger.error(f"classTable1 未含有指定课表(索引超界), 请先导入课表")
-                success = False
-                return
+                return DaySchedule()
             else:
-                self.classTableToday.extend(self.classTable1[curDateTime.weekday()])
+                dayClass.extend(self.classTable1[dayInWeek])
             # 计算晚课
-            if weekcount >= len(self.classTable3):
+            if weekCount2 >= len(self.classTable3) or dayInWeek >= len(self.classTable3[weekCount2]):
                 logger.error("classTable3 未含有指定课表(索引超界), 请先导入课表")
-                success = False
-                return
+                return DaySchedule()
             else:
-                self.classTableToday.append(self.classTable3[weekcount][curDateTime.weekday()])
+                dayClass.append(self.classTable3[weekCount2][dayInWeek])
         else:
-            if weekcount >= len(self.classTable2):
+            if weekCount2 >= len(self.classTable2):
                 logger.error("classTable2 未含有指定课表(索引超界), 请先导入课表")
-                success = False
-                return
+                return DaySchedule()
             else:
-                self.classTableToday.extend(self.classTable2[weekcount])
-        if success:
-            # 加一节自习(平日为二晚, 周六则为下午自习)
-            extendClass: SingleClass = SingleClass(name="自习")
-            self.classTableToday.append(extendClass)
+                dayClass.extend(self.classTable2[weekCount2])
+
+        # 加一节自习(平日为二晚, 周六则为下午自习)
+        extendClass: SingleClass = SingleClass(name="自习")
+        dayClass.append(extendClass)
+
+        return dayClass
 
-        if success:
+    def getClassTableToday(self) -> None:
+        """
+        获取今天的课表
+        """
+
+        today = self.myTime.calendar.lookup(self.myTime.clock.today())     # 从日历索引查询今天的信息
+
+        if today.noClass:                                              # 周日或节假日
+            logger.info(f"今天没有课程{f'({today.holiday})' if today.holiday != '' else ''}, 停止生成今日课表")
+            return
+
+        # 计算今日课表(调休时执行的是另一天的课表)
+        if today.scheduleWeekday != today.weekday:
+            logger.info(f"今天调休({today.holiday}), 执行周{'一二三四五六'[today.scheduleWeekday]}的课表")
+        self.classTableToday = self.getClassTableOfDay(today.scheduleWeekday, today.weekCount2)
+
+        if len(self.classTableToday) != 0:
             logger.success("成功生成今日课表")
         else:
             logger.error("生成今日课表时出现问题, 返回空课表")
-            self.classTableToday = []
 
         return
         
@@ -521,30 +817,34 @@ class TimeTable:
     satTimeList2:  list[TimePeriod] = []                                # 周六时间表, 双周
     
     def __init__(self) -> None:
-        pass
+        # 同ClassTable, 每个实例使用自己的列表
+        self.normTimeList1 = []
+        self.normTimeList2 = []
+        self.satTimeList1  = []
+        self.satTimeList2  = []
 
-    def hm_str2time(self, time: str) -> list[int]:
+    def hm_str2time(self, timeStr: str) -> list[int]:
         """
         hh:mm格式字符串转时间
 
         Args:
-            time (str): "hh:mm"格式的时间字符串
+            timeStr (str): "hh:mm"格式的时间字符串
 
         Returns:
             list[int]:包含两个元素的列表, 第一位为时, 第二位为分
         """
 
-        if time == "":
+        if timeStr == "":
             return [0, 0]
 
         # 第一位非数字就改为0
-        if not time[0].isdigit():
-            lstr: list = list(time)
+        if not timeStr[0].isdigit():
+            lstr: list = list(timeStr)
             lstr[0] = "0"
-            time = "".join(lstr)
+            timeStr = "".join(lstr)
 
-        h: str = time[0:2].strip()
-        m: str = time[3:5].strip()
+        h: str = timeStr[0:2].strip()
+        m: str = timeStr[3:5].strip()
 
         retList: list[int] = [0, 0]
 
@@ -614,115 +914,153 @@ class TimeTable:
 
         return
 
-    def parseTimeTable(self, filePath: str = "./timetable.txt", mode: str = "txt") -> None:
+    def parseTimeTable(self, filePath: str = "./timetable.txt", mode: str = "txt") -> bool:
         """
         读取和解析时间表
 
         Args:
             filePath (str, optional): 时间表文件路径. Defaults to "./timetable.txt".
             mode (str, optional): 从什么文件读取, 支持txt和xlsx两种模式. Defaults to "txt".
+
+        Returns:
+            bool: 是否完整读取且没有格式错误的行(文件不存在, 损坏或读到一半时为False)
         """
 
         logger.info(f"开始从路径 '{filePath}' 导入/解析时间表")
 
         if not os.path.exists(filePath):
             logger.error(f"导入/解析时间表时路径 '{filePath}' 不存在")
+            return False
 
+        readErrors: list[str] = []
+        lineErrors: list[tuple[int, str]] = []
         # txt模式
         if mode.lower() == "txt" or mode.lower() == ".txt":
-            with open(filePath, "r", encoding="utf-8") as ttf:          # TimeTableFile, 时间表文件
-                lines: list[str] = ttf.readlines()
-                count: int = 0                                          # 这是遍历计数器, 数这是第几行了
-                timePeriodCount: int = 0                                # 这是时间段计数器, 作用应该挺明显的
-                stat: int = 0                                           # 读到哪了, 0=平日, 1=周六
-                # 遍历
-                for line in lines:
-                    if "周六" in line:                                   # 读到周六时间表, 改变标识, 跳过分割行
-                        count += 1
-                        stat = 1
-                        timePeriodCount = 0                             # 写入新时间表, 时间段计数归零
-                        continue
-                    
-                    # p1是position1的意思, 下面p2同理
-                    p1: int = line.find(":") if line.find(":") != -1 else line.find(",")    # 找第一个 : 或者 , 的位置
+            try:
+                with open(filePath, "r", encoding="utf-8") as ttf:      # TimeTableFile, 时间表文件
+                    lineErrors = self.parseTimeTableLines(enumerate(ttf, 1))    # 逐行读取, 不一次性读入整个文件
+            except (OSError, UnicodeDecodeError) as e:
+                logger.error(f"读取时间表文件 '{filePath}' 失败: {type(e).__name__}: {e}")
+                readErrors.append(str(e))
+        elif mode.lower() == "xlsx" or mode.lower() == ".xlsx":
+            lineErrors = self.parseTimeTableLines(xlsx_reader.iterTimeTableLines(filePath, readErrors))
+        else:
+            logger.error("导入/解析时间表时遇到不支持的模式")
+            return False
 
-                    if p1 == -1:                                        # 没有分隔符就跳过
-                        logger.warning(f"导入/解析时间表时遇到了空行或者格式错误的行! Line number: {count + 1}")
-                        count += 1
-                        continue
+        if len(readErrors) > 0 or len(lineErrors) > 0:
+            logger.warning(f"导入/解析时间表完成, 但有 {len(readErrors)} 处读取错误和 {len(lineErrors)} 行格式错误")
+        else:
+            logger.success("导入/解析时间表成功")
+        validator.logIssues(validator.validateTimeTable(self), "导入时间表")
 
-                    prefix: str = line[0 : p1]                          # 获取每行前缀
-                    # 获取时间段类型
-                    timeType: int = 0
-                    if "课间" in prefix or "休" in prefix or "操" in prefix:                 # 不会有哪个傻子在正课前面加这几个字吧?
-                        timeType = 1
-                    elif "分割" in prefix:
-                        timeType = 2
+        return len(readErrors) == 0 and len(lineErrors) == 0
 
-                    p2: int = line.find("-") if line.find("-") != -1 else line.find("~")    # 找分隔符 - 或者 ~ 的位置
+    def parseTimeTableLines(self, lines: Iterable[tuple[int, str]]) -> list[tuple[int, str]]:
+        """
+        逐行解析时间表内容, 格式错误的行会被跳过并记录下来
 
-                    if p2 == -1:                                        # 没找到就跳过
-                        logger.warning(f"解析时间表时解析到格式错误的行! Line number: {count + 1}")
-                        count += 1
-                        continue
+        Args:
+            lines (Iterable[tuple[int, str]]): (行号, 行内容), 可以是文件对象的enumerate等任意可迭代对象
+
+        Returns:
+            list[tuple[int, str]]: 格式错误的行, (行号, 错误信息)
+        """
+
+        errors: list[tuple[int, str]] = []
+        timePeriodCount: int = 0                                        # 这是时间段计数器, 作用应该挺明显的
+        isSat: bool = False                                             # 读到哪了, False=平日, True=周六
+
+        for lineNumber, line in lines:
+            line = line.rstrip("\r\n")                                  # 去掉末尾换行符
+            if line.strip() == "":
+                continue
+
+            if "周六" in line:                                           # 读到周六时间表, 改变标识, 跳过分割行
+                isSat = True
+                timePeriodCount = 0                                     # 写入新时间表, 时间段计数归零
+                continue
+
+            if line.rstrip().endswith(":") and "-" not in line and "~" not in line:
+                continue                                                # "平日时间:"等标题行
+
+            error: str = self.parseTimeTableLine(line, isSat, timePeriodCount)
+            if error != "":
+                logger.warning(f"导入/解析时间表时遇到了格式错误的行({error})! Line number: {lineNumber}")
+                errors.append((lineNumber, error))
+                continue
+
+            timePeriodCount += 1
+
+        return errors
+
+    def parseTimeTableLine(self, line: str, isSat: bool, timePeriodCount: int) -> str:
+        """
+        解析时间表中的一行(一个时间段)并写入对应的时间表
+
+        Args:
+            line (str): 行内容(不含换行符)
+            isSat (bool): 是否为周六时间表
+            timePeriodCount (int): 这是第几个时间段(从0开始)
+
+        Returns:
+            str: 错误信息, 解析成功时为""
+        """
+
+        # 单周和双周时间表
+        timeTable1: str = "STL1" if isSat else "NTL1"
+        timeTable2: str = "STL2" if isSat else "NTL2"
+
+        # p1是position1的意思, 下面p2同理
+        p1: int = line.find(":") if line.find(":") != -1 else line.find(",")        # 找第一个 : 或者 , 的位置
+        if p1 == -1:                                                    # 没有分隔符就跳过
+            return "缺少分隔符':'"
+
+        prefix: str = line[0 : p1]                                      # 获取每行前缀
+        # 获取时间段类型
+        timeType: int = 0
+        if "课间" in prefix or "休" in prefix or "操" in prefix:         # 不会有哪个傻子在正课前面加这几个字吧?
+            timeType = 1
+        elif "分割" in prefix:
+            timeType = 2
+
+        p2: int = line.find("-") if line.find("-") != -1 else line.find("~")        # 找分隔符 - 或者 ~ 的位置
+        if p2 == -1:                                                    # 没找到就跳过
+            return "缺少时间分隔符'-'"
 
-                    t1 = line[p2 - 5 : p2]
-                    t2 = line[p2 + 1 : p2 + 6]
+        t1 = line[p2 - 5 : p2]
+        t2 = line[p2 + 1 : p2 + 6]
 
-                    if stat == 0:                                       # 平日时间表
-                        # 不是哥们为什么我最开始tp1和tp2用一个变量不行啊? Python不是只有按值传参吗?????
-                        tp1: TimePeriod = TimePeriod(start=self.hm_str2time(t1), finish=self.hm_str2time(t2), timetype=timeType)
-                        self.modifyTimeTable(timeTableToMod="NTL1", timePeriodCount=timePeriodCount, timePeriod=tp1)
+        try:
+            tp1: TimePeriod = TimePeriod(start=self.hm_str2time(t1), finish=self.hm_str2time(t2), timetype=timeType)
+            self.modifyTimeTable(timeTableToMod=timeTable1, timePeriodCount=timePeriodCount, timePeriod=tp1)
 
-                        if len(line) > p1 + 13:                         # 长度大于p1 + 13说明这是一个含双重时间点的行, 等会, 不会有人
+            if len(line) > p1 + 12:                                     # 长度大于p1 + 12说明这是一个含双重时间点的行, 等会, 不会有人
                                                                         # 时间写一位吧???? 算了不管了, 自生自灭吧
-                            if line.find("/") > p2:                     # 判断双重时间分隔符的位置, 在p2后说明是终止时间点有两个
-                                # 此处为读取第二波吃饭的时间, 格式为"第五节课:11:15-11:55/12:05
-                                #                                                  ^^^^^ <-要读取的时间
-                                # 你问我为什么不用 if "第五节课" in line这种简单的方法? 万一以后育明上午不是五节课了怎么办(
-                                t3 = line[p2 + 7 : p2 + 12]
-                                tp2: TimePeriod = TimePeriod(start=self.hm_str2time(t1), finish=self.hm_str2time(t3), 
-                                                             timetype=timeType)
-                                self.modifyTimeTable(timeTableToMod="NTL2", timePeriodCount=timePeriodCount, timePeriod=tp2)
-                            else:                                       # 起始时间点有两个
-                                # 读取午休开始时间, 格式为"午休:11:55/12:05-13:35"
-                                #                          ^^^^^ <-这里要读取的时间
-                                # ! 此处注意: 上方的tp永远是离"-"最近的时间, 因此上方的tp在这里是双周时间!!!
-                                self.modifyTimeTable(timeTableToMod="NTL2", timePeriodCount=timePeriodCount, timePeriod=tp1)
-                                t3 = line[p2 - 11 : p2 - 6]
-                                tp2: TimePeriod = TimePeriod(start=self.hm_str2time(t3), finish=self.hm_str2time(t2), 
-                                                             timetype=timeType)         # 此处为start
-                                self.modifyTimeTable(timeTableToMod="NTL1", timePeriodCount=timePeriodCount, timePeriod=tp2)
-                        else:
-                            # 否则为正常行, 正常写入即可
-                            self.modifyTimeTable(timeTableToMod="NTL2", timePeriodCount=timePeriodCount, timePeriod=tp1)
-                    elif stat == 1:                                     # 周六时间表, 原理同上
-                        tp1: TimePeriod = TimePeriod(start=self.hm_str2time(t1), finish=self.hm_str2time(t2), timetype=timeType)
-                        self.modifyTimeTable(timeTableToMod="STL1", timePeriodCount=timePeriodCount, timePeriod=tp1)
-
-                        if len(line) > p1 + 13:
-                            if line.find("/") > p2:
-                                t3 = line[p2 + 7 : p2 + 12]
-                                tp2: TimePeriod = TimePeriod(start=self.hm_str2time(t1), finish=self.hm_str2time(t3))
-                                self.modifyTimeTable(timeTableToMod="STL2", timePeriodCount=timePeriodCount, timePeriod=tp2)
-                            else:
-                                self.modifyTimeTable(timeTableToMod="STL2", timePeriodCount=timePeriodCount, timePeriod=tp1)
-                                t3 = line[p2 - 11 : p2 - 6]
-                                tp2: TimePeriod = TimePeriod(start=self.hm_str2time(t3), finish=self.hm_str2time(t2), 
-                                                             timetype=timeType)
-                                self.modifyTimeTable(timeTableToMod="STL1", timePeriodCount=timePeriodCount, timePeriod=tp2)
-                        else:
-                            self.modifyTimeTable(timeTableToMod="STL2", timePeriodCount=timePeriodCount, timePeriod=tp1)
-                    timePeriodCount += 1
-                    count += 1
-        elif mode.lower() == "xlsx" or mode.lower() == ".xlsx":
-            pass
-        # TODO: parseTimeTable xlsx模式
-        else:
-            logger.error("导入/解析时间表时遇到不支持的模式")
-            return
+                if line.find("/") > p2:                                 # 判断双重时间分隔符的位置, 在p2后说明是终止时间点有两个
+                    # 此处为读取第二波吃饭的时间, 格式为"第五节课:11:15-11:55/12:05
+                    #                                                  ^^^^^ <-要读取的时间
+                    # 你问我为什么不用 if "第五节课" in line这种简单的方法? 万一以后育明上午不是五节课了怎么办(
+                    t3 = line[p2 + 7 : p2 + 12]
+                    tp2: TimePeriod = TimePeriod(start=self.hm_str2time(t1), finish=self.hm_str2time(t3),
+                                                 timetype=timeType)
+                    self.modifyTimeTable(timeTableToMod=timeTable2, timePeriodCount=timePeriodCount, timePeriod=tp2)
+                else:                                                   # 起始时间点有两个
+                    # 读取午休开始时间, 格式为"午休:11:55/12:05-13:35"
+                    #                          ^^^^^ <-这里要读取的时间
+                    # ! 此处注意: 上方的tp永远是离"-"最近的时间, 因此上方的tp在这里是双周时间!!!
+                    self.modifyTimeTable(timeTableToMod=timeTable2, timePeriodCount=timePeriodCount, timePeriod=tp1)
+                    t3 = line[p2 - 11 : p2 - 6]
+                    tp2: TimePeriod = TimePeriod(start=self.hm_str2time(t3), finish=self.hm_str2time(t2),
+                                                 timetype=timeType)     # 此处为start
+                    self.modifyTimeTable(timeTableToMod=timeTable1, timePeriodCount=timePeriodCount, timePeriod=tp2)
+            else:
+                # 否则为正常行, 正常写入即可
+                self.modifyTimeTable(timeTableToMod=timeTable2, timePeriodCount=timePeriodCount, timePeriod=tp1)
+        except ValueError:
+            return "时间格式错误"
 
-        logger.success("导入/解析时间表成功")
+        return ""
 
     def writeTimeTable(self, outPath: str = "./timetable.txt", mode: str = "txt") -> None:
         """
@@ -848,7 +1186,7 @@ class TimeTable:
 
     def saveTimeTable(self, outPath = "./data/timetable.cic") -> None:
         """
-        用pickle保存时间表
+        保存时间表(格式见store模块)
 
         Args:
             outPath (str, optional): 存放时间表数据的路径. Defaults to "./data/timetable.cic".
@@ -856,8 +1194,10 @@ class TimeTable:
 
         logger.info(f"开始保存时间表到路径 '{outPath}'")
 
-        with open(outPath, "wb") as tt:
-            pickle.dump(self, tt)
+        store.saveTimeLists(outPath, [
+            [(tp.start, tp.finish, tp.timeType) for tp in timeList]
+            for timeList in (self.normTimeList1, self.normTimeList2, self.satTimeList1, self.satTimeList2)
+        ])
 
         logger.success("保存时间表成功")
 
@@ -865,30 +1205,36 @@ class TimeTable:
 
     def loadTimeTable(self, filePath = "./data/timetable.cic") -> None:
         """
-        用pickle读取课表数据
+        读取时间表数据(旧版本的pickle文件会被自动迁移)
 
         Args:
-            filePath (str, optional): 存放课表数据的路径. Defaults to "./data/timetable.cic".
+            filePath (str, optional): 存放时间表数据的路径. Defaults to "./data/timetable.cic".
         """
         
         logger.info(f"开始从路径 '{filePath}' 加载时间表")
 
-        try:
-            with open(filePath, "rb") as tt:
-                _timetable: TimeTable = pickle.load(tt)
-        except FileNotFoundError:
-            logger.error(f"加载时间表时路径 '{filePath}' 不存在")
+        timeLists = store.loadTimeLists(filePath)
+        if timeLists is None:
+            logger.error("加载时间表失败")
             return
-        
-        self.normTimeList1 = _timetable.normTimeList1
-        self.normTimeList2 = _timetable.normTimeList2
-        self.satTimeList1 = _timetable.satTimeList1
-        self.satTimeList2 = _timetable.satTimeList2
+
+        self.normTimeList1, self.normTimeList2, self.satTimeList1, self.satTimeList2 = [
+            [TimePeriod.fromMinutes(start[0] * 60 + start[1], finish[0] * 60 + finish[1], timeType)
+             for start, finish, timeType in timeList]
+            for timeList in timeLists
+        ]
 
         logger.success("加载时间表成功")
 
         return
     
+    def isLoaded(self) -> bool:
+        """
+        是否已经导入/加载了时间表(任意一个时间表不为空)
+        """
+
+        return any(len(getattr(self, name)) > 0 for name in store.TIME_LIST_NAMES)
+
     def getTotalClassCount(self, timeTable: Literal["NTL1", "NTL2", "STL1", "STL2"]) -> int:
         if timeTable == "NTL1" or timeTable == "NTL2":
             count: int = 0
@@ -0,0 +1,79 @@
+# file: clock.py
+# brief: 时钟模块, 所有"现在是几点/今天是哪天"的查询都通过MyTime(WeekTime).clock完成, 方便模拟任意日期
+# time: 2026.10.17
+# TODOs:
+#   暂无
+
+import datetime, time
+
+
+class Clock:
+    """
+    系统时钟, 直接返回系统时间
+    """
+
+    def now(self) -> datetime.datetime:
+        """
+        获取当前时间
+        """
+
+        return datetime.datetime.now()
+
+    def today(self) -> datetime.date:
+        """
+        获取今天的日期
+        """
+
+        return self.now().date()
+
+    def sleep(self, seconds: float) -> None:
+        """
+        休眠指定的秒数
+        """
+
+        time.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """
+    虚拟时钟, 时间只在调用set/advance/sleep时变化, 用于模拟和测试
+    """
+
+    current: datetime.datetime                                          # 虚拟的当前时间
+
+    def __init__(self, start: datetime.datetime) -> None:
+        """
+        初始化
+
+        Args:
+            start (datetime.datetime): 虚拟时钟的起始时间
+        """
+
+        self.current = start
+
+    def now(self) -> datetime.datetime:
+        return self.current
+
+    def set(self, value: datetime.datetime) -> None:
+        """
+        把虚拟时钟设置为指定时间
+        """
+
+        self.current = value
+
+    def advance(self, delta: datetime.timedelta) -> None:
+        """
+        把虚拟时钟向后拨动delta
+        """
+
+        self.current += delta
+
+    def sleep(self, seconds: float) -> None:
+        """
+        不实际休眠, 直接把虚拟时钟向后拨动
+        """
+
+        self.advance(datetime.timedelta(seconds=seconds))
+
+
+SYSTEM_CLOCK: Clock = Clock()                                           # 默认使用的系统时钟
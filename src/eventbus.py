@@ -4,15 +4,18 @@
 # TODOs:
 #   暂无
 
-from PyQt5.QtCore    import QObject, pyqtSignal
+from PyQt5.QtCore    import QObject, pyqtSignal, pyqtBoundSignal, Qt
 from PyQt5.QtWidgets import QApplication, QMainWindow
 from ciconfig_ui     import Ui_MainWindow
 from class_manager   import ClassTable, TimeTable, SingleClass
 from json_writer     import JsonManager
 from settings_ui     import Settings_Ui
 from mytime          import MyTime
+from typing          import Any, Optional
 from loguru          import logger
-import sys
+import sys, threading
+
+REQUEST_TIMEOUT: float = 5.0                                            # request等待回复的默认超时时间(秒)
 
 
 class EventBus(QObject):
@@ -54,6 +57,40 @@ class EventBus(QObject):
 
         return
 
+    def request(self, ask: pyqtBoundSignal, reply: pyqtBoundSignal, default: Any = None,
+                timeout: float = REQUEST_TIMEOUT) -> Any:
+        """
+        发出询问信号并等待回复信号, 用于get/return成对的信号(如LG_getPathToCI_ST和ST_returnPathToCI_LG)
+        在非主线程中调用时会阻塞到回复到达为止; 在主线程中调用时回复会同步到达
+
+        Args:
+            ask (pyqtBoundSignal): 询问信号, 无参数
+            reply (pyqtBoundSignal): 回复信号, 取第一个参数作为结果
+            default (Any, optional): 超时时返回的默认值. Defaults to None.
+            timeout (float, optional): 超时时间(秒). Defaults to REQUEST_TIMEOUT.
+
+        Returns:
+            Any: 回复的内容, 超时时为default
+        """
+
+        done: threading.Event = threading.Event()
+        result: list[Any] = [default]
+
+        def f(*args) -> None:
+            if not done.is_set():
+                result[0] = args[0] if len(args) > 0 else None
+                done.set()
+        reply.connect(f, Qt.ConnectionType.DirectConnection)           # 在回复方的线程中直接设置结果
+
+        try:
+            ask.emit()
+            if not done.wait(timeout):
+                logger.warning(f"等待回复超时({timeout}秒), 使用默认值 {default!r}")
+        finally:
+            reply.disconnect(f)
+
+        return result[0]
+
     def quit(self):
         """
         退出程序
@@ -132,11 +169,18 @@ class EventBus(QObject):
     ST_setComboBoxDefaultText_STUI: pyqtSignal = pyqtSignal(dict)
     STUI_set_showMainWindow_ST:     pyqtSignal = pyqtSignal(bool)
     STUI_b_pathToCI_clicked_EH:     pyqtSignal = pyqtSignal()
+    STUI_set_fullCycle_ST:          pyqtSignal = pyqtSignal(bool)
+
+    ST_setFullCycle_JM: pyqtSignal = pyqtSignal(bool)
+    ST_setOutputTargets_JM: pyqtSignal = pyqtSignal(dict)               # 键同JsonManager.setOutputTargets的参数
 
     GUI_get_ShowMainWindow_ST:   pyqtSignal = pyqtSignal()
 
     LG_getShowMainWindow_ST:     pyqtSignal = pyqtSignal()
     ST_returnShowMainWindow_LG:  pyqtSignal = pyqtSignal(bool)
+
+    MT_dayChanged_LG:  pyqtSignal = pyqtSignal(object)                  # 中继MyTime.dayChanged
+    MT_weekChanged_LG: pyqtSignal = pyqtSignal(int, int)                # 中继MyTime.weekChanged
     
     def connectAllSingal(self) -> None:
         """
@@ -145,14 +189,16 @@ class EventBus(QObject):
 
         self.ui.b_import_ct.clicked.connect(self.UI_b_import_ct_clicked_EH)
         def f5(filePath: str, mode: str) -> None:
-            self.classTable.parseClassTable(filePath, mode)
+            self.classTable.parseClassTable(filePath, mode, self.timeTable)
             self.classTable.getClassTableToday()
+            self.jsonManager.invalidateFragmentCache()
             f1()
         self.EH_parseClassTable_CT.connect(lambda filePath, mode: f5(filePath, mode))
 
         self.ui.b_import_tt.clicked.connect(self.UI_b_import_tt_clicked_EH)
         def f6(filePath: str, mode: str):
             self.timeTable.parseTimeTable(filePath, mode)
+            self.jsonManager.invalidateFragmentCache()
             f1()
         self.EH_parseTimeTable_TT.connect(lambda filePath, mode: f6(filePath, mode))
 
@@ -191,7 +237,17 @@ class EventBus(QObject):
         self.GUI_exit_Main.connect(self.quit)
   
         self.GUI_cb_offset1_setDefaultText_UI.connect(lambda: self.ui.cb_offset1.setCurrentIndex(self.myTime.weekOffset1))
-        self.GUI_cb_offset2_setDefaultText_UI.connect(lambda: self.ui.cb_offset2.setCurrentIndex(self.myTime.weekOffset2))
+        def f7() -> None:
+            # 三周轮换的周期可在规则文件中修改(见rotation模块), 选项数与周期一致
+            period: int = self.myTime.calendar.weekPeriod2
+            self.ui.cb_offset2.blockSignals(True)
+            while self.ui.cb_offset2.count() > period:
+                self.ui.cb_offset2.removeItem(self.ui.cb_offset2.count() - 1)
+            while self.ui.cb_offset2.count() < period:
+                self.ui.cb_offset2.addItem(f" +{self.ui.cb_offset2.count()}周")
+            self.ui.cb_offset2.blockSignals(False)
+            self.ui.cb_offset2.setCurrentIndex(self.myTime.weekOffset2)
+        self.GUI_cb_offset2_setDefaultText_UI.connect(f7)
 
         def f2() -> None:   # 给Gui.SA_DisplayInfo传参
             if self.ui.cb_ctinfo.currentIndex() == 0:
@@ -206,12 +262,21 @@ class EventBus(QObject):
 
         self.LG_displaySAInfo_GUI.connect(lambda: self.EB_displaySAInfo_GUI.emit(self.classTable))
 
+        def edited(className: str, old: Optional[SingleClass]) -> SingleClass:
+            # 选择框中只有课程名, 没有写老师时沿用原来的任课老师, 否则保存后老师会丢失
+            singleClass: SingleClass = SingleClass.fromLabel(className)
+            if singleClass.teacherID == 0 and old is not None:
+                singleClass.teacherID = old.teacherID
+            return singleClass
+
         def f3(index: int, className: str) -> None:
-            if self.myTime.curDateTime.weekday() == 5:                  # 周六
-                if index < len(self.classTable.classTable2[self.myTime.getWeekCount2()]):
-                    self.classTable.classTable2[self.myTime.getWeekCount2()][index] = SingleClass(className)
-            elif self.myTime.curDateTime.weekday() == 6:                # 周日
+            today = self.myTime.calendar.lookup(self.myTime.clock.today())
+            if today.noClass:                                           # 周日或节假日
                 return
+            elif today.scheduleWeekday == 5:                            # 周六
+                satClass = self.classTable.classTable2[today.weekCount2]
+                if index < len(satClass):
+                    satClass[index] = edited(className, satClass[index])
             else:
                 classCount = self.timeTable.getTotalClassCount("NTL1")
                 if self.classTable.classTableToday[classCount - 1].name == "自习":
@@ -220,12 +285,15 @@ class EventBus(QObject):
                     evenClassIndex = classCount - 1
                 
                 if index == evenClassIndex:
-                    dayEvenClass: SingleClass = SingleClass(className)
-                    self.classTable.modifyEvenDayClass(self.myTime.getWeekCount2(), self.myTime.curDateTime.weekday(),
-                                                       dayEvenClass)
+                    weekEvenClass = self.classTable.classTable3[today.weekCount2]
+                    old = weekEvenClass[today.scheduleWeekday] if today.scheduleWeekday < len(weekEvenClass) else None
+                    dayEvenClass: SingleClass = edited(className, old)
+                    self.classTable.modifyEvenDayClass(today.weekCount2, today.scheduleWeekday, dayEvenClass)
                 elif index < evenClassIndex:
-                    singleClass: SingleClass = SingleClass(className)
-                    self.classTable.modifySingleClass(self.myTime.curDateTime.weekday(), index, singleClass)
+                    dayClass = self.classTable.classTable1[today.scheduleWeekday] \
+                               if today.scheduleWeekday < len(self.classTable.classTable1) else []
+                    singleClass: SingleClass = edited(className, dayClass[index] if index < len(dayClass) else None)
+                    self.classTable.modifySingleClass(today.scheduleWeekday, index, singleClass)
         self.GUI_SAComboBox_currentIndexChanged_CT.connect(lambda index, className: f3(index, className))
 
         self.ui.b_settings.clicked.connect(self.UI_b_settings_clicked_ST)
@@ -233,10 +301,20 @@ class EventBus(QObject):
         def f4(data: dict) -> None:
             self.settingsUi.comboBox.setCurrentIndex(0 if data["showMainWindow"] == False else 1)
             self.settingsUi.l_pathToCI.setText(data["pathToCI"])
+            self.settingsUi.comboBox_fullCycle.setCurrentIndex(0 if data["fullCycle"] == False else 1)
         self.ST_setComboBoxDefaultText_STUI.connect(lambda data: f4(data))
 
         self.settingsUi.comboBox.currentIndexChanged.connect(
             lambda: self.STUI_set_showMainWindow_ST.emit(False if self.settingsUi.comboBox.currentIndex() == 0 else True)
             )
         
-        self.settingsUi.b_pathToCI.clicked.connect(self.STUI_b_pathToCI_clicked_EH)
\ No newline at end of file
+        self.settingsUi.b_pathToCI.clicked.connect(self.STUI_b_pathToCI_clicked_EH)
+
+        self.settingsUi.comboBox_fullCycle.currentIndexChanged.connect(
+            lambda: self.STUI_set_fullCycle_ST.emit(False if self.settingsUi.comboBox_fullCycle.currentIndex() == 0 else True)
+            )
+        self.ST_setFullCycle_JM.connect(lambda fullCycle: self.jsonManager.setFullCycle(fullCycle))
+        self.ST_setOutputTargets_JM.connect(lambda targets: self.jsonManager.setOutputTargets(**targets))
+
+        self.myTime.dayChanged.connect(self.MT_dayChanged_LG)
+        self.myTime.weekChanged.connect(self.MT_weekChanged_LG)
\ No newline at end of file
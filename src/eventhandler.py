@@ -147,7 +147,7 @@ class EventHandler(QObject):
         if filePath == "":
             logger.warning("选择时间表路径时失败, 可能为用户取消")
             return
-        mode: str = filePath[-3:]
+        mode: str = filePath[-4:]
         self.EH_parseTimeTable_TT.emit(filePath, mode)
 
     def b_generate_json_OnClick(self) -> None:
@@ -0,0 +1,128 @@
+# file: fanout.py
+# brief: 配置文件多目标写入模块, 序列化一次后并发写入主文件/.bak/归档/共享目录
+# time: 2026.10.17
+# TODOs:
+#   暂无
+
+from   concurrent.futures import Future, ThreadPoolExecutor, wait
+from   typing             import Any, Iterable
+from   loguru             import logger
+import datetime, os, threading, time
+
+TARGET_PRIMARY: str = "primary"                                         # 主配置文件
+TARGET_BACKUP: str  = "backup"                                          # 主配置文件旁的.bak, ClassIsland会对照它检查课表
+TARGET_ARCHIVE: str = "archive"                                         # 带时间戳的归档副本
+TARGET_SHARE: str   = "share"                                           # 挂载的共享目录
+
+DEFAULT_TIMEOUT: float = 10.0                                           # 等待所有目标写入的最长时间(秒)
+MAX_WORKERS: int = 8
+
+
+def buildTargets(primaryPath: str, backup: bool = False, archiveDir: str = "",
+                 shareDirs: Iterable[str] = ()) -> list[tuple[str, str]]:
+    """
+    根据输出设置生成写入目标
+
+    Args:
+        primaryPath (str): 主配置文件路径
+        backup (bool, optional): 是否同时写入 <主配置文件>.bak. Defaults to False.
+        archiveDir (str, optional): 归档目录, 为""时不归档. Defaults to "".
+        shareDirs (Iterable[str], optional): 共享目录, 写入同名文件. Defaults to ().
+
+    Returns:
+        list[tuple[str, str]]: (目标类型, 路径), 第一个为主配置文件
+    """
+
+    targets: list[tuple[str, str]] = [(TARGET_PRIMARY, primaryPath)]
+    if backup:
+        targets.append((TARGET_BACKUP, primaryPath + ".bak"))
+
+    name: str = os.path.basename(primaryPath)
+    if archiveDir != "":
+        stem, ext = os.path.splitext(name)
+        targets.append((TARGET_ARCHIVE, os.path.join(archiveDir, f"{stem}-{datetime.datetime.now():%Y%m%d-%H%M%S}{ext}")))
+    for shareDir in shareDirs:
+        if shareDir != "":
+            targets.append((TARGET_SHARE, os.path.join(shareDir, name)))
+
+    return targets
+
+def writeTarget(kind: str, filePath: str, data: bytes) -> dict[str, Any]:
+    """
+    写入一个目标(先写临时文件再替换), 不抛出异常
+
+    Args:
+        kind (str): 目标类型
+        filePath (str): 路径
+        data (bytes): 文件内容
+
+    Returns:
+        dict[str, Any]: 写入结果, 含有kind, path, status("ok"/"failed"), error, ms
+    """
+
+    result: dict[str, Any] = {"kind": kind, "path": filePath, "status": "ok", "error": "", "ms": 0.0}
+    start = time.perf_counter()
+    # 临时文件名带上进程和线程编号: 超时的写入仍在后台进行时, 下一次写入同一路径不会与它共用临时文件
+    tmpPath: str = f"{filePath}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        dirPath: str = os.path.dirname(os.path.abspath(filePath))
+        os.makedirs(dirPath, exist_ok=True)
+        with open(tmpPath, "wb") as f:
+            f.write(data)
+        os.replace(tmpPath, filePath)
+    except OSError as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+        try:
+            os.remove(tmpPath)
+        except OSError:
+            pass
+    result["ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+    return result
+
+def fanOutWrite(targets: list[tuple[str, str]], data: bytes, timeout: float = DEFAULT_TIMEOUT) -> list[dict[str, Any]]:
+    """
+    用线程池并发写入所有目标, 最多等待timeout秒, 未完成的目标标记为"timeout"并在后台继续写入,
+    一个很慢的共享目录不会拖住其他目标
+
+    Args:
+        targets (list[tuple[str, str]]): (目标类型, 路径)
+        data (bytes): 已序列化的文件内容
+        timeout (float, optional): 最长等待时间(秒). Defaults to DEFAULT_TIMEOUT.
+
+    Returns:
+        list[dict[str, Any]]: 每个目标的写入结果, 顺序同targets, 见writeTarget
+    """
+
+    if len(targets) == 0:
+        return []
+    if len(targets) == 1:                                               # 只有一个目标时不需要线程池
+        return [writeTarget(targets[0][0], targets[0][1], data)]
+
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=min(len(targets), MAX_WORKERS),
+                                                      thread_name_prefix="fanout")
+    futures: list[Future] = [executor.submit(writeTarget, kind, path, data) for kind, path in targets]
+    wait(futures, timeout=timeout)
+    executor.shutdown(wait=False)                                       # 不等待超时的目标
+
+    results: list[dict[str, Any]] = []
+    for (kind, path), future in zip(targets, futures):
+        if future.done():
+            results.append(future.result())
+        else:
+            results.append({"kind": kind, "path": path, "status": "timeout",
+                            "error": f"{timeout} 秒内未完成, 将在后台继续写入", "ms": round(timeout * 1000, 3)})
+
+    return results
+
+def logResults(results: list[dict[str, Any]]) -> None:
+    """
+    输出每个目标的写入结果
+    """
+
+    for result in results:
+        if result["status"] == "ok":
+            logger.success(f"[{result['kind']}] 已写入 '{result['path']}'({result['ms']:.2f} ms)")
+        else:
+            logger.error(f"[{result['kind']}] 写入 '{result['path']}' 失败({result['status']}): {result['error']}")
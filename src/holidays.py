@@ -0,0 +1,166 @@
+# file: holidays.py
+# brief: 节假日/调休日历, 按日期区间保存特殊安排, 二分查找某一天是否需要特殊处理
+# time: 2026.10.17
+# TODOs:
+#   暂无
+#
+# 节假日文件(./data/holidays.json, 可选)格式如下, end可省略(即只有一天), 日期均包含在内:
+#   {
+#       "exceptions": [
+#           {"name": "国庆节", "start": "2026-10-01", "end": "2026-10-07", "noClass": true},   <- 放假, 不上课
+#           {"name": "国庆调休", "start": "2026-10-11", "weekday": 4},                       <- 周日上周五的课
+#           {"name": "补周六课", "start": "2026-10-17", "weekCount2": 2}                     <- 按三周轮换的第3周上课
+#       ]
+#   }
+# weekday: 执行周几的课表(0-5, 0=周一), weekCount1/weekCount2: 按单双周/三周轮换的第几周(从0开始)执行,
+# weekCount2需小于三周轮换的周期(默认为3, 见rotation.py中的规则文件),
+# 三者可以同时指定, 未指定的项按当天实际的日期计算
+
+from   bisect   import bisect_right
+from   rotation import DEFAULT_PERIOD_2
+from   typing   import Any, Optional
+from   loguru   import logger
+import datetime, json
+
+HOLIDAYS_FILE_PATH: str = "./data/holidays.json"
+
+
+class DayOverride:
+    """
+    一段日期的特殊安排
+    """
+
+    name: str
+    start: datetime.date
+    end: datetime.date                                                  # 包含在内
+    noClass: bool                                                       # 不上课
+    weekday: Optional[int]                                              # 执行周几的课表, None为按实际日期
+    weekCount1: Optional[int]                                           # 单双周数, None为按实际日期
+    weekCount2: Optional[int]                                           # 三周周数(0 ~ 周期-1), None为按实际日期
+
+    def __init__(self, name: str, start: datetime.date, end: datetime.date, noClass: bool = False,
+                 weekday: Optional[int] = None, weekCount1: Optional[int] = None, weekCount2: Optional[int] = None,
+                 weekPeriod2: int = DEFAULT_PERIOD_2) -> None:
+        if end < start:
+            raise ValueError(f"'{name}' 的结束日期早于开始日期")
+        if not noClass and weekday is None and weekCount1 is None and weekCount2 is None:
+            raise ValueError(f"'{name}' 没有指定 noClass/weekday/weekCount1/weekCount2 中的任何一项")
+        if weekday is not None and not 0 <= weekday <= 5:
+            raise ValueError(f"'{name}' 的weekday需在0-5之间")
+        if weekCount1 is not None and not 0 <= weekCount1 <= 1:
+            raise ValueError(f"'{name}' 的weekCount1需在0-1之间")
+        if weekCount2 is not None and not 0 <= weekCount2 < weekPeriod2:
+            raise ValueError(f"'{name}' 的weekCount2需在0-{weekPeriod2 - 1}之间(三周轮换的周期为 {weekPeriod2} 周)")
+
+        self.name = name
+        self.start = start
+        self.end = end
+        self.noClass = noClass
+        self.weekday = weekday
+        self.weekCount1 = weekCount1
+        self.weekCount2 = weekCount2
+
+    @classmethod
+    def fromDict(cls, data: dict[str, Any], weekPeriod2: int = DEFAULT_PERIOD_2) -> "DayOverride":
+        """
+        从节假日文件中的一项创建
+
+        Args:
+            data (dict[str, Any]): 节假日文件中的一项
+            weekPeriod2 (int, optional): 三周轮换的周期, 见rotation.weekPeriod2. Defaults to DEFAULT_PERIOD_2.
+
+        Raises:
+            KeyError, ValueError, TypeError: 格式不正确
+        """
+
+        def optionalInt(key: str) -> Optional[int]:
+            return int(data[key]) if data.get(key) is not None else None
+
+        start: datetime.date = datetime.date.fromisoformat(data["start"])
+        end: datetime.date = datetime.date.fromisoformat(data["end"]) if "end" in data else start
+        return cls(str(data.get("name", "")), start, end, bool(data.get("noClass", False)),
+                   optionalInt("weekday"), optionalInt("weekCount1"), optionalInt("weekCount2"), weekPeriod2)
+
+
+class HolidayCalendar:
+    """
+    节假日/调休日历, 区间按开始日期排序且互不重叠, 查询为O(log n)
+    """
+
+    starts: list[int]                                                   # 每个区间开始日期的序数(date.toordinal())
+    ends: list[int]                                                     # 每个区间结束日期的序数
+    overrides: list[DayOverride]
+
+    def __init__(self, overrides: Optional[list[DayOverride]] = None) -> None:
+        """
+        初始化, 与之前的区间重叠的区间会被跳过
+
+        Args:
+            overrides (list[DayOverride], optional): 特殊安排. Defaults to None.
+        """
+
+        self.starts = []
+        self.ends = []
+        self.overrides = []
+
+        for override in sorted(overrides or [], key=lambda o: o.start):
+            if len(self.ends) > 0 and override.start.toordinal() <= self.ends[-1]:
+                logger.warning(f"'{override.name}' ({override.start} ~ {override.end}) 与 "
+                               f"'{self.overrides[-1].name}' 的日期重叠, 已跳过")
+                continue
+            self.starts.append(override.start.toordinal())
+            self.ends.append(override.end.toordinal())
+            self.overrides.append(override)
+
+    def __len__(self) -> int:
+        return len(self.overrides)
+
+    def resolve(self, date: datetime.date) -> Optional[DayOverride]:
+        """
+        查询某一天的特殊安排
+
+        Args:
+            date (datetime.date): 日期
+
+        Returns:
+            Optional[DayOverride]: 特殊安排, 没有时为None
+        """
+
+        ordinal: int = date.toordinal()
+        i: int = bisect_right(self.starts, ordinal) - 1
+        if i >= 0 and ordinal <= self.ends[i]:
+            return self.overrides[i]
+        return None
+
+
+def loadHolidays(filePath: str = HOLIDAYS_FILE_PATH, weekPeriod2: int = DEFAULT_PERIOD_2) -> HolidayCalendar:
+    """
+    读取节假日文件, 文件不存在时返回空日历, 格式错误的项会被跳过
+
+    Args:
+        filePath (str, optional): 节假日文件路径. Defaults to HOLIDAYS_FILE_PATH.
+        weekPeriod2 (int, optional): 三周轮换的周期, 用于检查weekCount2的范围, 见rotation.weekPeriod2. Defaults to DEFAULT_PERIOD_2.
+
+    Returns:
+        HolidayCalendar: 节假日日历
+    """
+
+    try:
+        with open(filePath, "r", encoding="utf-8") as holidaysFile:
+            data: dict = json.load(holidaysFile)
+    except FileNotFoundError:
+        return HolidayCalendar()
+    except ValueError:
+        logger.error(f"节假日文件 '{filePath}' 不是有效的json文件")
+        return HolidayCalendar()
+
+    overrides: list[DayOverride] = []
+    for entry in data.get("exceptions", []):
+        try:
+            overrides.append(DayOverride.fromDict(entry, weekPeriod2))
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning(f"节假日 {entry} 格式错误, 已跳过: {e}")
+
+    calendar: HolidayCalendar = HolidayCalendar(overrides)
+    logger.info(f"读取节假日文件 '{filePath}' 完成, 共 {len(calendar)} 项")
+    return calendar
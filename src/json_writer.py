@@ -3,14 +3,17 @@
 # time: 2025.8.9
 # TODOs:
 #   1. 读取json文件并比较和已有课表的区别
-#   2. 对应读取和修改Default.json.bak, 防止ClassIsland不信任课表
 
-import pickle   # TODO: 写保存模块, 避免使用pickle
-import time, datetime, math, uuid, os, orjson
-from class_manager import TimePeriod, TimeTable, SingleClass, ClassTable
-from mytime import MyTime
+import fanout, store, validator
+import time, datetime, uuid, os, orjson, json, hashlib
+from class_manager import TimePeriod, TimeTable, SingleClass, ClassTable, DaySchedule
+from calendar_index import LAYOUT_KEYS, layoutIndex
+from typing import Any, Callable, Iterable, Optional, TYPE_CHECKING
 from loguru import logger
 
+if TYPE_CHECKING:                                                       # 只用于类型标注, 运行时不导入Qt
+    from mytime import MyTime
+
 # 全部课程的列表
 ALL_CLASSES: list[str] = ["语文", "数学", "外语", "物理", "化学", "政治", "历史", "地理", "生物", "体育", 
                           "心理", "研究", "自习", "社团", "通用技术", "班会", "信息技术", "音乐"]
@@ -107,6 +110,12 @@ ATTACHED_OBJECTS_3E: dict = {
                     }
                 }
 
+# 预先序列化好的AttachedObjects, 直接嵌入输出的json中, 避免每个时间段/课程都重新序列化一遍
+# 与profileDigest一致, 按键名排序序列化
+ATTACHED_OBJECTS_2_FRAGMENT: orjson.Fragment  = orjson.Fragment(orjson.dumps(ATTACHED_OBJECTS_2, option=orjson.OPT_SORT_KEYS))
+ATTACHED_OBJECTS_3B_FRAGMENT: orjson.Fragment = orjson.Fragment(orjson.dumps(ATTACHED_OBJECTS_3B, option=orjson.OPT_SORT_KEYS))
+ATTACHED_OBJECTS_3E_FRAGMENT: orjson.Fragment = orjson.Fragment(orjson.dumps(ATTACHED_OBJECTS_3E, option=orjson.OPT_SORT_KEYS))
+
 
 def time2str_hm(time: list[int]) -> str:
     """
@@ -129,6 +138,63 @@ def time2str_hm(time: list[int]) -> str:
     
     return hour + ":" + min
 
+# 每次生成都会变化的字段(时间戳), 比较课表配置文件内容时忽略
+VOLATILE_KEYS: tuple[str, ...]      = ("TempClassPlanSetupTime", "TempClassPlanGroupExpireTime")   # 最外层字典中的
+VOLATILE_PLAN_KEYS: tuple[str, ...] = ("OverlaySetupTime", )                                       # ClassPlans各项中的
+
+def profileDigest(profile: dict) -> str:
+    """
+    计算课表配置文件内容的哈希值, 忽略VOLATILE_KEYS等每次都会变化的字段
+
+    Args:
+        profile (dict): 课表配置文件的最外层字典
+
+    Returns:
+        str: sha256哈希值(16进制)
+    """
+
+    stable: dict = {key: value for key, value in profile.items() if key not in VOLATILE_KEYS}
+
+    classPlans = profile.get("ClassPlans")
+    if isinstance(classPlans, dict):
+        stable["ClassPlans"] = {
+            planId: {key: value for key, value in plan.items() if key not in VOLATILE_PLAN_KEYS}
+            for planId, plan in classPlans.items()
+        }
+
+    return hashlib.sha256(orjson.dumps(stable, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def uuidFingerprint(assignedUUID: dict[str, uuid.UUID]) -> str:
+    """
+    计算已分配uuid的指纹
+
+    Args:
+        assignedUUID (dict[str, uuid.UUID]): 已分配的uuid
+
+    Returns:
+        str: sha1哈希值(16进制)
+    """
+
+    return hashlib.sha1(orjson.dumps({key: str(value) for key, value in assignedUUID.items()},
+                                     option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def timeTableFingerprint(timeTable: TimeTable) -> str:
+    """
+    计算时间表内容的指纹
+
+    Args:
+        timeTable (TimeTable): 时间表
+
+    Returns:
+        str: sha1哈希值(16进制)
+    """
+
+    data: list = [
+        [[tp.startMinute, tp.finishMinute, tp.timeType] for tp in timeList]
+        for timeList in (timeTable.normTimeList1, timeTable.normTimeList2, timeTable.satTimeList1, timeTable.satTimeList2)
+    ]
+    return hashlib.sha1(orjson.dumps(data)).hexdigest()
+
 def to2digits(input: int) -> str:
     """
     把数字转换为两位
@@ -153,7 +219,7 @@ class JsonManager:
     Json配置文件读写模块
     """
 
-    myTime: MyTime
+    myTime: "MyTime"
     
     assignedUUID: dict[str, uuid.UUID] = {}                             # 为课程分配的uuid
     # UUID包括:
@@ -162,16 +228,42 @@ class JsonManager:
 
     overAllDict: dict = {}                                              # 整个课表文件的字典
 
+    fullCycle: bool = False                                             # 是否生成完整轮换周期的课表(否则只生成今日课表)
+
+    digestFilePath: str = "./data/profile_digest.json"                  # 已写入配置文件的哈希记录, 为""时每次都读取已有文件比较
+
+    # 除主配置文件外的写入目标, 见fanout模块
+    backup: bool = False                                                # 同时写入Default.json.bak
+    archiveDir: str = ""                                                # 归档目录, 为""时不归档
+    shareDirs: list[str] = []                                           # 共享目录
+    writeTimeout: float = fanout.DEFAULT_TIMEOUT                        # 等待所有目标写入的最长时间(秒)
+    lastWriteResults: list[dict[str, Any]] = []                         # 上一次写入时每个目标的结果
+    lastIssues: list[validator.Issue] = []                              # 上一次生成时校验发现的问题
+
+    # 预先序列化的TimeLayouts/Subjects, 键为(段名, 指纹), 同一进程内的所有实例共用
+    # (批量生成时同一时间表的班级可以直接复用)
+    fragmentCache: dict[tuple[str, str], orjson.Fragment] = {}
+    FRAGMENT_CACHE_SIZE: int = 64
+
     error: bool = False
 
-    def __init__(self, myTime: MyTime, uuidFilePath: str = "./data/uuid.cic") -> None:
+    def __init__(self, myTime: "MyTime", uuidFilePath: str = "./data/uuid.cic",
+                 assignedUUID: Optional[dict[str, uuid.UUID]] = None) -> None:
         """
         初始化
 
         Args:
             uuidFilePath (str, optional): uuid文件的路径. Defaults to "./data/uuid.cic".
+            assignedUUID (dict[str, uuid.UUID], optional): 已分配好的uuid, 传入时直接使用且不读写uuid文件
+                (批量生成时由主进程统一分配, 避免多个进程同时写同一个文件). Defaults to None.
         """
         self.myTime = myTime
+        self.assignedUUID = {}
+        self.overAllDict  = {}
+
+        if assignedUUID is not None:
+            self.assignedUUID = dict(assignedUUID)
+            return
         
         # 读取课程uuid, 如果不存在就新分配
         if not os.path.exists(uuidFilePath):
@@ -180,14 +272,16 @@ class JsonManager:
             self.assignUUID()
 
             # 保存到文件中
-            with open(uuidFilePath, "wb") as uf:
-                pickle.dump(self.assignedUUID, uf)
+            store.saveUUIDMap(uuidFilePath, self.assignedUUID)
         else:
-            # 加载先前的uuid
-            with open(uuidFilePath, "rb") as uf:
-                self.assignedUUID = pickle.load(uf)
+            # 加载先前的uuid(旧版本的pickle文件会被自动迁移)
+            uuidMap = store.loadUUIDMap(uuidFilePath)
+            if uuidMap is None:
+                logger.warning("UUID文件读取失败, 将重新分配缺失的UUID")
+            else:
+                self.assignedUUID = uuidMap
         
-        self.checkRepairUUID()
+        self.checkRepairUUID(uuidFilePath)
             
         return
     
@@ -249,8 +343,7 @@ class JsonManager:
             tmp = 1
 
         # 保存到文件中
-        with open(uuidFilePath, "wb") as uf:
-            pickle.dump(self.assignedUUID, uf)
+        store.saveUUIDMap(uuidFilePath, self.assignedUUID)
 
         if tmp == 1:
             logger.success(f"检查/修复UUID完成, 新的UUID文件将被写入到 '{uuidFilePath}'")
@@ -277,7 +370,7 @@ class JsonManager:
             d["Initial"] = _class[0]
             d["TeacherName"] = ""
             d["IsOutDoor"] = True if _class == "体育" else False
-            d["AttachedObjects"] = ATTACHED_OBJECTS_2
+            d["AttachedObjects"] = ATTACHED_OBJECTS_2_FRAGMENT
             d["IsActive"] = False
             
             retDict[str(self.assignedUUID.get(_class))] = d             # 子字典写入总字典
@@ -306,7 +399,7 @@ class JsonManager:
         retDict["DefaultClassId"] = ""
         retDict["BreakName"] = ""
         retDict["ActionSet"] = None
-        retDict["AttachedObjects"] = ATTACHED_OBJECTS_3E if lastTpInDay else ATTACHED_OBJECTS_3B
+        retDict["AttachedObjects"] = ATTACHED_OBJECTS_3E_FRAGMENT if lastTpInDay else ATTACHED_OBJECTS_3B_FRAGMENT
         retDict["IsActive"] = False
 
         return retDict
@@ -399,6 +492,41 @@ class JsonManager:
 
         return retDict
     
+    def cachedFragment(self, section: str, fingerprint: str, build: Callable[[], dict]) -> orjson.Fragment:
+        """
+        获取预先序列化的一段json, 缓存中没有时调用build生成并序列化
+
+        Args:
+            section (str): 段名, 如"TimeLayouts"
+            fingerprint (str): 生成这一段所用数据的指纹
+            build (Callable[[], dict]): 生成这一段字典的函数
+
+        Returns:
+            orjson.Fragment: 序列化后的json片段
+        """
+
+        key: tuple[str, str] = (section, fingerprint)
+        fragment: Optional[orjson.Fragment] = self.fragmentCache.get(key)
+        if fragment is not None:
+            logger.debug(f"{section} 命中缓存")
+            return fragment
+
+        if len(self.fragmentCache) >= self.FRAGMENT_CACHE_SIZE:
+            self.fragmentCache.clear()
+
+        # 按键名排序序列化, 使profileDigest的结果与从文件读回的内容一致
+        fragment = orjson.Fragment(orjson.dumps(build(), option=orjson.OPT_SORT_KEYS))
+        self.fragmentCache[key] = fragment
+        return fragment
+
+    def invalidateFragmentCache(self) -> None:
+        """
+        清空预先序列化的TimeLayouts/Subjects缓存(导入课表/时间表后调用)
+        """
+
+        self.fragmentCache.clear()
+        logger.debug("JsonManager.invalidateFragmentCache called!")
+
     def singleClass2Dict(self, singleClass: SingleClass) -> dict:
         """
         单节课转换为列表
@@ -423,7 +551,54 @@ class JsonManager:
 
         return retDict
 
-    def classPlan2Dict(self, classTable: ClassTable, myTime: MyTime) -> dict:
+    def singleClassPlan2Dict(self, classes: Iterable[SingleClass], timeLayoutUUID: str, weekDay: int, name: str,
+                             curDateTime: datetime.datetime, weekCountDiv: int = 0, weekCountDivTotal: int = 0) -> dict:
+        """
+        单个课程计划输出到字典(对应ClassPlans中的一项)
+
+        Args:
+            classes (Iterable[SingleClass]): 课程计划中的课程
+            timeLayoutUUID (str): 使用的时间表uuid
+            weekDay (int): 周几(0-6, 0=周一)
+            name (str): 课程计划名称
+            curDateTime (datetime.datetime): 当前时间, 用于写入OverlaySetupTime
+            weekCountDiv (int, optional): 在轮换周期中的第几周(从1开始), 0为不轮换. Defaults to 0.
+            weekCountDivTotal (int, optional): 轮换周期的总周数, 0为不轮换. Defaults to 0.
+
+        Returns:
+            dict: 课程计划字典
+        """
+
+        subDict: dict = {}
+
+        subDict["TimeLayoutId"] = timeLayoutUUID
+        
+        timeRuleDict: dict = {}
+        # 周一-周六对应1-6, 周日=0
+        timeRuleDict["WeekDay"] = weekDay + 1 if weekDay != 6 else 0
+        timeRuleDict["WeekCountDiv"] = weekCountDiv
+        timeRuleDict["WeekCountDivTotal"] = weekCountDivTotal
+        timeRuleDict["IsActive"] = False
+
+        subDict["TimeRule"] = timeRuleDict
+
+        classesList: list = []
+        for singleClass in classes:
+            classesList.append(self.singleClass2Dict(singleClass=singleClass))
+
+        subDict["Classes"] = classesList
+        subDict["Name"] = name
+        subDict["IsOverlay"] = False
+        subDict["OverlaySourceId"] = None
+        subDict["OverlaySetupTime"] = "20" + (curDateTime.strftime("%y-%m-%dT%H:%M:%S.000000+08:00"))
+        subDict["IsEnabled"] = True
+        subDict["AssociatedGroup"] = "00000000-0000-0000-0000-000000000000"
+        subDict["AttachedObjects"] = ATTACHED_OBJECTS_3E_FRAGMENT
+        subDict["IsActive"] = False
+
+        return subDict
+
+    def classPlan2Dict(self, classTable: ClassTable, myTime: "MyTime") -> dict:
         """
         课程计划输出到字典(对应json文件中ClassPlans后的整个字典)
 
@@ -450,67 +625,121 @@ class JsonManager:
         #     }
         # }
         retDict: dict = {}
-        subDict: dict = {}
 
         if len(classTable.classTableToday) == 0:
             logger.warning("今日课表为空, 暂停写入课表")
             return {}
 
-        # 先把时间计算明白
-        time_20250707: int = 1751817600                                 # 以2025/07/07 00:00:00为时间基准(此时为单周)
-        timenow: int  = int(time.time())                                # 当前的时间戳
-        curDateTime = datetime.datetime.now()
-        secdiff: int = timenow - time_20250707
-
-        SEC_PER_DAY: int = 86400
-        daydiff = math.ceil(secdiff / SEC_PER_DAY)                      # 差的天数
-
-        weekcount1 = ((daydiff % 2) + myTime.weekOffset1) % 2           # 单双周
-        weekcount2 = ((daydiff % 3) + myTime.weekOffset2) % 3           # 3周轮换
-
-        timeLayoutUUID: str = ""                                        # TimeLayout uuid
-
-        if   weekcount1 == 0 and curDateTime.weekday() != 5:            # 单周, 非周六
-            timeLayoutUUID = str(self.assignedUUID.get("平日-单"))
-        elif weekcount1 == 0 and curDateTime.weekday() == 5:
-            timeLayoutUUID = str(self.assignedUUID.get("周六-单"))
-        elif weekcount1 == 1 and curDateTime.weekday() != 5:
-            timeLayoutUUID = str(self.assignedUUID.get("平日-双"))
-        elif weekcount1 == 1 and curDateTime.weekday() == 5:
-            timeLayoutUUID = str(self.assignedUUID.get("周六-双"))
-        else:                                                           # 理论上讲永远不会触发这个else, 但也是理论
-            logger.critical("Man! What can I say! 如果你看到了这条报错, 那我只能说这已经无法用逻辑解释了(因为elif这个分支永远不会触发)")
-            timeLayoutUUID = ""
-        
-        subDict["TimeLayoutId"] = timeLayoutUUID
-        
-        timeRuleDict: dict = {}
-        # 周一-周六对应1-6, 周日=0
-        timeRuleDict["WeekDay"] = curDateTime.weekday() + 1 if curDateTime.weekday() != 6 else 0
-        timeRuleDict["WeekCountDiv"] = 0
-        timeRuleDict["WeekCountDivTotal"] = 0
-        timeRuleDict["IsActive"] = False
+        # 从日历索引查询今天的信息
+        curDateTime = myTime.clock.now()
+        today = myTime.calendar.lookup(curDateTime.date())
 
-        subDict["TimeRule"] = timeRuleDict
+        timeLayoutUUID: str = str(self.assignedUUID.get(today.layoutKey))   # TimeLayout uuid
 
-        classesList: list = []
-        for singleClass in classTable.classTableToday:
-            classesList.append(self.singleClass2Dict(singleClass=singleClass))
+        retDict[str(self.assignedUUID.get("今日课表"))] = self.singleClassPlan2Dict(
+            classTable.classTableToday, timeLayoutUUID, today.weekday, "今日课表", curDateTime
+        )
 
-        subDict["Classes"] = classesList
-        subDict["Name"] = "今日课表"
-        subDict["IsOverlay"] = False
-        subDict["OverlaySourceId"] = None
-        subDict["OverlaySetupTime"] = "20" + (curDateTime.strftime("%y-%m-%dT%H:%M:%S.000000+08:00"))
-        subDict["IsEnabled"] = True
-        subDict["AssociatedGroup"] = "00000000-0000-0000-0000-000000000000"
-        subDict["AttachedObjects"] = ATTACHED_OBJECTS_3E
-        subDict["IsActive"] = False
+        return retDict
 
-        retDict[str(self.assignedUUID.get("今日课表"))] = subDict
+    def cycleClassPlans2Dict(self, classTable: ClassTable, myTime: "MyTime") -> dict:
+        """
+        输出完整轮换周期的课程计划(对应ClassPlans后的整个字典)
+        每个(周期内第几周, 周一-周六)对应一个课程计划, 写入一次即可在整个学期内使用
+
+        注意: ClassIsland中需要把多周轮换设置为 myTime.calendar.cycleWeeks 周(默认为6周), 并使第1周与2025/07/07所在周对齐
+
+        Args:
+            classTable (ClassTable): 课表
+            myTime (MyTime): 时间实例
+
+        Returns:
+            dict: ClassPlans后的整个字典, 课表不完整时返回空字典
+        """
+
+        retDict: dict = {}
+        curDateTime = myTime.clock.now()
+        LDAYINWEEK: list[str] = ["周一", "周二", "周三", "周四", "周五", "周六"]
+
+        cycleWeeks: int = myTime.calendar.cycleWeeks
+        for cycleWeek in range(cycleWeeks):
+            weekCount1, weekCount2 = myTime.calendar.cycleWeekCounts(cycleWeek)
+            for weekDay in range(6):
+                classes: DaySchedule = classTable.getClassTableOfDay(weekDay, weekCount2)
+                if len(classes) == 0:
+                    logger.warning(f"第{cycleWeek + 1}周{LDAYINWEEK[weekDay]}的课表为空, 暂停写入课表")
+                    return {}
+
+                timeLayoutUUID: str = str(self.assignedUUID.get(LAYOUT_KEYS[layoutIndex(weekDay, weekCount1)]))
+                # 课程计划uuid由"今日课表"的uuid派生, 保证每次生成都一致, 不需要额外保存
+                planUUID: str = str(uuid.uuid5(self.assignedUUID["今日课表"], f"cycle-{cycleWeek}-{weekDay}"))
+
+                retDict[planUUID] = self.singleClassPlan2Dict(
+                    classes, timeLayoutUUID, weekDay, f"第{cycleWeek + 1}周-{LDAYINWEEK[weekDay]}", curDateTime,
+                    weekCountDiv=cycleWeek + 1, weekCountDivTotal=cycleWeeks
+                )
 
         return retDict
 
+    def validateClassPlans(self, classPlans: dict, timeTable: TimeTable) -> list[validator.Issue]:
+        """
+        校验课程计划用到的时间表, 以及每个课程计划的课程数是否与时间表的上课时间段数一致
+
+        Args:
+            classPlans (dict): ClassPlans后的整个字典
+            timeTable (TimeTable): 时间表
+
+        Returns:
+            list[validator.Issue]: 发现的问题
+        """
+
+        layoutKeys: dict[str, str] = {str(self.assignedUUID.get(key)): key for key in LAYOUT_KEYS if key != ""}
+
+        issues: list[validator.Issue] = []
+        usedLayouts: set[str] = set()
+        for plan in classPlans.values():
+            layoutKey: str = layoutKeys.get(plan["TimeLayoutId"], "")
+            usedLayouts.add(layoutKey)
+            issues.extend(validator.validateClassCount(len(plan["Classes"]), timeTable, layoutKey, plan["Name"]))
+
+        # 没有用到的时间表(如只生成平日课表时的周六时间表)有问题也不影响写入
+        return [issue for issue in validator.validateTimeTable(timeTable) if issue.where in usedLayouts] + issues
+
+    def setFullCycle(self, fullCycle: bool) -> None:
+        """
+        设置是否生成完整轮换周期的课表
+
+        Args:
+            fullCycle (bool): 是否生成完整轮换周期的课表
+        """
+
+        self.fullCycle = fullCycle
+        logger.debug(f"JsonManager.setFullCycle called! fullCycle: {fullCycle}")
+
+        # 完整轮换周期的课表按周数循环, 不含具体日期, 无法表示节假日/调休
+        holidayCount: int = len(self.myTime.calendar.holidays)
+        if fullCycle and holidayCount > 0:
+            logger.warning(f"已开启完整轮换周期生成, 节假日文件中的 {holidayCount} 项节假日/调休不会体现在生成的课表中")
+
+    def setOutputTargets(self, backup: bool = False, archiveDir: str = "", shareDirs: Optional[list[str]] = None,
+                         writeTimeout: float = fanout.DEFAULT_TIMEOUT) -> None:
+        """
+        设置除主配置文件外的写入目标
+
+        Args:
+            backup (bool, optional): 是否同时写入Default.json.bak. Defaults to False.
+            archiveDir (str, optional): 归档目录, 为""时不归档. Defaults to "".
+            shareDirs (list[str], optional): 共享目录. Defaults to None.
+            writeTimeout (float, optional): 等待所有目标写入的最长时间(秒). Defaults to fanout.DEFAULT_TIMEOUT.
+        """
+
+        self.backup = backup
+        self.archiveDir = archiveDir
+        self.shareDirs = list(shareDirs) if shareDirs is not None else []
+        self.writeTimeout = writeTimeout
+        logger.debug(f"JsonManager.setOutputTargets called! backup: {backup}, archiveDir: '{archiveDir}', "
+                     f"shareDirs: {self.shareDirs}, writeTimeout: {writeTimeout}")
+
     def generateOverAllDict(self, classTable: ClassTable, timeTable: TimeTable) -> None:
         """
         最外层整个字典
@@ -520,23 +749,39 @@ class JsonManager:
         """
 
         retDict: dict = {}
+        self.lastIssues = []
 
-        curDateTime = datetime.datetime.now()
-        if curDateTime.weekday() == 6:
+        curDateTime = self.myTime.clock.now()
+        if not self.fullCycle and self.myTime.calendar.noClass(curDateTime.date()):
             # TODO: 处理无课显示
             return
 
         retDict["Name"] = ""
 
         # 进行检查
-        if self.classPlan2Dict(classTable, self.myTime) == {}:
+        if self.fullCycle:
+            classPlans: dict = self.cycleClassPlans2Dict(classTable, self.myTime)
+        else:
+            classPlans = self.classPlan2Dict(classTable, self.myTime)
+        if classPlans == {}:
             logger.error("写入课表配置文件终止")
             self.overAllDict = {}
             return
 
-        retDict["TimeLayouts"] = self.timeLayouts2Dict(timeTable)
-        retDict["ClassPlans"] = self.classPlan2Dict(classTable, self.myTime)
-        retDict["Subjects"] = self.subject2Dict()
+        # 校验用到的时间表和每个课程计划的课程数, 有错误时不写入
+        self.lastIssues = self.validateClassPlans(classPlans, timeTable)
+        validator.logIssues(self.lastIssues, "生成课表配置")
+        if len(validator.errorsOf(self.lastIssues)) > 0:
+            logger.error("课表/时间表校验未通过, 写入课表配置文件终止")
+            self.overAllDict = {}
+            return
+
+        # TimeLayouts和Subjects只在时间表/uuid变化时才需要重新生成, 每次只生成ClassPlans
+        uuidFp: str = uuidFingerprint(self.assignedUUID)
+        retDict["TimeLayouts"] = self.cachedFragment("TimeLayouts", timeTableFingerprint(timeTable) + uuidFp,
+                                                     lambda: self.timeLayouts2Dict(timeTable))
+        retDict["ClassPlans"] = classPlans
+        retDict["Subjects"] = self.cachedFragment("Subjects", uuidFp, self.subject2Dict)
         retDict["IsOverlayClassPlanEnabled"] = False
         retDict["OverlayClassPlanId"] = None
         retDict["TempClassPlanId"] = None
@@ -566,23 +811,133 @@ class JsonManager:
 
         return
 
-    def writeJsonFile(self, filePath: str = "./output/Default.json") -> None:
+    def loadDigestRecords(self) -> dict[str, dict]:
+        """
+        读取已写入配置文件的哈希记录
+
+        Returns:
+            dict[str, dict]: 键为配置文件的绝对路径, 值含有digest, size, mtime_ns三项
+        """
+
+        if self.digestFilePath == "":
+            return {}
+
+        try:
+            with open(self.digestFilePath, "r", encoding="utf-8") as digestFile:
+                return json.load(digestFile)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning(f"哈希记录文件 '{self.digestFilePath}' 损坏, 将重新生成")
+            return {}
+
+    def saveDigestRecord(self, filePath: str, digest: str) -> None:
         """
-        写入Json配置文件
+        保存一个配置文件的哈希记录(需在写入文件之后调用, 会一并记录文件大小和修改时间)
 
         Args:
-            filePath (str, optional): 输出路径. Defaults to "./output/Default.json".
+            filePath (str): 配置文件路径
+            digest (str): 配置文件内容的哈希值
         """
 
-        if self.overAllDict == {}:
+        if self.digestFilePath == "":
             return
-        
-        logger.info(f"开始将课表配置文件写入到 '{filePath}'")
 
-        with open(filePath, "wb") as jsonFile:
-            jsonFile.write(orjson.dumps(self.overAllDict))
+        records: dict[str, dict] = self.loadDigestRecords()
+        stat = os.stat(filePath)
+        records[os.path.abspath(filePath)] = {"digest": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
 
-        logger.success("成功写入课表配置文件")
+        with open(self.digestFilePath, "wb") as digestFile:
+            digestFile.write(orjson.dumps(records))
 
-        return
-    
\ No newline at end of file
+    def existingDigest(self, filePath: str) -> tuple[Optional[str], str]:
+        """
+        获取已有配置文件内容的哈希值
+        文件大小和修改时间与哈希记录一致时直接使用记录, 否则读取文件重新计算
+
+        Args:
+            filePath (str): 配置文件路径
+
+        Returns:
+            tuple[Optional[str], str]: 哈希值(文件不存在或无法解析时为None), 哈希值来源("record"/"file"/"")
+        """
+
+        try:
+            stat = os.stat(filePath)
+        except FileNotFoundError:
+            return (None, "")
+
+        record: Optional[dict] = self.loadDigestRecords().get(os.path.abspath(filePath))
+        if record is not None and record.get("size") == stat.st_size and record.get("mtime_ns") == stat.st_mtime_ns:
+            return (record.get("digest"), "record")
+
+        try:
+            with open(filePath, "rb") as jsonFile:
+                existing = orjson.loads(jsonFile.read())
+        except (OSError, orjson.JSONDecodeError):
+            logger.warning(f"无法读取/解析已有的课表配置文件 '{filePath}', 将直接覆盖")
+            return (None, "")
+
+        if not isinstance(existing, dict):
+            return (None, "")
+
+        return (profileDigest(existing), "file")
+
+    def writeJsonFile(self, filePath: str = "./output/Default.json", force: bool = False) -> bool:
+        """
+        写入Json配置文件, 内容(忽略时间戳等字段)与已有文件一致时跳过写入, 避免ClassIsland重新加载课表
+        设置了.bak/归档/共享目录时只序列化一次, 并发写入所有目标, 每个目标的结果见lastWriteResults
+
+        Args:
+            filePath (str, optional): 主配置文件路径. Defaults to "./output/Default.json".
+            force (bool, optional): 是否无论内容是否变化都写入. Defaults to False.
+
+        Returns:
+            bool: 是否写入了主配置文件
+        """
+
+        self.lastWriteResults = []
+        if self.overAllDict == {}:
+            return False
+        
+        logger.info(f"开始将课表配置文件写入到 '{filePath}'")
+
+        start = time.perf_counter()
+        newDigest: str = profileDigest(self.overAllDict)
+        oldDigest, source = self.existingDigest(filePath)
+        hashTime: float = (time.perf_counter() - start) * 1000
+
+        targets: list[tuple[str, str]] = fanout.buildTargets(filePath, self.backup, self.archiveDir, self.shareDirs)
+        unchanged: bool = not force and oldDigest == newDigest
+        if unchanged:
+            # 主配置文件未变化时不归档, 只重写缺失, 过期或损坏的副本(如新挂载的共享目录)
+            targets = [(kind, path) for kind, path in targets[1:]
+                       if kind != fanout.TARGET_ARCHIVE and self.existingDigest(path)[0] != newDigest]
+            logger.info(f"课表配置文件内容未变化, 跳过写入(哈希来源: {source}, 比较耗时 {hashTime:.2f} ms)")
+            if len(targets) == 0:
+                return False
+
+        start = time.perf_counter()
+        data: bytes = orjson.dumps(self.overAllDict)
+        self.lastWriteResults = fanout.fanOutWrite(targets, data, self.writeTimeout)
+        writeTime: float = (time.perf_counter() - start) * 1000
+
+        if len(self.lastWriteResults) > 1 or unchanged:
+            fanout.logResults(self.lastWriteResults)
+
+        # 副本也记录哈希, 下次比较时不必重新读取解析(归档文件名每次不同, 不记录)
+        for result in self.lastWriteResults:
+            if result["status"] == "ok" and result["kind"] != fanout.TARGET_ARCHIVE:
+                self.saveDigestRecord(result["path"], newDigest)
+
+        if unchanged:
+            return False
+
+        primary: dict[str, Any] = self.lastWriteResults[0]
+        if primary["status"] != "ok":
+            logger.error(f"写入课表配置文件 '{filePath}' 失败: {primary['error']}")
+            return False
+
+        logger.success(f"成功写入课表配置文件(哈希比较耗时 {hashTime:.2f} ms, 写入耗时 {writeTime:.2f} ms)")
+
+        return True
@@ -4,10 +4,81 @@
 # TODOs:
 #   暂无
 
-from PyQt5.QtCore import pyqtSignal, QThread
+from PyQt5.QtCore import pyqtSignal, QObject, QThread, QTimer, Qt
+from clock        import Clock, SYSTEM_CLOCK
 from eventbus     import EventBus
+from silent       import outPathFromSettings
+from typing       import Callable, Optional
 from loguru       import logger
-import time
+import datetime, heapq, itertools
+
+MAX_SLEEP_MS: int = 3600 * 1000                                         # 最长休眠时间, 防止系统休眠/修改时间后错过截止时间
+
+
+class Scheduler(QObject):
+    """
+    截止时间调度器, 只在最近的截止时间到达时唤醒一次, 空闲时不占用CPU
+    需要在逻辑线程中创建, 其他线程通过addDeadline信号添加截止时间
+    """
+
+    timer: QTimer
+    clock: Clock                                                        # 计算距截止时间还有多久, 与MyTime使用同一个时钟
+    deadlines: list[tuple[datetime.datetime, int, str, Callable[[], None]]]   # 小根堆, (截止时间, 序号, 名称, 回调)
+    counter: "itertools.count[int]"                                     # 截止时间相同时按添加顺序执行
+
+    addDeadline: pyqtSignal = pyqtSignal(object, str, object)           # (截止时间, 名称, 回调)
+
+    def __init__(self, clock: Clock = SYSTEM_CLOCK, parent = None) -> None:
+        super().__init__(parent)
+        self.clock = clock
+        self.deadlines = []
+        self.counter = itertools.count()
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.onTimeout)
+
+        self.addDeadline.connect(self.schedule)
+
+    def schedule(self, when: datetime.datetime, name: str, callback: Callable[[], None]) -> None:
+        """
+        添加截止时间
+
+        Args:
+            when (datetime.datetime): 截止时间
+            name (str): 名称, 用于日志
+            callback (Callable[[], None]): 到达截止时间时调用的函数
+        """
+
+        heapq.heappush(self.deadlines, (when, next(self.counter), name, callback))
+        logger.debug(f"已添加截止时间 '{name}': {when:%Y-%m-%d %H:%M:%S}")
+        self.rearm()
+
+    def rearm(self) -> None:
+        """
+        按最近的截止时间重新设置定时器
+        """
+
+        if len(self.deadlines) == 0:
+            self.timer.stop()
+            return
+
+        delay: float = (self.deadlines[0][0] - self.clock.now()).total_seconds()
+        self.timer.start(max(0, min(MAX_SLEEP_MS, int(delay * 1000) + 1)))
+
+    def onTimeout(self) -> None:
+        """
+        执行所有已到达的截止时间
+        """
+
+        now: datetime.datetime = self.clock.now()
+        while len(self.deadlines) > 0 and self.deadlines[0][0] <= now:
+            _when, _index, name, callback = heapq.heappop(self.deadlines)
+            logger.info(f"到达截止时间 '{name}'")
+            callback()
+
+        self.rearm()
 
 
 class Logic(QThread):
@@ -16,6 +87,7 @@ class Logic(QThread):
     """
 
     eventBus: EventBus
+    scheduler: Optional[Scheduler] = None                               # 在逻辑线程启动后创建
     startFirstTime: bool = False
     showMainWindow: bool = False
 
@@ -52,14 +124,37 @@ class Logic(QThread):
 
         self.LG_displaySAInfo_GUI.connect(self.eventBus.LG_displaySAInfo_GUI)
 
+        # 以下两个信号通过EventBus.request询问, 回复在request中接收
         self.LG_getPathToCI_ST.connect(self.eventBus.LG_getPathToCI_ST)
-        def f1(pathToCI: str): self.pathToCI = pathToCI
-        self.eventBus.ST_returnPathToCI_LG.connect(lambda pathToCI: f1(pathToCI))
-
         self.LG_getShowMainWindow_ST.connect(self.eventBus.LG_getShowMainWindow_ST)
 
-        def f2(showMainWindow: bool): self.showMainWindow = showMainWindow
-        self.eventBus.ST_returnShowMainWindow_LG.connect(lambda showMainWindow: f2(showMainWindow))
+        # 跨天时重新生成, 通过调度器转到逻辑线程中执行
+        def f3(date: datetime.date) -> None:
+            if self.scheduler is None:                                  # 逻辑线程还没启动, 启动时会生成
+                return
+            self.scheduler.addDeadline.emit(self.scheduler.clock.now(), f"跨天({date})", self.onDayChanged)
+        self.eventBus.MT_dayChanged_LG.connect(lambda date: f3(date))
+
+    def generateAndWrite(self) -> None:
+        """
+        生成并写入今日课表
+        """
+
+        self.pathToCI = self.eventBus.request(self.LG_getPathToCI_ST, self.eventBus.ST_returnPathToCI_LG, self.pathToCI)
+
+        self.LG_getClassTableToday_CT.emit()
+        self.LG_generateOverAllDict_JM.emit()                           # 与写入信号按顺序排队, 写入前一定已生成完成
+
+        self.LG_writeJsonFile_JM.emit(outPathFromSettings(self.pathToCI))
+
+    def onDayChanged(self) -> None:
+        """
+        日期变化后重新生成并写入今日课表, 并刷新显示
+        """
+
+        logger.info("日期已变化, 重新生成并写入今日课表")
+        self.generateAndWrite()
+        self.LG_displaySAInfo_GUI.emit()
 
     def workMain(self) -> None:
         """
@@ -72,43 +167,18 @@ class Logic(QThread):
         else:
             # 静默生成课表
             logger.info("开始静默生成并写入今日课表")
+            self.generateAndWrite()
 
-            self.LG_getPathToCI_ST.emit()
-
-            self.LG_getClassTableToday_CT.emit()
-            self.LG_generateOverAllDict_JM.emit()
-
-            time.sleep(0.2)
-
-            if self.pathToCI != "":
-                outPath: str = self.pathToCI[:-15]
-                outPath += "Profiles/Default.json"
-            else:
-                outPath = "./output/Default.json"
-
-            self.LG_writeJsonFile_JM.emit(outPath)
-
-        # TODO: 改用QEventLoop
-        while True:                                                     # 主事件处理
-            start = time.perf_counter()
-
-            # ---事件处理写在下面---
-
-
-            # ----事件处理结束----
-
-            finish = time.perf_counter()
-            timeElasped = finish - start
-            if timeElasped < 0.0167:
-                time.sleep(0.0167 - timeElasped)                        # 计算休眠时间, 保持每秒60次刷新
+        # 主事件处理: 只在截止时间到达或收到信号时唤醒
+        self.scheduler = Scheduler(self.eventBus.myTime.clock)          # 在逻辑线程中创建, 定时器在本线程的事件循环中触发
+        self.exec_()
 
     def run(self) -> None:
         """
         重写run方法
         """
 
-        time.sleep(0.2)                                                   # 睡0.2秒, 等GUI初始化 (才不是我懒得写事件循环和信号呢(
-        self.LG_getShowMainWindow_ST.emit()
-        time.sleep(0.1)
+        # 设置读取完成后才会回复, 不需要再等待固定时间
+        self.showMainWindow = self.eventBus.request(self.LG_getShowMainWindow_ST, self.eventBus.ST_returnShowMainWindow_LG,
+                                                    self.showMainWindow)
         self.workMain()
-        
\ No newline at end of file
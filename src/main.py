@@ -3,20 +3,12 @@
 # TODO: 当前未实现的功能: 
 #   暂无
 
-from PyQt5.QtWidgets import QMainWindow, QApplication
-from PyQt5.QtCore    import Qt, QCoreApplication
-from mytime          import MyTime
-from eventbus        import EventBus
-from eventhandler    import EventHandler
-from gui             import Gui
-from ciconfig_ui     import Ui_MainWindow
+# PyQt5/Tkinter只在需要显示窗口时才导入, 静默生成时不导入(见下方Main Entry)
 from class_manager   import ClassTable, TimeTable
 from json_writer     import JsonManager
-from logic           import Logic
-from settings        import Settings
-from settings_ui     import Settings_Ui
+from startup_profiler import StartupProfiler
 from loguru          import logger
-import os, sys
+import os, sys, silent
 
 def initLogger() -> None:
     """
@@ -57,8 +49,10 @@ def checkFirstTime() -> bool:
 
     if os.path.exists("./data/.start_count"):
         startFirstTime = False
-        classTable.loadClassTable()
-        timeTable.loadTimeTable()
+        with profiler.phase("checkFirstTime.loadClassTable"):
+            classTable.loadClassTable()
+        with profiler.phase("checkFirstTime.loadTimeTable"):
+            timeTable.loadTimeTable()
     else:
         logger.info("程序初次启动, 创建启动计数文件 './data/.start_count'")
         startFirstTime = True
@@ -73,61 +67,103 @@ if __name__ == '__main__':
     Main Entry
     """
 
-    # 执行一些前置操作
-    initLogger()
-    checkDir()
+    # --profile-startup: 记录各阶段耗时并输出报告
+    profiler: StartupProfiler = StartupProfiler.fromArgv(sys.argv)
 
-    myTime = MyTime()
-    myTime.start()
+    # 执行一些前置操作
+    with profiler.phase("initLogger"):
+        initLogger()
+    with profiler.phase("checkDir"):
+        checkDir()
+
+    # 不需要显示窗口时直接生成并退出, 不初始化Qt/Tkinter
+    with profiler.phase("silent.runSilent"):
+        silentDone: bool = os.path.exists("./data/.start_count") and silent.runSilent()
+    if silentDone:
+        profiler.save()
+        sys.exit(0)
+
+    with profiler.phase("import GUI modules"):
+        from PyQt5.QtWidgets import QMainWindow, QApplication
+        from PyQt5.QtCore    import Qt, QCoreApplication
+        from mytime          import MyTime
+        from eventbus        import EventBus
+        from eventhandler    import EventHandler
+        from gui             import Gui
+        from ciconfig_ui     import Ui_MainWindow
+        from logic           import Logic
+        from settings        import Settings
+        from settings_ui     import Settings_Ui
+
+    with profiler.phase("MyTime"):
+        myTime = MyTime()
+        myTime.start()
     classTable: ClassTable = ClassTable(myTime)
     timeTable: TimeTable = TimeTable()
-    jsonManager: JsonManager = JsonManager(myTime)
+    with profiler.phase("JsonManager(UUID check)"):
+        jsonManager: JsonManager = JsonManager(myTime)
 
     # 查看是否为第一次启动
-    startFirstTime: bool = checkFirstTime()
+    with profiler.phase("checkFirstTime"):
+        startFirstTime: bool = checkFirstTime()
 
-    try:
-        classTable.getClassTableToday()
-    except Exception:
-        pass
+    with profiler.phase("getClassTableToday"):
+        try:
+            classTable.getClassTableToday()
+        except Exception:
+            pass
 
     # 设置应用属性
     QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling)
 
     # 初始化Qt主应用/主窗口
-    app: QApplication = QApplication(sys.argv)
-    window: QMainWindow = QMainWindow()
-    settingsWindow: QMainWindow = QMainWindow()
+    with profiler.phase("QApplication"):
+        app: QApplication = QApplication(sys.argv)
+    with profiler.phase("QMainWindow"):
+        window: QMainWindow = QMainWindow()
+        settingsWindow: QMainWindow = QMainWindow()
     # 初始化控件
-    ui: Ui_MainWindow = Ui_MainWindow()
-    ui.setupUi(window)
-    settingsUi: Settings_Ui = Settings_Ui()
-    settingsUi.setupUi(settingsWindow)
+    with profiler.phase("Ui_MainWindow.setupUi"):
+        ui: Ui_MainWindow = Ui_MainWindow()
+        ui.setupUi(window)
+    with profiler.phase("Settings_Ui.setupUi"):
+        settingsUi: Settings_Ui = Settings_Ui()
+        settingsUi.setupUi(settingsWindow)
 
     # 初始化事件总线
     eventBus: EventBus = EventBus(app, ui, settingsUi, myTime, classTable, timeTable, jsonManager)
-    eventBus.connectAllSingal()
+    with profiler.phase("EventBus.connectAllSingal"):
+        eventBus.connectAllSingal()
 
     # 初始化事件处理
     eventHandler: EventHandler = EventHandler(eventBus)
-    eventHandler.connectAllSingal()
+    with profiler.phase("EventHandler.connectAllSingal"):
+        eventHandler.connectAllSingal()
 
     # 初始化GUI
-    gui: Gui = Gui(myTime, eventBus, app, window)
-    gui.connectAllSingal()
+    with profiler.phase("Gui(QSS, tray, Tk)"):
+        gui: Gui = Gui(myTime, eventBus, app, window)
+    with profiler.phase("Gui.connectAllSingal"):
+        gui.connectAllSingal()
 
     # 初始化逻辑处理
     logic: Logic = Logic(eventBus)
     logic.startFirstTime = startFirstTime
-    logic.connectAllSingal()
+    with profiler.phase("Logic.connectAllSingal"):
+        logic.connectAllSingal()
 
     # 初始化设置类
     settings: Settings = Settings(settingsWindow, eventBus)
-    settings.connectAllSingal()
-    settings.init()                                                     # 加载设置
+    with profiler.phase("Settings.connectAllSingal"):
+        settings.connectAllSingal()
+    with profiler.phase("Settings.init"):
+        settings.init()                                                 # 加载设置
 
     # 初始化GUI
-    gui.init()
+    with profiler.phase("gui.init"):
+        gui.init()
+
+    profiler.save()
 
     # 启动逻辑处理/GUI
     logic.start()
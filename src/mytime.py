@@ -4,10 +4,16 @@
 # TODOs:
 #   暂无
 
-from PyQt5.QtCore import QMutex, QMutexLocker, QThread
+from PyQt5.QtCore   import QMutex, QMutexLocker, QThread, pyqtSignal
 import datetime
-from loguru       import logger
-import orjson, json, time, math, os
+from calendar_index import CalendarIndex, nextDayStart, nextWeekStart, weekStart
+from clock          import Clock, SYSTEM_CLOCK
+from holidays       import loadHolidays
+from rotation       import loadRules, weekPeriod2
+from loguru         import logger
+import orjson, json, os
+
+MAX_SLEEP: float = 3600                                                 # 最长休眠时间(秒), 防止系统休眠/修改时间后错过日期变化
 
 
 class MyTime(QThread):
@@ -25,21 +31,38 @@ class MyTime(QThread):
 
     curDateTime: datetime.datetime
 
-    def __init__(self) -> None:
+    calendar: CalendarIndex                                             # 学期日历索引, 所有周数计算都通过它查询
+    clock: Clock                                                        # 时钟, 所有"现在/今天"的查询都通过它完成
+
+    dayChanged:  pyqtSignal = pyqtSignal(object)                        # 日期变化(跨过零点), 参数为新的日期(datetime.date)
+    weekChanged: pyqtSignal = pyqtSignal(int, int)                      # 周数变化(跨过周一零点), 参数为新的weekCount1, weekCount2
+
+    def __init__(self, clock: Clock = SYSTEM_CLOCK) -> None:
+        """
+        初始化
+
+        Args:
+            clock (Clock, optional): 时钟, 模拟时传入VirtualClock. Defaults to SYSTEM_CLOCK.
+        """
+
         super().__init__()
         self.mutex = QMutex()
+        self.clock = clock
 
         if not os.path.exists("./data/time.json"):
             logger.info("时间偏移量文件缺失, 现在创建")
             self.saveTimeOffset()
 
         self.loadTimeOffset()
+        rules = loadRules()
+        self.calendar = CalendarIndex(weekStart(clock.today()), weekOffset1=self.weekOffset1, weekOffset2=self.weekOffset2,
+                                      customRules=rules, holidays=loadHolidays(weekPeriod2=weekPeriod2(rules)))
+        self.weekOffset1, self.weekOffset2 = self.calendar.weekOffset1, self.calendar.weekOffset2    # 按轮换周期取模后的值
 
-        _wof1, _wof2 = self.__calcWeekCount()
-        self.weekCount1 = (_wof1 + self.weekOffset1) % 2
-        self.weekCount2 = (_wof2 + self.weekOffset2) % 3
-
-        self.curDateTime = datetime.datetime.now()
+        self.curDateTime = clock.now()
+        info = self.calendar.lookup(self.curDateTime.date())
+        self.weekCount1 = info.weekCount1
+        self.weekCount2 = info.weekCount2
 
     def saveTimeOffset(self) -> None:
         """
@@ -85,10 +108,8 @@ class MyTime(QThread):
             int: 单双周偏移量(修正值, 范围为[0, 1])
         """
 
-        _wof1, _wof2 = self.__calcWeekCount()
-
         with QMutexLocker(self.mutex):                                  # 加锁
-            self.weekCount1 = (_wof1 + self.weekOffset1) % 2
+            self.weekCount1 = self.calendar.weekCount1(self.clock.today())
             return self.weekCount1
         
     def getWeekCount2(self) -> int:
@@ -99,30 +120,10 @@ class MyTime(QThread):
             int: 三周课表偏移量
         """
 
-        _wof1, _wof2 = self.__calcWeekCount()
-
         with QMutexLocker(self.mutex):
-            self.weekCount2 = (_wof2 + self.weekOffset2) % 3
+            self.weekCount2 = self.calendar.weekCount2(self.clock.today())
             return self.weekCount2
         
-    def __calcWeekCount(self) -> tuple[int, int]:
-        """
-        计算理论上(注意!!!理论上)的单双周和三周周数, 若要获取修正量请不要调用此函数!
-
-        Returns:
-              tuple[int, int]: 单双周周数, 三周周数
-        """
-
-        time_20250707: int = 1751817600                                 # 以2025/07/07 00:00:00为时间基准(此时为单周)
-        timenow: int  = int(time.time())                                # 当前的时间戳
-        secdiff: int = timenow - time_20250707
-
-        SEC_PER_DAY: int = 86400
-        daydiff  = math.floor(secdiff / SEC_PER_DAY)                     # 差的天数
-        weekdiff = math.floor(daydiff / 7)
-
-        return (weekdiff % 2, weekdiff % 3)
-        
     def setWeekOffset1(self, val: int) -> None:
         """
         设置单双周偏移量
@@ -131,11 +132,10 @@ class MyTime(QThread):
             val (int): 新的单双周偏移量
         """
 
-        _wof1, _wof2 = self.__calcWeekCount()
-
         with QMutexLocker(self.mutex):
-            self.weekCount1 = (_wof1 + self.weekOffset1) % 2
-            self.weekOffset1 = val % 2
+            self.weekOffset1 = val % self.calendar.weekPeriod1
+            self.calendar.setWeekOffset(self.weekOffset1, self.weekOffset2)
+            self.weekCount1 = self.calendar.weekCount1(self.clock.today())
             logger.debug(f"MyTime.setWeekOffset1 called! weekCount1: {self.weekCount1}, weekOffset1: {self.weekOffset1}")
 
     def setWeekOffset2(self, val: int) -> None:
@@ -146,20 +146,48 @@ class MyTime(QThread):
             val (int): 新的三周轮换偏移量
         """
 
-        _wof1, _wof2 = self.__calcWeekCount()
-
         with QMutexLocker(self.mutex):
-            self.weekCount2 = (_wof2 + self.weekOffset2) % 3
-            self.weekOffset2 = val % 3
+            self.weekOffset2 = val % self.calendar.weekPeriod2
+            self.calendar.setWeekOffset(self.weekOffset1, self.weekOffset2)
+            self.weekCount2 = self.calendar.weekCount2(self.clock.today())
 
         logger.debug(f"MyTime.setWeekOffset2 called! weekCount2: {self.weekCount2}, weekOffset2: {self.weekOffset2}")
 
     def run(self) -> None:
+        """
+        休眠到下一个零点, 跨天/跨周时更新周数并发出dayChanged/weekChanged信号
+        """
 
-        while True:
-            _wof1, _wof2 = self.__calcWeekCount()
-            self.weekCount1 = (_wof1 + self.weekOffset1) % 2
-            self.weekCount2 = (_wof2 + self.weekOffset2) % 3
-            self.curDateTime = datetime.datetime.now()
+        lastDate: datetime.date = self.clock.today()
 
-            time.sleep(300)
\ No newline at end of file
+        while True:
+            now: datetime.datetime = self.clock.now()
+            if now.date() != lastDate:
+                weekChanged: bool = weekStart(now.date()) != weekStart(lastDate)
+                lastDate = now.date()
+
+                with QMutexLocker(self.mutex):
+                    info = self.calendar.lookup(lastDate)
+                    self.weekCount1 = info.weekCount1
+                    self.weekCount2 = info.weekCount2
+                    self.curDateTime = now
+
+                logger.info(f"日期已变化: {lastDate}")
+                self.dayChanged.emit(lastDate)
+                if weekChanged:
+                    logger.info(f"周数已变化: weekCount1: {info.weekCount1}, weekCount2: {info.weekCount2}")
+                    self.weekChanged.emit(info.weekCount1, info.weekCount2)
+
+            # 周一零点一定也是零点, 所以只需要睡到下一个零点
+            boundary: datetime.datetime = nextDayStart(now)
+            if boundary == nextWeekStart(now):
+                logger.debug(f"下一次唤醒: {boundary:%Y-%m-%d %H:%M:%S}(跨周)")
+            else:
+                logger.debug(f"下一次唤醒: {boundary:%Y-%m-%d %H:%M:%S}")
+
+            while True:
+                now = self.clock.now()
+                delay: float = (boundary - now).total_seconds()
+                if delay <= 0 or now.date() != lastDate:                # 到达零点, 或系统时间被修改
+                    break
+                self.clock.sleep(min(delay, MAX_SLEEP))
@@ -0,0 +1,163 @@
+# file: resources.py
+# brief: 资源缓存模块, qss/图片只读取和解码一次
+# time: 2026.10.17
+# TODOs:
+#   暂无
+#
+# 资源优先从编译好的资源包(resources_rc.py, 由本模块生成)中读取, 资源包不存在时从res目录读取
+# 生成资源包(修改res目录中的qss/图片后需要重新生成, 打包前也需要生成):
+#   python src/resources.py
+
+from PyQt5.QtCore import QFile, QIODevice, QSize, Qt
+from PyQt5.QtGui  import QIcon, QPixmap
+from typing       import Optional
+from mypath       import resPath
+from loguru       import logger
+import os, sys
+
+QRC_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "res", "ciconfig.qrc")
+RC_MODULE_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources_rc.py")
+BUNDLED_SUFFIXES: tuple[str, ...] = (".qss", ".png", ".ico")            # 打包进资源包的文件类型
+
+_bundled: Optional[bool] = None                                         # 是否已加载资源包, None=还没尝试加载
+_qss: dict[str, str] = {}
+_pixmaps: dict[tuple[str, int, int], QPixmap] = {}                      # (路径, 宽, 高) -> 图片, 原始尺寸的宽高为-1
+_icons: dict[str, QIcon] = {}
+
+
+def normalize(relPath: str) -> str:
+    """
+    统一路径写法, 反斜杠和斜杠分隔的路径视为同一个资源
+    """
+
+    return relPath.replace("\\", "/")
+
+def isBundled() -> bool:
+    """
+    加载资源包(只尝试一次)
+
+    Returns:
+        bool: 资源包是否可用
+    """
+
+    global _bundled
+    if _bundled is None:
+        try:
+            import resources_rc                                         # 导入时即注册资源
+            _bundled = True
+            logger.debug("已加载资源包")
+        except ImportError:
+            _bundled = False
+            logger.debug("资源包不存在, 从res目录读取资源")
+    return _bundled
+
+def resourcePath(relPath: str) -> str:
+    """
+    获取资源路径, 资源包可用时为":/res/..."形式的路径
+
+    Args:
+        relPath (str): 相对于程序目录的路径, 如"res/used_icons/温迪_1.png"
+    """
+
+    if isBundled():
+        return ":/" + normalize(relPath)
+    return resPath(relPath)
+
+def qss(relPath: str = "res/ciconfig_ui.qss") -> str:
+    """
+    读取qss, 每个文件只读取一次
+
+    Args:
+        relPath (str, optional): qss路径. Defaults to "res/ciconfig_ui.qss".
+
+    Returns:
+        str: qss内容
+    """
+
+    key: str = normalize(relPath)
+    text: Optional[str] = _qss.get(key)
+    if text is None:
+        qssFile: QFile = QFile(resourcePath(relPath))
+        if not qssFile.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
+            logger.error(f"读取qss时路径 '{relPath}' 不存在")
+            return ""
+        text = bytes(qssFile.readAll()).decode("utf-8")
+        qssFile.close()
+        _qss[key] = text
+    return text
+
+def pixmap(relPath: str, size: Optional[QSize] = None) -> QPixmap:
+    """
+    获取解码后的图片, 原图和每种缩放尺寸都只生成一次
+
+    Args:
+        relPath (str): 图片路径
+        size (QSize, optional): 缩放到的尺寸(保持比例, 平滑缩放), 为None时为原图. Defaults to None.
+
+    Returns:
+        QPixmap: 图片
+    """
+
+    key: str = normalize(relPath)
+    original: Optional[QPixmap] = _pixmaps.get((key, -1, -1))
+    if original is None:
+        original = QPixmap(resourcePath(relPath))
+        if original.isNull():
+            logger.warning(f"无法读取图片 '{relPath}'")
+        _pixmaps[(key, -1, -1)] = original
+
+    if size is None:
+        return original
+
+    scaled: Optional[QPixmap] = _pixmaps.get((key, size.width(), size.height()))
+    if scaled is None:
+        scaled = original.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        _pixmaps[(key, size.width(), size.height())] = scaled
+    return scaled
+
+def icon(relPath: str) -> QIcon:
+    """
+    获取图标, 每个文件只生成一次
+    """
+
+    key: str = normalize(relPath)
+    result: Optional[QIcon] = _icons.get(key)
+    if result is None:
+        result = QIcon(pixmap(relPath))
+        _icons[key] = result
+    return result
+
+
+def buildBundle() -> int:
+    """
+    生成res/ciconfig.qrc, 并用pyrcc5编译为src/resources_rc.py
+
+    Returns:
+        int: 进程退出码
+    """
+
+    from PyQt5 import pyrcc_main
+
+    resDir: str = os.path.dirname(QRC_PATH)
+    files: list[str] = []
+    for root, _dirs, names in os.walk(resDir):
+        for name in sorted(names):
+            if name.lower().endswith(BUNDLED_SUFFIXES):
+                files.append(os.path.relpath(os.path.join(root, name), resDir).replace(os.sep, "/"))
+
+    lines: list[str] = ["<!DOCTYPE RCC>", "<RCC version=\"1.0\">", "<qresource prefix=\"/res\">"]
+    lines += [f"    <file>{name}</file>" for name in sorted(files)]
+    lines += ["</qresource>", "</RCC>", ""]
+    with open(QRC_PATH, "w", encoding="utf-8") as qrcFile:
+        qrcFile.write("\n".join(lines))
+
+    if not pyrcc_main.processResourceFile([QRC_PATH], RC_MODULE_PATH, False):
+        logger.error("编译资源包失败")
+        return 1
+
+    logger.success(f"已生成资源包 '{RC_MODULE_PATH}', 共 {len(files)} 个文件")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(buildBundle())
@@ -0,0 +1,226 @@
+# file: rotation.py
+# brief: 声明式课表轮换规则, 编译为按日期查询的索引表
+# time: 2026.10.17
+# TODOs:
+#   暂无
+#
+# 每条规则描述一种按周(每周一切换)的独立轮换, RotationTable把任意数量的规则编译为按日期查询的索引表
+#   period: 几周一轮, offset: 偏移量, 基准日期为ANCHOR_DATE(此时值为offset % period)
+#
+# 课表中实际使用的是presetRules()中的两条规则:
+#   weekCount1: 单双周, 选择单周/双周时间表(只有两套时间表, 周期固定为2)
+#   weekCount2: 三周轮换, 选择周六课表和晚课(课表中每一周各有一行)
+# 规则文件(./data/rotation.json, 可选)只能修改weekCount2的周期, 例如四周轮换(课表中需要有4周的周六课表和晚课):
+#   {
+#       "rules": [
+#           {"name": "weekCount2", "period": 4}
+#       ]
+#   }
+# 偏移量仍由偏移量文件(./data/time.json)决定. 课表中没有可以由其他规则(如AB日, 按天轮换)选择的表,
+# 这类规则读取时会被跳过并给出警告
+
+from   array  import array
+from   typing import Any, Optional
+from   loguru import logger
+import datetime, json, math
+
+ANCHOR_DATE: datetime.date = datetime.date(2025, 7, 7)                 # 时间基准, 2025/07/07(周一, 此时为单周)
+
+WEEK_COUNT_1: str = "weekCount1"                                        # 单双周规则名
+WEEK_COUNT_2: str = "weekCount2"                                        # 三周轮换规则名
+
+PERIOD_1: int = 2                                                       # 单双周的周期, 只有单周/双周两套时间表
+DEFAULT_PERIOD_2: int = 3                                               # 三周轮换的默认周期, 可在规则文件中修改
+
+RULES_FILE_PATH: str = "./data/rotation.json"
+RULE_KEYS: tuple[str, ...] = ("name", "period")                        # 规则文件中每条规则可以设置的项
+
+
+class RotationRule:
+    """
+    一条按周轮换的规则
+    """
+
+    name: str
+    period: int                                                         # 几周一轮
+    offset: int                                                         # 偏移量
+
+    def __init__(self, name: str, period: int, offset: int = 0) -> None:
+        if period < 1:
+            raise ValueError(f"轮换规则 '{name}' 的周期必须大于0")
+
+        self.name = name
+        self.period = period
+        self.offset = offset % period
+
+    @classmethod
+    def fromDict(cls, data: dict[str, Any]) -> "RotationRule":
+        """
+        从规则文件中的一项创建
+
+        Raises:
+            KeyError, ValueError, TypeError: 格式不正确
+        """
+
+        unknown: list[str] = [key for key in data if key not in RULE_KEYS]
+        if len(unknown) > 0:
+            raise ValueError(f"不支持的项 {unknown}, 只能设置 {list(RULE_KEYS)}(按周轮换, 偏移量见偏移量文件)")
+        return cls(str(data["name"]), int(data["period"]))
+
+    def resolve(self, date: datetime.date) -> int:
+        """
+        直接计算某一天的值
+
+        Returns:
+            int: 范围为[0, period)
+        """
+
+        return ((date - ANCHOR_DATE).days // 7 + self.offset) % self.period   # 向下取整, 基准之前的日期同样适用
+
+
+def weekPeriod2(customRules: Optional[list[RotationRule]] = None) -> int:
+    """
+    获取三周轮换的周期, 规则文件中有weekCount2规则时为该规则的周期
+
+    Args:
+        customRules (list[RotationRule], optional): 规则文件中的规则, 见loadRules. Defaults to None.
+
+    Returns:
+        int: 三周轮换的周期(周)
+    """
+
+    return next((rule.period for rule in customRules or [] if rule.name == WEEK_COUNT_2), DEFAULT_PERIOD_2)
+
+def presetRules(weekOffset1: int = 0, weekOffset2: int = 0, customRules: Optional[list[RotationRule]] = None) -> list[RotationRule]:
+    """
+    课表使用的轮换模式: 午饭晚饭时间单双周轮换, 晚课/周六课程三周轮换
+
+    Args:
+        weekOffset1 (int, optional): 单双周偏移量. Defaults to 0.
+        weekOffset2 (int, optional): 三周轮换偏移量. Defaults to 0.
+        customRules (list[RotationRule], optional): 规则文件中的规则, 见loadRules, 其中的weekCount2规则决定三周轮换的周期. Defaults to None.
+
+    Returns:
+        list[RotationRule]: 单双周规则, 三周轮换规则
+    """
+
+    return [RotationRule(WEEK_COUNT_1, PERIOD_1, weekOffset1), RotationRule(WEEK_COUNT_2, weekPeriod2(customRules), weekOffset2)]
+
+def loadRules(filePath: str = RULES_FILE_PATH) -> list[RotationRule]:
+    """
+    读取规则文件中的轮换规则, 文件不存在时返回空列表
+    格式错误的规则, 以及课表中没有用到的规则(目前只能修改weekCount2的周期)会被跳过
+
+    Args:
+        filePath (str, optional): 规则文件路径. Defaults to RULES_FILE_PATH.
+
+    Returns:
+        list[RotationRule]: 轮换规则, 交给presetRules
+    """
+
+    try:
+        with open(filePath, "r", encoding="utf-8") as rulesFile:
+            data: dict = json.load(rulesFile)
+    except FileNotFoundError:
+        return []
+    except ValueError:
+        logger.error(f"轮换规则文件 '{filePath}' 不是有效的json文件")
+        return []
+
+    rules: list[RotationRule] = []
+    for entry in data.get("rules", []):
+        try:
+            rule: RotationRule = RotationRule.fromDict(entry)
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning(f"轮换规则 {entry} 格式错误, 已跳过: {e}")
+            continue
+        if rule.name != WEEK_COUNT_2:
+            logger.warning(f"轮换规则 '{rule.name}' 没有对应的课表, 不会影响生成的配置, 已跳过"
+                           f"(目前只能修改三周轮换 '{WEEK_COUNT_2}' 的周期)")
+            continue
+        if any(r.name == rule.name for r in rules):
+            logger.warning(f"轮换规则名 '{rule.name}' 重复, 已跳过")
+            continue
+        logger.info(f"三周轮换的周期已由规则文件修改为 {rule.period} 周")
+        rules.append(rule)
+
+    return rules
+
+
+class RotationTable:
+    """
+    把任意数量的轮换规则编译为按日期查询的索引表
+    每一天只存一个下标, 指向该天所有规则取值的组合, 查询时一次下标访问即可得到所有规则的值
+    """
+
+    rules: list[RotationRule]
+    names: dict[str, int]                                               # 规则名 -> 在组合中的位置
+    startDate: datetime.date
+    days: int
+    combos: list[tuple[int, ...]]                                       # 所有出现过的取值组合
+    table: array                                                        # 下标为 (日期 - startDate).days, 值为combos的下标
+
+    def __init__(self, rules: list[RotationRule], startDate: datetime.date, days: int) -> None:
+        self.rules = list(rules)
+        self.names = {rule.name: i for i, rule in enumerate(self.rules)}
+        self.startDate = startDate
+        self.days = max(days, 0)
+        self.build()
+
+    def build(self) -> None:
+        """
+        编译索引表
+        """
+
+        self.combos = []
+        comboIndex: dict[tuple[int, ...], int] = {}
+        self.table = array("H")
+
+        for i in range(self.days):
+            values: tuple[int, ...] = self.resolve(self.startDate + datetime.timedelta(days=i))
+            index: Optional[int] = comboIndex.get(values)
+            if index is None:
+                index = len(self.combos)
+                comboIndex[values] = index
+                self.combos.append(values)
+            self.table.append(index)
+
+    def resolve(self, date: datetime.date) -> tuple[int, ...]:
+        """
+        直接计算某一天所有规则的值(索引范围外的日期使用)
+        """
+
+        return tuple(rule.resolve(date) for rule in self.rules)
+
+    def lookup(self, date: datetime.date) -> tuple[int, ...]:
+        """
+        查询某一天所有规则的值, 顺序同rules
+
+        Args:
+            date (datetime.date): 日期
+
+        Returns:
+            tuple[int, ...]: 每条规则的值
+        """
+
+        i: int = (date - self.startDate).days
+        if 0 <= i < self.days:
+            return self.combos[self.table[i]]
+        return self.resolve(date)
+
+    def value(self, date: datetime.date, name: str) -> int:
+        """
+        查询某一天某条规则的值
+
+        Raises:
+            KeyError: 没有该规则
+        """
+
+        return self.lookup(date)[self.names[name]]
+
+    def cycleWeeks(self) -> int:
+        """
+        所有规则同时回到起点所需的周数
+        """
+
+        return math.lcm(*(rule.period for rule in self.rules)) if len(self.rules) > 0 else 1
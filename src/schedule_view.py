@@ -0,0 +1,301 @@
+# file: schedule_view.py
+# brief: 滚动区域中课表/时间表的Model/View显示模块
+# time: 2026.10.17
+# TODOs:
+#   暂无
+#
+# 原来每次刷新都为每一行新建QWidget/QLabel/QFont/QComboBox, 现在改为:
+#   ScheduleModel:   只保存每一行的文本, 刷新时原地更新数据, 行数不变时不重建任何东西
+#   ClassDelegate:   课程一列画成选择框的样子, 只有点击时才创建真正的QComboBox
+#   ScheduleWidget:  QTableView + 周日提示页, 只创建一次, 刷新时切换显示
+
+from PyQt5.QtCore    import Qt, QAbstractTableModel, QModelIndex, QRect, QSize, pyqtSignal
+from PyQt5.QtGui     import QFont, QPainter
+from PyQt5.QtWidgets import (QAbstractItemView, QApplication, QComboBox, QHeaderView, QLabel, QStackedLayout, QStyle,
+                             QStyledItemDelegate, QStyleOptionComboBox, QStyleOptionViewItem, QTableView, QVBoxLayout,
+                             QWidget)
+from class_manager   import ClassTable, TimeTable, TimePeriod
+from json_writer     import ALL_CLASSES, time2str_hm
+from calendar_index  import DayInfo
+from typing          import Any, NamedTuple, Optional, Union
+import resources
+
+LDAYINWEEK: list[str] = ["周一", "周二", "周三", "周四", "周五", "周六"]
+
+FONT_FAMILY: str = "HarmonyOS Sans SC"
+ROW_HEIGHT: int = 42
+COMBO_SIZE: QSize = QSize(115, 36)
+COMBO_MARGIN: int = 35                                                  # 选择框右侧的留白
+COMBO_ITEMS: list[str] = [" " + _class for _class in ALL_CLASSES]       # 添加个空格, 美观一些
+CLASS_INDEX: dict[str, int] = {_class: i for i, _class in enumerate(ALL_CLASSES)}
+
+_fonts: dict[int, QFont] = {}
+
+
+def cachedFont(pointSize: int) -> QFont:
+    """
+    获取共用的字体, 每个字号只创建一次
+    """
+
+    font: Optional[QFont] = _fonts.get(pointSize)
+    if font is None:
+        font = QFont()
+        font.setFamily(FONT_FAMILY)
+        font.setPointSize(pointSize)
+        _fonts[pointSize] = font
+    return font
+
+
+def comboRect(option: QStyleOptionViewItem) -> QRect:
+    """
+    选择框在单元格中的位置(靠右, 垂直居中)
+    """
+
+    cell: QRect = option.rect.adjusted(0, 0, -COMBO_MARGIN, 0)
+    return QStyle.alignedRect(option.direction, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                              COMBO_SIZE.boundedTo(cell.size()), cell)
+
+
+class Row(NamedTuple):
+    """
+    滚动区域中的一行
+    """
+
+    text: str                                                           # 左侧文本, 如"周一   第1节课"
+    value: str                                                          # 右侧的课程名或时间
+    classIndex: int                                                     # 课表行为第几节课, 时间表行为-1(不可编辑)
+
+
+def classTableRows(classTable: ClassTable, weekday: int) -> list[Row]:
+    """
+    今日课表的每一行
+    """
+
+    text: str = LDAYINWEEK[weekday]
+    return [Row(f"{text}   第{i + 1}节课", singleClass.name, i) for i, singleClass in enumerate(classTable.classTableToday)]
+
+def timeTableRows(timeTable: TimeTable, today: DayInfo) -> list[Row]:
+    """
+    今日时间表的每一行
+    """
+
+    if today.scheduleWeekday != 5:                                      # 非周六
+        text: str = "周一-周五"
+        timeList: list[TimePeriod] = timeTable.normTimeList1 if today.weekCount1 == 0 else timeTable.normTimeList2
+    else:                                                               # 周六
+        text = "周六"
+        timeList = timeTable.satTimeList1 if today.weekCount1 == 0 else timeTable.satTimeList2
+
+    rows: list[Row] = []
+    classIndex: int = 0
+    for timePeriod in timeList:
+        if timePeriod.timeType == 0:
+            rows.append(Row(f"{text}   第{classIndex + 1}节课",
+                            time2str_hm(timePeriod.start) + " - " + time2str_hm(timePeriod.finish), -1))
+            classIndex += 1
+        elif timePeriod.timeType == 1:
+            rows.append(Row(f"{text}   课间", time2str_hm(timePeriod.start) + " - " + time2str_hm(timePeriod.finish), -1))
+        else:
+            rows.append(Row(f"{text}   分割线", time2str_hm(timePeriod.start), -1))
+    return rows
+
+
+class ScheduleModel(QAbstractTableModel):
+    """
+    两列的表格模型: 左侧文本, 右侧课程名/时间
+    """
+
+    rows: list[Row]
+
+    # 用户在选择框中修改了课程, int: 第几节课, str: 课程名称
+    classChanged: pyqtSignal = pyqtSignal(int, str)
+
+    def __init__(self, parent = None) -> None:
+        super().__init__(parent)
+        self.rows = []
+
+    def setRows(self, rows: list[Row]) -> None:
+        """
+        原地更新数据, 只通知发生变化的部分
+        """
+
+        old: int = len(self.rows)
+        new: int = len(rows)
+
+        if new < old:
+            self.beginRemoveRows(QModelIndex(), new, old - 1)
+            self.rows = self.rows[:new]
+            self.endRemoveRows()
+        elif new > old:
+            self.beginInsertRows(QModelIndex(), old, new - 1)
+            self.rows = self.rows + rows[old:]
+            self.endInsertRows()
+
+        changed: list[int] = [i for i in range(min(old, new)) if self.rows[i] != rows[i]]
+        self.rows = list(rows)
+        if len(changed) > 0:
+            self.dataChanged.emit(self.index(changed[0], 0), self.index(changed[-1], 1))
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else 2
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row: Row = self.rows[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
+            return row.text if index.column() == 0 else row.value
+        if role == Qt.ItemDataRole.FontRole:
+            return cachedFont(12)
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if index.column() == 1 and row.classIndex == -1:
+                return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            return int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled
+        if index.column() == 1 and self.rows[index.row()].classIndex != -1:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole or index.column() != 1:
+            return False
+
+        row: Row = self.rows[index.row()]
+        if row.classIndex == -1 or value == row.value:
+            return False
+
+        self.rows[index.row()] = row._replace(value=value)
+        self.dataChanged.emit(index, index)
+        self.classChanged.emit(row.classIndex, value)
+        return True
+
+
+class ClassDelegate(QStyledItemDelegate):
+    """
+    课程列的委托, 所有行共用一个, 平时只画出选择框的样子, 编辑时才创建QComboBox
+    """
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        if not index.flags() & Qt.ItemFlag.ItemIsEditable:
+            super().paint(painter, option, index)
+            return
+
+        combo: QStyleOptionComboBox = QStyleOptionComboBox()
+        combo.rect = comboRect(option)
+        combo.state = option.state | QStyle.StateFlag.State_Enabled
+        combo.currentText = " " + str(index.data())
+        combo.editable = False
+
+        style: QStyle = option.widget.style() if option.widget is not None else QApplication.style()
+        painter.save()
+        painter.setFont(cachedFont(12))
+        style.drawComplexControl(QStyle.ComplexControl.CC_ComboBox, combo, painter, option.widget)
+        style.drawControl(QStyle.ControlElement.CE_ComboBoxLabel, combo, painter, option.widget)
+        painter.restore()
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> QWidget:
+        editor: QComboBox = QComboBox(parent)
+        editor.addItems(COMBO_ITEMS)
+        editor.setFont(cachedFont(12))
+        # 选中后立即提交并关闭, 与原来的选择框行为一致
+        editor.activated.connect(lambda _index: (self.commitData.emit(editor), self.closeEditor.emit(editor)))
+        return editor
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex) -> None:
+        editor.setCurrentIndex(CLASS_INDEX.get(str(index.data()), 0))
+
+    def setModelData(self, editor: QWidget, model: QAbstractTableModel, index: QModelIndex) -> None:
+        model.setData(index, ALL_CLASSES[editor.currentIndex()], Qt.ItemDataRole.EditRole)
+
+    def updateEditorGeometry(self, editor: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        editor.setGeometry(comboRect(option))
+
+
+class ScheduleWidget(QWidget):
+    """
+    滚动区域的内容, 只创建一次: 课表/时间表使用同一个QTableView, 周日显示提示页
+    """
+
+    model: ScheduleModel
+    view: QTableView
+    delegate: ClassDelegate
+    sundayPage: QWidget
+    stack: QStackedLayout
+
+    def __init__(self, parent = None) -> None:
+        super().__init__(parent)
+
+        self.model = ScheduleModel(self)
+        self.delegate = ClassDelegate(self)
+
+        self.view = QTableView(self)
+        self.view.setModel(self.model)
+        self.view.setItemDelegateForColumn(1, self.delegate)
+        self.view.horizontalHeader().hide()
+        self.view.verticalHeader().hide()
+        self.view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.view.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+        self.view.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.view.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
+        self.view.horizontalHeader().resizeSection(1, COMBO_SIZE.width() + COMBO_MARGIN)
+        self.view.setShowGrid(False)
+        self.view.setFrameShape(QTableView.Shape.NoFrame)
+        self.view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.view.setEditTriggers(QAbstractItemView.EditTrigger.AllEditTriggers)
+        self.view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+
+        self.sundayPage = self.createSundayPage()
+
+        self.stack = QStackedLayout(self)
+        self.stack.addWidget(self.view)
+        self.stack.addWidget(self.sundayPage)
+
+    def createSundayPage(self) -> QWidget:
+        page: QWidget = QWidget(self)
+        layout: QVBoxLayout = QVBoxLayout(page)
+        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        icon: QLabel = QLabel()
+        icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        icon.setPixmap(resources.pixmap("res\\used_icons\\温迪_2.png", QSize(158, 135)))  # 缩放后的图片也会缓存
+        icon.setScaledContents(True)
+        icon.setFixedSize(QSize(158, 135))
+
+        label: QLabel = QLabel(" 今天没有课程喵!")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setFont(cachedFont(13))
+
+        layout.addWidget(icon)
+        layout.addWidget(label)
+        return page
+
+    def display(self, contentToDisp: Union[ClassTable, TimeTable], today: DayInfo) -> None:
+        """
+        显示今日课表/时间表, 原地更新数据
+
+        Args:
+            contentToDisp (ClassTable | TimeTable): 要显示的内容
+            today (DayInfo): 今天的日历信息
+        """
+
+        if today.noClass:                                               # 周日或节假日
+            self.stack.setCurrentWidget(self.sundayPage)
+            return
+
+        if isinstance(contentToDisp, ClassTable):
+            rows: list[Row] = classTableRows(contentToDisp, today.scheduleWeekday)
+        else:
+            rows = timeTableRows(contentToDisp, today)
+
+        self.model.setRows(rows)
+        self.stack.setCurrentWidget(self.view)
@@ -0,0 +1,193 @@
+# file: school_parser.py
+# brief: 全校课表文件的流式解析模块, 每次只解析并返回一个班级
+# time: 2026.10.17
+# TODOs:
+#   暂无
+#
+# 全校课表文件格式(txt, utf-8):
+#   [时间表]                  <- 全校共用的时间表(可选), 需写在使用它的班级之前, 格式同timetable.txt
+#   平日时间:
+#   第一节课:07:30-08:10
+#   ......
+#   [高一1班]                 <- 班级课表, 格式同classes.txt
+#   周一:数学,外语,......
+#   ......
+#   [高一1班/时间表]          <- 该班级自己的时间表(可选), 需紧跟在该班级的课表之后
+#   ......
+#   [高一2班]
+#   ......
+#
+# 也可以是多工作表的xlsx文件, 格式见xlsx_reader模块
+
+from   class_manager import ClassTable, TimeTable
+from   typing        import Iterable, Iterator, Optional, TYPE_CHECKING
+from   loguru        import logger
+import os, xlsx_reader
+
+if TYPE_CHECKING:                                                       # 只用于类型标注, 运行时不导入Qt
+    from mytime import MyTime
+
+DEFAULT_TIMETABLE_HEADER: str = "时间表"                                 # 全校共用时间表的节名
+TIMETABLE_SUFFIX: str = "/时间表"                                        # 班级时间表的节名后缀
+
+
+class SchoolClass:
+    """
+    全校课表文件中的一个班级
+    """
+
+    name: str
+    lineNumber: int                                                     # 班级节名所在的行号
+    classTable: ClassTable
+    timeTable: TimeTable                                                # 没有单独的时间表时为全校共用的时间表
+    errors: list[tuple[int, str]]                                       # 格式错误的行, (行号, 错误信息)
+
+    def __init__(self, name: str, lineNumber: int, classTable: ClassTable) -> None:
+        self.name = name
+        self.lineNumber = lineNumber
+        self.classTable = classTable
+        self.timeTable = TimeTable()
+        self.errors = []
+
+
+def sectionName(line: str) -> Optional[str]:
+    """
+    判断一行是否为节名("[高一1班]"), 是则返回方括号中的内容
+
+    Args:
+        line (str): 行内容
+
+    Returns:
+        Optional[str]: 节名, 不是节名时为None
+    """
+
+    line = line.strip()
+    if len(line) >= 2 and line[0] == "[" and line[-1] == "]":
+        return line[1:-1].strip()
+    return None
+
+def iterFileLines(filePath: str) -> Iterator[tuple[int, str]]:
+    """
+    逐行读取全校课表文件, xlsx文件会被转换为相同格式的行
+
+    Args:
+        filePath (str): 文件路径
+
+    Yields:
+        tuple[int, str]: (行号, 行内容)
+    """
+
+    if filePath.lower().endswith(".xlsx"):
+        yield from xlsx_reader.iterSchoolLines(filePath)
+        return
+
+    with open(filePath, "r", encoding="utf-8") as schoolFile:
+        yield from enumerate(schoolFile, 1)
+
+def iterSections(lines: Iterable[tuple[int, str]]) -> Iterator[tuple[str, int, list[tuple[int, str]]]]:
+    """
+    按节读取, 每次只在内存中保留一节的内容
+
+    Args:
+        lines (Iterable[tuple[int, str]]): (行号, 行内容)
+
+    Yields:
+        tuple[str, int, list[tuple[int, str]]]: 节名(第一个节名之前的内容为""), 节名所在行号, 本节的(行号, 行内容)
+    """
+
+    name: str = ""
+    lineNumber: int = 0
+    section: list[tuple[int, str]] = []
+
+    for i, line in lines:
+        header: Optional[str] = sectionName(line)
+        if header is None:
+            section.append((i, line))
+            continue
+
+        if name != "" or len(section) > 0:
+            yield (name, lineNumber, section)
+        name, lineNumber, section = header, i, []
+
+    if name != "" or len(section) > 0:
+        yield (name, lineNumber, section)
+
+def parseSchoolFile(filePath: str, myTime: "MyTime") -> Iterator[SchoolClass]:
+    """
+    流式解析全校课表文件(txt或xlsx), 每解析完一个班级就返回一个, 内存占用与班级数量无关
+    格式错误的行会记录在SchoolClass.errors中, 不会中断解析
+
+    Args:
+        filePath (str): 全校课表文件路径
+        myTime (MyTime): 时间实例(也可以是WeekTime), 传给每个班级的ClassTable
+
+    Yields:
+        SchoolClass: 解析完成的班级
+    """
+
+    if not os.path.exists(filePath):
+        logger.error(f"解析全校课表时路径 '{filePath}' 不存在")
+        return
+
+    logger.info(f"开始从路径 '{filePath}' 流式解析全校课表")
+
+    defaultTimeTable: Optional[TimeTable] = None                        # 全校共用的时间表
+    current: Optional[SchoolClass] = None                               # 正在解析的班级
+    hasOwnTimeTable: bool = False                                       # 正在解析的班级是否有自己的时间表
+    seen: set[str] = set()
+    count: int = 0
+
+    def finish(schoolClass: SchoolClass, hasOwnTimeTable: bool) -> SchoolClass:
+        if not hasOwnTimeTable:
+            if defaultTimeTable is None:
+                schoolClass.errors.append((schoolClass.lineNumber, "没有时间表(该班级没有单独的时间表, 且之前没有全校共用的时间表)"))
+            else:
+                schoolClass.timeTable = defaultTimeTable
+        return schoolClass
+
+    for name, lineNumber, lines in iterSections(iterFileLines(filePath)):
+        # 全校共用的时间表
+        if name == DEFAULT_TIMETABLE_HEADER:
+            defaultTimeTable = TimeTable()
+            for errorLine, error in defaultTimeTable.parseTimeTableLines(lines):
+                logger.warning(f"全校时间表第 {errorLine} 行格式错误: {error}")
+            continue
+
+        # 班级自己的时间表
+        if name.endswith(TIMETABLE_SUFFIX):
+            className: str = name[: -len(TIMETABLE_SUFFIX)].strip()
+            if current is None or current.name != className or hasOwnTimeTable:
+                logger.warning(f"第 {lineNumber} 行的时间表 '{name}' 没有紧跟在班级 '{className}' 的课表之后, 已跳过")
+                if current is not None:
+                    current.errors.append((lineNumber, f"时间表 '{name}' 的位置不正确, 已跳过"))
+                continue
+            current.errors.extend(current.timeTable.parseTimeTableLines(lines))
+            hasOwnTimeTable = True
+            continue
+
+        # 开始新的班级前先返回上一个班级
+        if current is not None:
+            yield finish(current, hasOwnTimeTable)
+            count += 1
+            current = None
+
+        # 第一个节名之前的内容
+        if name == "":
+            for i, line in lines:
+                if line.strip() != "":
+                    logger.warning(f"全校课表第 {i} 行不属于任何班级, 已跳过")
+            continue
+
+        if name in seen:
+            logger.warning(f"全校课表第 {lineNumber} 行: 班级 '{name}' 重复出现")
+        seen.add(name)
+
+        current = SchoolClass(name, lineNumber, ClassTable(myTime))
+        current.errors.extend(current.classTable.parseClassTableLines(lines))
+        hasOwnTimeTable = False
+
+    if current is not None:
+        yield finish(current, hasOwnTimeTable)
+        count += 1
+
+    logger.success(f"全校课表解析完成, 共 {count} 个班级")
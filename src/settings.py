@@ -19,6 +19,12 @@ class Settings(QObject):
     loadPriority: int = 0                                               # 加载优先级, 0=优先本程序, 1=优先ClassIsland
     pathToCI: str = ""                                                  # ClassIsland可执行文件路径
     showMainWindow: bool = False                                        # 启动时显示主界面
+    fullCycle: bool = False                                             # 生成完整轮换周期的课表, 而非只生成今日课表
+    # 以下输出目标暂时只能在设置文件中修改, 见fanout模块
+    backup: bool = True                                                 # 同时写入Default.json.bak
+    archiveDir: str = ""                                                # 归档目录, 为""时不归档
+    shareDirs: list[str] = []                                           # 共享目录
+    writeTimeout: float = 10.0                                          # 等待所有目标写入的最长时间(秒)
     eventBus: EventBus
 
     mainWindow: QMainWindow
@@ -38,6 +44,10 @@ class Settings(QObject):
 
     ST_returnShowMainWindow_LG    : pyqtSignal = pyqtSignal(bool)
 
+    ST_setFullCycle_JM            : pyqtSignal = pyqtSignal(bool)
+
+    ST_setOutputTargets_JM        : pyqtSignal = pyqtSignal(dict)
+
     def connectAllSingal(self) -> None:
         """
         连接所有信号
@@ -58,7 +68,8 @@ class Settings(QObject):
             # 设置选择框默认文本
             data: dict = {
                 "pathToCI": self.pathToCI,
-                "showMainWindow": self.showMainWindow
+                "showMainWindow": self.showMainWindow,
+                "fullCycle": self.fullCycle
             }
             self.ST_setComboBoxDefaultText_STUI.emit(data)
             self.mainWindow.show()
@@ -70,6 +81,14 @@ class Settings(QObject):
         self.eventBus.LG_getShowMainWindow_ST.connect(lambda: self.ST_returnShowMainWindow_LG.emit(self.showMainWindow))
         self.ST_returnShowMainWindow_LG.connect(self.eventBus.ST_returnShowMainWindow_LG)
 
+        self.ST_setFullCycle_JM.connect(self.eventBus.ST_setFullCycle_JM)
+        def f4(fullCycle: bool):
+            self.fullCycle = fullCycle
+            self.ST_setFullCycle_JM.emit(fullCycle)
+        self.eventBus.STUI_set_fullCycle_ST.connect(lambda fullCycle: f4(fullCycle))
+
+        self.ST_setOutputTargets_JM.connect(self.eventBus.ST_setOutputTargets_JM)
+
     def saveSettings(self) -> None:
         """
         保存设置选项
@@ -80,7 +99,12 @@ class Settings(QObject):
         data = {
             "loadPriority": self.loadPriority,
             "pathToCI": self.pathToCI,
-            "showMainWindow": self.showMainWindow
+            "showMainWindow": self.showMainWindow,
+            "fullCycle": self.fullCycle,
+            "backup": self.backup,
+            "archiveDir": self.archiveDir,
+            "shareDirs": self.shareDirs,
+            "writeTimeout": self.writeTimeout
         }
 
         with open("./data/settings.json", "wb") as settingsFile:
@@ -106,6 +130,11 @@ class Settings(QObject):
         self.loadPriority = data["loadPriority"]
         self.pathToCI = data["pathToCI"]
         self.showMainWindow = data["showMainWindow"]
+        self.fullCycle = data.get("fullCycle", False)                   # 旧版本的设置文件中没有此项
+        self.backup = data.get("backup", True)
+        self.archiveDir = data.get("archiveDir", "")
+        self.shareDirs = data.get("shareDirs", [])
+        self.writeTimeout = data.get("writeTimeout", 10.0)
 
     def init(self) -> None:
         """
@@ -117,6 +146,13 @@ class Settings(QObject):
             self.saveSettings()
         
         self.loadSettings()
+        self.ST_setFullCycle_JM.emit(self.fullCycle)
+        self.ST_setOutputTargets_JM.emit({
+            "backup": self.backup,
+            "archiveDir": self.archiveDir,
+            "shareDirs": self.shareDirs,
+            "writeTimeout": self.writeTimeout
+        })
 
         if self.pathToCI == "":
             logger.warning("ClassIsland可执行文件路径为空, 现在询问用户")
@@ -1,6 +1,6 @@
 from PyQt5 import QtCore, QtGui, QtWidgets
 
-from mypath import resPath
+import resources
 
 class Settings_Ui(object):
     def setupUi(self, MainWindow):
@@ -11,14 +11,14 @@ class Settings_Ui(object):
         font.setPointSize(13)
         MainWindow.setFont(font)
         icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap(resPath("res\\used_icons\\设置.png")), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        icon.addPixmap(resources.pixmap("res\\used_icons\\设置.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
         MainWindow.setWindowIcon(icon)
         self.centralwidget = QtWidgets.QWidget(MainWindow)
         self.centralwidget.setObjectName("centralwidget")
         self.l_icon_pathToCI = QtWidgets.QLabel(self.centralwidget)
         self.l_icon_pathToCI.setGeometry(QtCore.QRect(40, 60, 41, 41))
         self.l_icon_pathToCI.setText("")
-        self.l_icon_pathToCI.setPixmap(QtGui.QPixmap(resPath("res\\used_icons\\文件路径.png")))
+        self.l_icon_pathToCI.setPixmap(resources.pixmap("res\\used_icons\\文件路径.png"))
         self.l_icon_pathToCI.setScaledContents(True)
         self.l_icon_pathToCI.setObjectName("l_icon_pathToCI")
         self.l_title = QtWidgets.QLabel(self.centralwidget)
@@ -45,7 +45,7 @@ class Settings_Ui(object):
         self.l_MainWindow = QtWidgets.QLabel(self.centralwidget)
         self.l_MainWindow.setGeometry(QtCore.QRect(40, 158, 38, 38))
         self.l_MainWindow.setText("")
-        self.l_MainWindow.setPixmap(QtGui.QPixmap(resPath("res\\used_icons\\主界面.png")))
+        self.l_MainWindow.setPixmap(resources.pixmap("res\\used_icons\\主界面.png"))
         self.l_MainWindow.setScaledContents(True)
         self.l_MainWindow.setObjectName("l_MainWindow")
         self.l_pathToCI_info_2 = QtWidgets.QLabel(self.centralwidget)
@@ -66,6 +66,30 @@ class Settings_Ui(object):
         self.line.setFrameShape(QtWidgets.QFrame.HLine)
         self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
         self.line.setObjectName("line")
+        self.line_2 = QtWidgets.QFrame(self.centralwidget)
+        self.line_2.setGeometry(QtCore.QRect(90, 204, 471, 20))
+        self.line_2.setMidLineWidth(1)
+        self.line_2.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.l_fullCycle = QtWidgets.QLabel(self.centralwidget)
+        self.l_fullCycle.setGeometry(QtCore.QRect(40, 226, 38, 38))
+        self.l_fullCycle.setText("")
+        self.l_fullCycle.setPixmap(resources.pixmap("res\\used_icons\\时间表.png"))
+        self.l_fullCycle.setScaledContents(True)
+        self.l_fullCycle.setObjectName("l_fullCycle")
+        self.l_fullCycle_info = QtWidgets.QLabel(self.centralwidget)
+        self.l_fullCycle_info.setGeometry(QtCore.QRect(90, 226, 281, 41))
+        font = QtGui.QFont()
+        font.setFamily("HarmonyOS Sans SC")
+        font.setPointSize(13)
+        self.l_fullCycle_info.setFont(font)
+        self.l_fullCycle_info.setObjectName("l_fullCycle_info")
+        self.comboBox_fullCycle = QtWidgets.QComboBox(self.centralwidget)
+        self.comboBox_fullCycle.setGeometry(QtCore.QRect(330, 228, 71, 36))
+        self.comboBox_fullCycle.setObjectName("comboBox_fullCycle")
+        self.comboBox_fullCycle.addItem("")
+        self.comboBox_fullCycle.addItem("")
         MainWindow.setCentralWidget(self.centralwidget)
 
         self.retranslateUi(MainWindow)
@@ -79,4 +103,7 @@ class Settings_Ui(object):
         self.b_pathToCI.setText(_translate("MainWindow", "修改"))
         self.l_pathToCI_info_2.setText(_translate("MainWindow", "启动时显示主界面:"))
         self.comboBox.setItemText(0, _translate("MainWindow", "  否"))
-        self.comboBox.setItemText(1, _translate("MainWindow", "  是"))
\ No newline at end of file
+        self.comboBox.setItemText(1, _translate("MainWindow", "  是"))
+        self.l_fullCycle_info.setText(_translate("MainWindow", "生成完整轮换周期课表:"))
+        self.comboBox_fullCycle.setItemText(0, _translate("MainWindow", "  否"))
+        self.comboBox_fullCycle.setItemText(1, _translate("MainWindow", "  是"))
\ No newline at end of file
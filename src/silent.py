@@ -0,0 +1,81 @@
+# file: silent.py
+# brief: 静默生成模块, 不初始化Qt/Tkinter, 读取设置和课表后直接写入配置文件
+# time: 2026.10.17
+# TODOs:
+#   暂无
+
+from   class_manager import ClassTable, TimeTable
+from   json_writer   import JsonManager
+from   weektime      import WeekTime
+from   typing        import Any, Optional
+from   loguru        import logger
+import fanout, json
+
+SETTINGS_FILE_PATH: str = "./data/settings.json"
+
+
+def loadSettings(filePath: str = SETTINGS_FILE_PATH) -> Optional[dict[str, Any]]:
+    """
+    只读地加载设置文件(不会创建文件, 也不会询问用户)
+
+    Args:
+        filePath (str, optional): 设置文件路径. Defaults to SETTINGS_FILE_PATH.
+
+    Returns:
+        Optional[dict[str, Any]]: 设置内容, 文件不存在或损坏时为None
+    """
+
+    try:
+        with open(filePath, "r") as settingsFile:
+            return json.load(settingsFile)
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError:
+        logger.warning(f"设置文件 '{filePath}' 损坏")
+        return None
+
+def outPathFromSettings(pathToCI: str) -> str:
+    """
+    根据ClassIsland可执行文件路径获取配置文件的输出路径
+
+    Args:
+        pathToCI (str): ClassIsland可执行文件路径, 为""时输出到./output
+
+    Returns:
+        str: 配置文件路径
+    """
+
+    if pathToCI != "":
+        return pathToCI[:-15] + "Profiles/Default.json"
+    return "./output/Default.json"
+
+def runSilent() -> bool:
+    """
+    静默生成并写入今日课表
+    需要显示主窗口, 设置文件缺失或需要询问ClassIsland路径时不生成, 交给图形界面处理
+
+    Returns:
+        bool: 是否已完成静默生成(为False时应启动图形界面)
+    """
+
+    settings: Optional[dict[str, Any]] = loadSettings()
+    if settings is None or settings.get("showMainWindow", True) or settings.get("pathToCI", "") == "":
+        return False
+
+    logger.info("开始静默生成并写入今日课表")
+
+    weekTime: WeekTime = WeekTime()
+    classTable: ClassTable = ClassTable(weekTime)
+    timeTable: TimeTable = TimeTable()
+    classTable.loadClassTable()
+    timeTable.loadTimeTable()
+    classTable.getClassTableToday()
+
+    jsonManager: JsonManager = JsonManager(weekTime)
+    jsonManager.setFullCycle(settings.get("fullCycle", False))
+    jsonManager.setOutputTargets(settings.get("backup", True), settings.get("archiveDir", ""),
+                                 settings.get("shareDirs", []), settings.get("writeTimeout", fanout.DEFAULT_TIMEOUT))
+    jsonManager.generateOverAllDict(classTable, timeTable)
+    jsonManager.writeJsonFile(outPathFromSettings(settings["pathToCI"]))
+
+    return True
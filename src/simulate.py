@@ -0,0 +1,248 @@
+# file: simulate.py
+# brief: 学期模拟模块, 用虚拟时钟逐日生成配置文件, 检查每天的输出是否为空或无效
+# time: 2026.10.17
+# TODOs:
+#   暂无
+#
+# 用法:
+#   python src/simulate.py [--classes 课表文件] [--timetable 时间表文件] [--start 2026-09-01] [--days 140]
+#                          [--offset1 0] [--offset2 0] [-o 输出目录] [--report 报告路径]
+#
+# 每天按 --hour 指定的时间(默认为07:00, 即开机自启时)生成一次今日课表, 不会写入ClassIsland的配置文件,
+# 指定输出目录时每天的配置文件保存为 <输出目录>/<日期>.json, 方便与实际写入的配置比较
+
+from   class_manager import ClassTable, DaySchedule, TimeTable
+from   clock         import VirtualClock
+from   json_writer   import JsonManager
+from   weektime      import WeekTime
+from   typing        import Any, Optional
+from   loguru        import logger
+import argparse, datetime, os, sys, time, orjson, validator
+
+DEFAULT_DAYS: int = 140                                                 # 默认模拟20周(约一个学期)
+DEFAULT_HOUR: str = "07:00"
+
+STATUS_OK: str       = "ok"
+STATUS_NO_CLASS: str = "noClass"                                        # 周日或节假日, 不生成
+STATUS_EMPTY: str    = "empty"                                          # 应该有课但没有生成配置
+STATUS_INVALID: str  = "invalid"                                        # 生成了配置, 但内容有问题
+
+
+def checkProfile(profile: dict) -> list[str]:
+    """
+    检查一天的配置内容是否有效
+
+    Args:
+        profile (dict): 配置文件的内容(从json读回的字典)
+
+    Returns:
+        list[str]: 发现的问题, 为空时配置有效
+    """
+
+    problems: list[str] = []
+
+    classPlans: dict = profile.get("ClassPlans", {})
+    if len(classPlans) == 0:
+        return ["没有课程计划"]
+
+    timeLayouts: dict = profile.get("TimeLayouts", {})
+    subjects: dict = profile.get("Subjects", {})
+
+    for plan in classPlans.values():
+        name: str = plan.get("Name", "")
+        classes: list[dict] = plan.get("Classes", [])
+        if len(classes) == 0:
+            problems.append(f"课程计划 '{name}' 中没有课程")
+            continue
+
+        layout: Optional[dict] = timeLayouts.get(plan.get("TimeLayoutId"))
+        if layout is None:
+            problems.append(f"课程计划 '{name}' 使用的时间表不存在")
+        else:
+            classCount: int = sum(1 for tp in layout.get("Layouts", []) if tp.get("TimeType") == 0)
+            if classCount != len(classes):
+                problems.append(f"课程计划 '{name}' 有 {len(classes)} 节课, 但时间表 '{layout.get('Name')}' "
+                                f"中有 {classCount} 个上课时间段")
+
+        for i, singleClass in enumerate(classes):
+            if singleClass.get("SubjectId") not in subjects:
+                problems.append(f"课程计划 '{name}' 第 {i + 1} 节课没有对应的科目")
+
+    return problems
+
+
+class Simulation:
+    """
+    用虚拟时钟驱动的学期模拟
+    """
+
+    clock: VirtualClock
+    weekTime: WeekTime
+    classTable: ClassTable
+    timeTable: TimeTable
+    jsonManager: JsonManager
+
+    def __init__(self, classTable: ClassTable, timeTable: TimeTable, weekTime: WeekTime, jsonManager: JsonManager) -> None:
+        """
+        初始化
+
+        Args:
+            classTable (ClassTable): 课表, 其myTime需为weekTime
+            timeTable (TimeTable): 时间表
+            weekTime (WeekTime): 时间实例, 其clock需为VirtualClock
+            jsonManager (JsonManager): 配置生成实例, 其myTime需为weekTime
+        """
+
+        if not isinstance(weekTime.clock, VirtualClock):
+            raise TypeError("模拟需要使用VirtualClock")
+
+        self.clock = weekTime.clock
+        self.weekTime = weekTime
+        self.classTable = classTable
+        self.timeTable = timeTable
+        self.jsonManager = jsonManager
+
+    def simulateDay(self, when: datetime.datetime, outDir: str = "") -> dict[str, Any]:
+        """
+        模拟某一天的生成
+
+        Args:
+            when (datetime.datetime): 生成的时间
+            outDir (str, optional): 配置文件的保存目录, 为""时不保存. Defaults to "".
+
+        Returns:
+            dict[str, Any]: 当天的结果, 含有date, weekday, scheduleWeekday, holiday, weekCount1, weekCount2, status, problems
+        """
+
+        self.clock.set(when)
+        self.weekTime.refresh()
+        info = self.weekTime.calendar.lookup(when.date())
+
+        result: dict[str, Any] = {
+            "date": when.date().isoformat(),
+            "weekday": info.weekday,
+            "scheduleWeekday": info.scheduleWeekday,
+            "holiday": info.holiday,
+            "weekCount1": info.weekCount1,
+            "weekCount2": info.weekCount2,
+            "status": STATUS_OK,
+            "problems": []
+        }
+
+        if info.noClass:
+            result["status"] = STATUS_NO_CLASS
+            return result
+
+        # 每天都从空课表开始, 避免前一天的结果残留
+        self.classTable.classTableToday = DaySchedule()
+        self.jsonManager.overAllDict = {}
+        self.classTable.getClassTableToday()
+        self.jsonManager.generateOverAllDict(self.classTable, self.timeTable)
+
+        if self.jsonManager.overAllDict == {}:
+            errors: list[str] = [issue.message for issue in validator.errorsOf(self.jsonManager.lastIssues)]
+            result["status"] = STATUS_INVALID if len(errors) > 0 else STATUS_EMPTY  # 校验未通过时不会生成配置
+            result["problems"] = errors if len(errors) > 0 else ["没有生成配置"]
+            return result
+
+        # overAllDict中的TimeLayouts/Subjects是预先序列化的片段, 序列化后再读回才能检查, 检查的内容也与写入文件的一致
+        profile: dict = orjson.loads(orjson.dumps(self.jsonManager.overAllDict))
+        problems: list[str] = checkProfile(profile)
+        if len(problems) > 0:
+            result["status"] = STATUS_INVALID
+            result["problems"] = problems
+
+        if outDir != "":
+            self.jsonManager.writeJsonFile(os.path.join(outDir, f"{result['date']}.json"), force=True)
+
+        return result
+
+    def run(self, start: datetime.date, days: int, hour: datetime.time, outDir: str = "") -> list[dict[str, Any]]:
+        """
+        从start起逐日模拟days天
+
+        Returns:
+            list[dict[str, Any]]: 每天的结果, 见simulateDay
+        """
+
+        if outDir != "":
+            os.makedirs(outDir, exist_ok=True)
+
+        results: list[dict[str, Any]] = []
+        for i in range(days):
+            when: datetime.datetime = datetime.datetime.combine(start + datetime.timedelta(days=i), hour)
+            result: dict[str, Any] = self.simulateDay(when, outDir)
+            if result["status"] in (STATUS_EMPTY, STATUS_INVALID):
+                logger.warning(f"{result['date']} 的配置{'为空' if result['status'] == STATUS_EMPTY else '无效'}: "
+                               f"{'; '.join(result['problems'])}")
+            results.append(result)
+
+        return results
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    学期模拟入口
+
+    Returns:
+        int: 进程退出码, 有配置为空或无效的日期时为1
+    """
+
+    parser = argparse.ArgumentParser(description="CIConfig 学期模拟, 用虚拟时钟逐日生成配置并检查")
+    parser.add_argument("--classes", default="./classes.txt", help="课表文件(txt/xlsx), 默认为 ./classes.txt")
+    parser.add_argument("--timetable", default="./timetable.txt", help="时间表文件(txt/xlsx), 默认为 ./timetable.txt")
+    parser.add_argument("--start", default="", help="起始日期(如 2026-09-01), 默认为今天")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help=f"模拟天数, 默认为 {DEFAULT_DAYS}")
+    parser.add_argument("--hour", default=DEFAULT_HOUR, help=f"每天生成的时间, 默认为 {DEFAULT_HOUR}")
+    parser.add_argument("--offset1", type=int, default=None, help="单双周偏移量, 默认从 ./data/time.json 读取")
+    parser.add_argument("--offset2", type=int, default=None, help="三周轮换偏移量, 默认从 ./data/time.json 读取")
+    parser.add_argument("-o", "--output", default="", help="保存每天配置文件的目录, 默认不保存")
+    parser.add_argument("--report", default="", help="将每天的结果写入该json文件")
+    args = parser.parse_args(argv)
+
+    try:
+        start: datetime.date = datetime.date.fromisoformat(args.start) if args.start != "" else datetime.date.today()
+        hour: datetime.time = datetime.time.fromisoformat(args.hour)
+    except ValueError as e:
+        logger.error(f"日期或时间格式错误: {e}")
+        return 1
+
+    clock: VirtualClock = VirtualClock(datetime.datetime.combine(start, hour))
+    weekTime: WeekTime = WeekTime(args.offset1, args.offset2, clock=clock)
+
+    classTable: ClassTable = ClassTable(weekTime)
+    classTable.parseClassTable(args.classes, os.path.splitext(args.classes)[1])
+    timeTable: TimeTable = TimeTable()
+    timeTable.parseTimeTable(args.timetable, os.path.splitext(args.timetable)[1])
+
+    jsonManager: JsonManager = JsonManager(weekTime)
+    jsonManager.digestFilePath = ""                                     # 模拟输出不记录哈希
+
+    logger.info(f"开始模拟 {start} 起的 {args.days} 天")
+    begin = time.perf_counter()
+    results: list[dict[str, Any]] = Simulation(classTable, timeTable, weekTime, jsonManager).run(start, args.days, hour,
+                                                                                                 args.output)
+    elapsed: float = time.perf_counter() - begin
+
+    counts: dict[str, int] = {status: sum(1 for r in results if r["status"] == status)
+                              for status in (STATUS_OK, STATUS_NO_CLASS, STATUS_EMPTY, STATUS_INVALID)}
+    logger.info(f"模拟结束, 共 {len(results)} 天, 正常 {counts[STATUS_OK]}, 无课 {counts[STATUS_NO_CLASS]}, "
+                f"为空 {counts[STATUS_EMPTY]}, 无效 {counts[STATUS_INVALID]}, 耗时 {elapsed:.2f} s")
+
+    if args.report != "":
+        report: dict[str, Any] = {
+            "start": start.isoformat(),
+            "days": args.days,
+            "elapsed": round(elapsed * 1000, 3),
+            "counts": counts,
+            "results": results
+        }
+        with open(args.report, "wb") as reportFile:
+            reportFile.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        logger.success(f"模拟报告已写入 '{args.report}'")
+
+    return 1 if counts[STATUS_EMPTY] + counts[STATUS_INVALID] > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
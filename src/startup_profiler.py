@@ -0,0 +1,173 @@
+# file: startup_profiler.py
+# brief: 启动耗时分析模块, 记录main.py各阶段的耗时并输出json报告
+# time: 2026.10.17
+# TODOs:
+#   暂无
+#
+# 用法:
+#   python src/main.py --profile-startup[=报告路径]          (默认报告路径为 ./data/startup_profile.json)
+#
+# 报告内容:
+#   phases:  每个阶段的墙钟时间(wall_ms)和进程CPU时间(cpu_ms), 按执行顺序排列
+#   imports: PyQt5/loguru/orjson的导入耗时, 在子进程中用 python -X importtime 测量(不受本进程已导入模块的影响)
+
+from   contextlib import contextmanager
+from   typing     import Any, Iterator
+from   loguru     import logger
+import datetime, platform, subprocess, sys, time, orjson
+
+PROFILE_FLAG: str = "--profile-startup"
+DEFAULT_REPORT_PATH: str = "./data/startup_profile.json"
+
+IMPORT_MODULES: tuple[str, ...] = ("PyQt5.QtWidgets", "loguru", "orjson")    # 需要分析导入耗时的模块
+IMPORT_TOP_COUNT: int = 8                                               # 每个模块列出耗时最多的子模块数量
+
+
+class StartupProfiler:
+    """
+    启动耗时分析类, 未启用时phase()不做任何记录
+    """
+
+    enabled: bool
+    reportPath: str
+    phases: list[dict[str, Any]]
+
+    startWall: float
+    startCPU: float
+
+    def __init__(self, enabled: bool = False, reportPath: str = DEFAULT_REPORT_PATH) -> None:
+        self.enabled = enabled
+        self.reportPath = reportPath
+        self.phases = []
+        self.startWall = time.perf_counter()
+        self.startCPU = time.process_time()
+
+    @classmethod
+    def fromArgv(cls, argv: list[str]) -> "StartupProfiler":
+        """
+        根据命令行参数创建, 并从argv中移除--profile-startup参数(避免传给QApplication)
+
+        Args:
+            argv (list[str]): 命令行参数, 会被修改
+
+        Returns:
+            StartupProfiler: 分析器
+        """
+
+        for i, arg in enumerate(argv):
+            if arg == PROFILE_FLAG or arg.startswith(PROFILE_FLAG + "="):
+                del argv[i]
+                reportPath: str = arg[len(PROFILE_FLAG) + 1:] or DEFAULT_REPORT_PATH
+                return cls(True, reportPath)
+
+        return cls(False)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        记录一个阶段的耗时
+
+        Args:
+            name (str): 阶段名称
+        """
+
+        if not self.enabled:
+            yield
+            return
+
+        wall: float = time.perf_counter()
+        cpu: float = time.process_time()
+        try:
+            yield
+        finally:
+            self.phases.append({
+                "name": name,
+                "wall_ms": round((time.perf_counter() - wall) * 1000, 3),
+                "cpu_ms": round((time.process_time() - cpu) * 1000, 3),
+                "offset_ms": round((wall - self.startWall) * 1000, 3)      # 阶段开始时距离启动的时间
+            })
+
+    def save(self, path: str = "") -> None:
+        """
+        保存报告, 未启用时不做任何事
+
+        Args:
+            path (str, optional): 报告路径, 为""时使用启动参数中的路径. Defaults to "".
+        """
+
+        if not self.enabled:
+            return
+
+        totalWall: float = time.perf_counter() - self.startWall
+        totalCPU: float = time.process_time() - self.startCPU
+
+        report: dict[str, Any] = {
+            "time": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "total": {"wall_ms": round(totalWall * 1000, 3), "cpu_ms": round(totalCPU * 1000, 3)},
+            "phases": self.phases,
+            "imports": {module: importBreakdown(module) for module in IMPORT_MODULES}
+        }
+
+        path = path or self.reportPath
+        with open(path, "wb") as reportFile:
+            reportFile.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+
+        logger.info(f"启动耗时报告已保存到 '{path}', 总耗时 {totalWall * 1000:.1f} ms")
+
+
+def importBreakdown(module: str) -> dict[str, Any]:
+    """
+    在子进程中用 python -X importtime 测量模块的导入耗时
+
+    Args:
+        module (str): 模块名
+
+    Returns:
+        dict[str, Any]: 总耗时(cumulative_ms)和耗时最多的子模块(top), 测量失败时含有error
+    """
+
+    try:
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                              capture_output=True, text=True, timeout=60)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"返回值 {proc.returncode}"}
+
+    # 每行格式: "import time:   自身耗时 |   累计耗时 | 缩进+模块名", 单位为微秒
+    # 子模块先于父模块输出, 解释器启动时的导入(site等)也会输出, 只统计目标模块及其父包
+    targets: set[str] = {".".join(module.split(".")[:i]) for i in range(1, module.count(".") + 2)}
+    total: int = 0
+    count: int = 0
+    children: list[tuple[str, int, int]] = []
+    pending: list[tuple[str, int, int]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts: list[str] = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue                                                    # 表头
+        name: str = parts[2].rstrip()
+        depth: int = (len(name) - len(name.lstrip())) // 2
+        entry: tuple[str, int, int] = (name.strip(), int(parts[0]), int(parts[1]))
+
+        if depth > 0:
+            pending.append(entry)
+            continue
+        if entry[0] in targets:
+            total += entry[2]
+            count += 1 + len(pending)
+            children.extend(pending)
+        pending = []
+
+    top: list[tuple[str, int, int]] = sorted(children, key=lambda entry: entry[1], reverse=True)[:IMPORT_TOP_COUNT]
+
+    return {
+        "cumulative_ms": round(total / 1000, 3),
+        "modules": count,
+        "top": [{"name": name, "self_ms": round(selfTime / 1000, 3), "cumulative_ms": round(cumulative / 1000, 3)}
+                for name, selfTime, cumulative in top]
+    }
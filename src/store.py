@@ -0,0 +1,261 @@
+# file: store.py
+# brief: 数据保存模块, 用带版本号的紧凑二进制格式保存时间表和uuid, 替代pickle
+# time: 2026.10.17
+# TODOs:
+#   暂无
+#
+# 文件格式(小端序):
+#   文件头: 魔数 b"CICS"(4字节) + 版本号(uint16) + 数据类型(uint8) + 保留(uint8)
+#
+#   时间表(KIND_TIMETABLE), 版本1:
+#       依次为 平日-单, 平日-双, 周六-单, 周六-双 四个时间表, 每个时间表为
+#       时间段数量(uint16) + 时间段 * 数量, 每个时间段为 开始时(uint8) + 开始分(uint8) + 终止时(uint8) + 终止分(uint8) + 类型(uint8)
+#
+#   uuid(KIND_UUID), 版本1:
+#       数量(uint16) + 条目 * 数量, 每个条目为 键名长度(uint8) + 键名(utf-8) + uuid(16字节)
+#
+# 旧版本的pickle文件(以b"\x80"开头)视为版本0, 读取时会自动迁移为当前版本并写回
+
+from   typing import Callable, Optional
+from   loguru import logger
+import os, pickle, struct, tempfile, uuid
+
+MAGIC: bytes = b"CICS"
+HEADER: struct.Struct = struct.Struct("<4sHBB")
+
+KIND_TIMETABLE: int = 1
+KIND_UUID: int      = 2
+
+TIMETABLE_VERSION: int = 1                                              # 当前时间表格式版本
+UUID_VERSION: int      = 1                                              # 当前uuid格式版本
+
+TIME_LIST_NAMES: tuple[str, ...] = ("normTimeList1", "normTimeList2", "satTimeList1", "satTimeList2")
+
+COUNT: struct.Struct  = struct.Struct("<H")
+PERIOD: struct.Struct = struct.Struct("<BBBBB")
+
+# 时间段: (开始时间[时, 分], 终止时间[时, 分], 类型)
+TimeLists = list[list[tuple[list[int], list[int], int]]]
+
+
+def writeAtomic(filePath: str, data: bytes) -> None:
+    """
+    先写入临时文件再替换, 避免写入中途退出导致文件损坏
+    临时文件名每次都不同, 多个进程(如GUI和watcher.py)同时保存同一个文件时不会互相覆盖临时文件
+
+    Args:
+        filePath (str): 文件路径
+        data (bytes): 文件内容
+
+    Raises:
+        OSError: 写入或替换失败(临时文件会被删除)
+    """
+
+    fd, tmpPath = tempfile.mkstemp(prefix=os.path.basename(filePath) + ".", suffix=".tmp", dir=os.path.dirname(filePath) or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmpPath, filePath)
+    except OSError:
+        if os.path.exists(tmpPath):
+            os.remove(tmpPath)
+        raise
+
+def readFile(filePath: str, kind: int) -> Optional[tuple[int, bytes]]:
+    """
+    读取文件并解析文件头
+
+    Args:
+        filePath (str): 文件路径
+        kind (int): 期望的数据类型
+
+    Returns:
+        Optional[tuple[int, bytes]]: 版本号(pickle文件为0), 文件头之后的内容; 文件不存在或不是本模块的格式时为None
+    """
+
+    try:
+        with open(filePath, "rb") as f:
+            data: bytes = f.read()
+    except FileNotFoundError:
+        logger.error(f"读取数据时路径 '{filePath}' 不存在")
+        return None
+
+    if data[:1] == b"\x80":                                             # pickle协议2及以上的文件头
+        return (0, data)
+
+    if len(data) < HEADER.size or data[:4] != MAGIC:
+        logger.error(f"文件 '{filePath}' 不是有效的数据文件")
+        return None
+
+    _magic, version, fileKind, _reserved = HEADER.unpack_from(data)
+    if fileKind != kind:
+        logger.error(f"文件 '{filePath}' 的数据类型不符(期望 {kind}, 实际 {fileKind})")
+        return None
+
+    return (version, data[HEADER.size:])
+
+def loadVersioned(filePath: str, kind: int, currentVersion: int, readers: dict[int, Callable[[bytes], object]],
+                  save: Callable[[str, object], None]) -> Optional[object]:
+    """
+    按版本号选择读取函数, 读取的不是当前版本时迁移并写回
+
+    Args:
+        filePath (str): 文件路径
+        kind (int): 数据类型
+        currentVersion (int): 当前版本号
+        readers (dict[int, Callable[[bytes], object]]): 各版本的读取函数
+        save (Callable[[str, object], None]): 以当前版本保存的函数
+
+    Returns:
+        Optional[object]: 读取到的数据, 失败时为None
+    """
+
+    file = readFile(filePath, kind)
+    if file is None:
+        return None
+    version, body = file
+
+    reader = readers.get(version)
+    if reader is None:
+        logger.error(f"文件 '{filePath}' 的版本 {version} 不受支持(当前版本为 {currentVersion}), 请更新CIConfig")
+        return None
+
+    try:
+        result = reader(body)
+    except (struct.error, IndexError, UnicodeDecodeError, ValueError, pickle.UnpicklingError, AttributeError,
+            ImportError, EOFError) as e:
+        logger.error(f"文件 '{filePath}' 已损坏, 读取失败: {type(e).__name__}: {e}")
+        return None
+
+    if version != currentVersion:
+        logger.info(f"正在将文件 '{filePath}' 从版本 {version} 迁移到版本 {currentVersion}")
+        save(filePath, result)
+
+    return result
+
+
+# ---------------------------------------------- 时间表 ----------------------------------------------
+
+def saveTimeLists(filePath: str, timeLists: TimeLists) -> None:
+    """
+    保存时间表
+
+    Args:
+        filePath (str): 文件路径
+        timeLists (TimeLists): 四个时间表, 顺序同TIME_LIST_NAMES
+    """
+
+    parts: list[bytes] = [HEADER.pack(MAGIC, TIMETABLE_VERSION, KIND_TIMETABLE, 0)]
+    for timeList in timeLists:
+        parts.append(COUNT.pack(len(timeList)))
+        for start, finish, timeType in timeList:
+            parts.append(PERIOD.pack(start[0], start[1], finish[0], finish[1], timeType))
+
+    writeAtomic(filePath, b"".join(parts))
+
+def readTimeListsV0(body: bytes) -> TimeLists:
+    """
+    读取旧版本用pickle保存的TimeTable
+    """
+
+    timeTable = pickle.loads(body)
+    return [[(list(tp.start), list(tp.finish), tp.timeType) for tp in getattr(timeTable, name)]
+            for name in TIME_LIST_NAMES]
+
+def readTimeListsV1(body: bytes) -> TimeLists:
+    timeLists: TimeLists = []
+    offset: int = 0
+
+    for _ in TIME_LIST_NAMES:
+        (count, ) = COUNT.unpack_from(body, offset)
+        offset += COUNT.size
+        end: int = offset + PERIOD.size * count
+        if end > len(body):
+            raise ValueError("时间段数量与文件长度不符")
+        timeLists.append([
+            ([startH, startM], [finishH, finishM], timeType)
+            for startH, startM, finishH, finishM, timeType in PERIOD.iter_unpack(body[offset:end])
+        ])
+        offset = end
+
+    return timeLists
+
+TIMETABLE_READERS: dict[int, Callable[[bytes], TimeLists]] = {
+    0: readTimeListsV0,
+    1: readTimeListsV1
+}
+
+def loadTimeLists(filePath: str) -> Optional[TimeLists]:
+    """
+    读取时间表
+
+    Args:
+        filePath (str): 文件路径
+
+    Returns:
+        Optional[TimeLists]: 四个时间表, 顺序同TIME_LIST_NAMES, 读取失败时为None
+    """
+
+    return loadVersioned(filePath, KIND_TIMETABLE, TIMETABLE_VERSION, TIMETABLE_READERS, saveTimeLists)
+
+
+# ----------------------------------------------- uuid -----------------------------------------------
+
+def saveUUIDMap(filePath: str, uuidMap: dict[str, uuid.UUID]) -> None:
+    """
+    保存uuid
+
+    Args:
+        filePath (str): 文件路径
+        uuidMap (dict[str, uuid.UUID]): 键名 -> uuid
+    """
+
+    parts: list[bytes] = [HEADER.pack(MAGIC, UUID_VERSION, KIND_UUID, 0), COUNT.pack(len(uuidMap))]
+    for key, value in uuidMap.items():
+        keyBytes: bytes = key.encode("utf-8")
+        parts.append(bytes((len(keyBytes), )))
+        parts.append(keyBytes)
+        parts.append(value.bytes)
+
+    writeAtomic(filePath, b"".join(parts))
+
+def readUUIDMapV0(body: bytes) -> dict[str, uuid.UUID]:
+    """
+    读取旧版本用pickle保存的uuid
+    """
+
+    return dict(pickle.loads(body))
+
+def readUUIDMapV1(body: bytes) -> dict[str, uuid.UUID]:
+    uuidMap: dict[str, uuid.UUID] = {}
+
+    (count, ) = COUNT.unpack_from(body)
+    offset: int = COUNT.size
+    for _ in range(count):
+        keyLen: int = body[offset]
+        key: str = body[offset + 1 : offset + 1 + keyLen].decode("utf-8")
+        offset += 1 + keyLen
+        if offset + 16 > len(body):
+            raise ValueError("uuid数量与文件长度不符")
+        uuidMap[key] = uuid.UUID(bytes=body[offset : offset + 16])
+        offset += 16
+
+    return uuidMap
+
+UUID_READERS: dict[int, Callable[[bytes], dict[str, uuid.UUID]]] = {
+    0: readUUIDMapV0,
+    1: readUUIDMapV1
+}
+
+def loadUUIDMap(filePath: str) -> Optional[dict[str, uuid.UUID]]:
+    """
+    读取uuid
+
+    Args:
+        filePath (str): 文件路径
+
+    Returns:
+        Optional[dict[str, uuid.UUID]]: 键名 -> uuid, 读取失败时为None
+    """
+
+    return loadVersioned(filePath, KIND_UUID, UUID_VERSION, UUID_READERS, saveUUIDMap)
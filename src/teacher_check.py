@@ -0,0 +1,152 @@
+# file: teacher_check.py
+# brief: 跨班级的老师冲突检查, 找出同一时间被排在多个班级上课的老师
+# time: 2026.10.17
+# TODOs:
+#   暂无
+#
+# 用法:
+#   python src/teacher_check.py <班级目录/清单文件/全校课表文件> [--report 报告路径]
+#
+# 输入格式同batch模块, 课表中的课程写为"数学(张三)"即可指定任课老师, 没有写老师的课程不参与检查
+# 检查覆盖完整的轮换周期: 课程只由(周几, 三周轮换的第几周)决定, 因此检查周一至周六 x 轮换周期(默认3周, 见rotation模块)的每一节课
+# 按第几节课比较, 即认为所有班级使用相同的作息时间(全校课表中共用的时间表)
+
+from   class_manager import ClassTable, NAME_TABLE
+from   rotation      import DEFAULT_PERIOD_2
+from   school_parser import parseSchoolFile
+from   weektime      import WeekTime
+from   typing        import Any, Iterable, Optional
+from   loguru        import logger
+import argparse, os, sys, time, orjson, batch
+
+LDAYINWEEK: list[str] = ["周一", "周二", "周三", "周四", "周五", "周六"]
+
+
+class TeacherIndex:
+    """
+    (周几, 三周周数, 第几节课, 老师) -> 班级 的哈希索引
+    每加入一个班级只需遍历一遍它的课表, 键已存在即为冲突
+    """
+
+    weeks: int                                                          # 三周轮换的周期, 课程只与三周周数有关
+    slots: dict[tuple[int, int, int, int], str]                         # 键中的老师为编号(见NAME_TABLE), 值为第一个占用的班级
+    conflicts: dict[tuple[int, int, int, int], list[str]]               # 冲突的键 -> 所有占用的班级
+    classCount: int
+    lessonCount: int                                                    # 有老师的课的总节数
+
+    def __init__(self, weeks: int = DEFAULT_PERIOD_2) -> None:
+        self.weeks = weeks
+        self.slots = {}
+        self.conflicts = {}
+        self.classCount = 0
+        self.lessonCount = 0
+
+    def addClass(self, className: str, classTable: ClassTable) -> None:
+        """
+        把一个班级完整轮换周期内的课程加入索引
+
+        Args:
+            className (str): 班级名称
+            classTable (ClassTable): 课表
+        """
+
+        self.classCount += 1
+        for weekCount2 in range(self.weeks):
+            for weekday in range(len(LDAYINWEEK)):
+                for period, singleClass in enumerate(classTable.getClassTableOfDay(weekday, weekCount2)):
+                    if singleClass.teacherID == 0:                      # 没有写老师
+                        continue
+                    self.lessonCount += 1
+                    key: tuple[int, int, int, int] = (weekday, weekCount2, period, singleClass.teacherID)
+                    first: str = self.slots.setdefault(key, className)
+                    if first == className:
+                        continue
+                    classes: Optional[list[str]] = self.conflicts.get(key)
+                    if classes is None:
+                        self.conflicts[key] = [first, className]
+                    elif className not in classes:
+                        classes.append(className)
+
+    def report(self) -> list[dict[str, Any]]:
+        """
+        所有冲突, 同一位老师在同一天同一节课, 只是三周周数不同的冲突合并为一项, 按老师, 周几, 第几节课排序
+
+        Returns:
+            list[dict[str, Any]]: 每个冲突含有teacher, weekday, period, weekCounts(三周周数列表), classes五项(均从0开始)
+        """
+
+        merged: dict[tuple[int, int, int, tuple[str, ...]], list[int]] = {}
+        for (weekday, weekCount2, period, teacherID), classes in self.conflicts.items():
+            merged.setdefault((teacherID, weekday, period, tuple(classes)), []).append(weekCount2)
+
+        return [
+            {"teacher": NAME_TABLE[teacherID], "weekday": weekday, "period": period, "weekCounts": sorted(weekCounts),
+             "classes": list(classes)}
+            for (teacherID, weekday, period, classes), weekCounts in sorted(
+                merged.items(), key=lambda item: (NAME_TABLE[item[0][0]], item[0][1:3], min(item[1]))
+            )
+        ]
+
+
+def iterClassTables(source: str, weekTime: WeekTime) -> Iterable[tuple[str, ClassTable]]:
+    """
+    逐个读取所有班级的课表(全校课表文件为流式读取)
+
+    Args:
+        source (str): 班级目录, json清单文件或全校课表文件
+        weekTime (WeekTime): 时间实例
+
+    Yields:
+        tuple[str, ClassTable]: 班级名称, 课表
+    """
+
+    if os.path.isfile(source) and not source.lower().endswith(".json"):
+        for schoolClass in parseSchoolFile(source, weekTime):
+            yield (schoolClass.name, schoolClass.classTable)
+        return
+
+    for job in batch.collectJobs(source, ""):
+        classTable: ClassTable = ClassTable(weekTime)
+        classTable.parseClassTable(job["classes"], os.path.splitext(job["classes"])[1])
+        yield (job["name"], classTable)
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    老师冲突检查入口
+
+    Returns:
+        int: 进程退出码, 有冲突时为1
+    """
+
+    parser = argparse.ArgumentParser(description="CIConfig 老师冲突检查, 找出同一节课被排在多个班级的老师")
+    parser.add_argument("source", help="班级目录(每个子目录含 classes.txt), json清单文件或全校课表文件")
+    parser.add_argument("--report", default="", help="将所有冲突写入该json文件")
+    args = parser.parse_args(argv)
+
+    weekTime: WeekTime = WeekTime(0, 0)                                 # 检查整个轮换周期, 与偏移量无关
+    index: TeacherIndex = TeacherIndex(weekTime.calendar.weekPeriod2)
+
+    start = time.perf_counter()
+    for className, classTable in iterClassTables(args.source, weekTime):
+        index.addClass(className, classTable)
+    elapsed: float = time.perf_counter() - start
+
+    conflicts: list[dict[str, Any]] = index.report()
+    for conflict in conflicts:
+        weeks: str = "每周" if len(conflict["weekCounts"]) == index.weeks else \
+                     "第" + "/".join(str(w + 1) for w in conflict["weekCounts"]) + "周"
+        logger.warning(f"老师 '{conflict['teacher']}' {weeks}{LDAYINWEEK[conflict['weekday']]}"
+                       f"第{conflict['period'] + 1}节课同时在 {', '.join(conflict['classes'])} 上课")
+    logger.info(f"老师冲突检查结束, 共 {index.classCount} 个班级, {index.lessonCount} 节有老师的课, "
+                f"发现 {len(conflicts)} 处冲突, 耗时 {elapsed:.2f} s")
+
+    if args.report != "":
+        with open(args.report, "wb") as reportFile:
+            reportFile.write(orjson.dumps({"classes": index.classCount, "conflicts": conflicts}, option=orjson.OPT_INDENT_2))
+        logger.success(f"老师冲突报告已写入 '{args.report}'")
+
+    return 1 if len(conflicts) > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,212 @@
+# file: validator.py
+# brief: 时间表/课表校验模块, 检查时间段重叠/间隙/起止颠倒, 以及课程数与上课时间段数是否一致
+# time: 2026.10.17
+# TODOs:
+#   暂无
+#
+# 导入时间表/课表后和每次生成配置前都会校验, 有错误(ERROR_KINDS)时不会写入配置文件, 间隙只给出警告
+# 时间表的校验结果按内容缓存, 批量生成时所有班级共用同一个时间表只需校验一次
+
+from   calendar_index import LAYOUT_KEYS
+from   store          import TIME_LIST_NAMES
+from   typing         import Iterable, NamedTuple, Optional, TYPE_CHECKING
+from   loguru         import logger
+
+if TYPE_CHECKING:                                                       # 只用于类型标注, 避免循环导入
+    from class_manager import ClassTable, TimePeriod, TimeTable
+
+ISSUE_INVERTED: str = "inverted"                                        # 终止时间不晚于开始时间
+ISSUE_OVERLAP: str  = "overlap"                                         # 两个时间段重叠
+ISSUE_GAP: str      = "gap"                                             # 两个时间段之间有空档
+ISSUE_COUNT: str    = "count"                                           # 课程数与上课时间段数不一致
+ISSUE_EMPTY: str    = "empty"                                           # 时间表为空
+
+ERROR_KINDS: tuple[str, ...] = (ISSUE_INVERTED, ISSUE_OVERLAP, ISSUE_COUNT, ISSUE_EMPTY)
+
+SEPARATOR: int = 2                                                      # 分割线只是一个时间点, 不参与重叠/间隙检查
+
+CACHE_SIZE: int = 64
+
+
+class Issue(NamedTuple):
+    """
+    校验发现的一个问题
+    """
+
+    kind: str                                                           # 见ISSUE_*
+    where: str                                                          # 时间表/课程计划名称
+    message: str
+
+
+def time2str(minute: int) -> str:
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+def periodText(timePeriod: "TimePeriod") -> str:
+    return f"{time2str(timePeriod.startMinute)}-{time2str(timePeriod.finishMinute)}"
+
+def isError(issue: Issue) -> bool:
+    return issue.kind in ERROR_KINDS
+
+def errorsOf(issues: Iterable[Issue]) -> list[Issue]:
+    """
+    只保留会阻止写入的问题
+    """
+
+    return [issue for issue in issues if isError(issue)]
+
+def validateTimeList(timeList: list["TimePeriod"], name: str) -> list[Issue]:
+    """
+    校验一天的时间表: 先检查每个时间段的起止时间, 再按开始时间排序后扫描一遍, 报告每一对重叠的时间段和间隙
+
+    Args:
+        timeList (list[TimePeriod]): 一天的时间表
+        name (str): 时间表名称, 用于报告
+
+    Returns:
+        list[Issue]: 发现的问题
+    """
+
+    issues: list[Issue] = []
+    if len(timeList) == 0:
+        return [Issue(ISSUE_EMPTY, name, f"时间表 '{name}' 为空")]
+
+    periods: list[tuple[int, int, int]] = []                            # (开始, 终止, 在时间表中的下标)
+    for i, tp in enumerate(timeList):
+        if tp.timeType == SEPARATOR:
+            if tp.finishMinute < tp.startMinute:
+                issues.append(Issue(ISSUE_INVERTED, name, f"时间表 '{name}' 第 {i + 1} 个时间段(分割线 {periodText(tp)})起止颠倒"))
+            continue
+        if tp.finishMinute <= tp.startMinute:
+            issues.append(Issue(ISSUE_INVERTED, name, f"时间表 '{name}' 第 {i + 1} 个时间段({periodText(tp)})的终止时间不晚于开始时间"))
+            continue
+        periods.append((tp.startMinute, tp.finishMinute, i))
+
+    periods.sort()
+    active: list[tuple[int, int]] = []                                  # 仍未结束的时间段, (终止, 下标)
+    lastFinish: Optional[int] = None                                    # 已扫描过的时间段中最晚的终止时间
+    for start, finish, i in periods:
+        active = [(f, j) for f, j in active if f > start]
+        # 与每个仍未结束的时间段都重叠, 多个时间段落在同一个长时间段内时两两之间也会报告
+        for _f, j in sorted(active, key=lambda item: item[1]):
+            first, second = min(i, j), max(i, j)                        # 按在时间表中的顺序报告
+            issues.append(Issue(ISSUE_OVERLAP, name, f"时间表 '{name}' 第 {first + 1} 个时间段({periodText(timeList[first])})与"
+                                                     f"第 {second + 1} 个时间段({periodText(timeList[second])})重叠"))
+        if lastFinish is not None and len(active) == 0 and start > lastFinish:
+            issues.append(Issue(ISSUE_GAP, name, f"时间表 '{name}' 在 {time2str(lastFinish)}-{time2str(start)} 之间没有时间段"))
+        active.append((finish, i))
+        if lastFinish is None or finish > lastFinish:
+            lastFinish = finish
+
+    return issues
+
+_cache: dict[tuple, list[Issue]] = {}
+
+def validateTimeTable(timeTable: "TimeTable") -> list[Issue]:
+    """
+    校验四个时间表, 结果按时间表内容缓存
+
+    Args:
+        timeTable (TimeTable): 时间表
+
+    Returns:
+        list[Issue]: 发现的问题
+    """
+
+    timeLists: list[list["TimePeriod"]] = [getattr(timeTable, name) for name in TIME_LIST_NAMES]
+    key: tuple = tuple(tuple((tp.startMinute, tp.finishMinute, tp.timeType) for tp in timeList) for timeList in timeLists)
+
+    issues: Optional[list[Issue]] = _cache.get(key)
+    if issues is None:
+        issues = []
+        for timeList, layoutKey in zip(timeLists, LAYOUT_KEYS):
+            issues.extend(validateTimeList(timeList, layoutKey))
+        if len(_cache) >= CACHE_SIZE:
+            _cache.clear()
+        _cache[key] = issues
+
+    return list(issues)
+
+def classSlotCount(timeTable: "TimeTable", layoutKey: str) -> int:
+    """
+    获取时间表中上课时间段的数量
+
+    Args:
+        timeTable (TimeTable): 时间表
+        layoutKey (str): 时间表键名, 见LAYOUT_KEYS
+
+    Returns:
+        int: 上课时间段的数量, 键名无效时为-1
+    """
+
+    if layoutKey not in LAYOUT_KEYS[:len(TIME_LIST_NAMES)]:             # TIME_LIST_NAMES与LAYOUT_KEYS的顺序一致
+        return -1
+    timeList: list["TimePeriod"] = getattr(timeTable, TIME_LIST_NAMES[LAYOUT_KEYS.index(layoutKey)])
+    return sum(1 for tp in timeList if tp.timeType == 0)
+
+def validateClassCount(classCount: int, timeTable: "TimeTable", layoutKey: str, name: str) -> list[Issue]:
+    """
+    校验一天的课程数是否与所用时间表的上课时间段数一致
+
+    Args:
+        classCount (int): 课程数
+        timeTable (TimeTable): 时间表
+        layoutKey (str): 所用时间表的键名
+        name (str): 课程计划名称, 用于报告
+
+    Returns:
+        list[Issue]: 发现的问题
+    """
+
+    slotCount: int = classSlotCount(timeTable, layoutKey)
+    if slotCount == -1:
+        return [Issue(ISSUE_COUNT, name, f"课程计划 '{name}' 没有对应的时间表")]
+    if slotCount != classCount:
+        return [Issue(ISSUE_COUNT, name, f"课程计划 '{name}' 有 {classCount} 节课, 但时间表 '{layoutKey}' 中有 {slotCount} 个上课时间段")]
+    return []
+
+def validateClassTable(classTable: "ClassTable", timeTable: "TimeTable", name: str = "课表") -> list[Issue]:
+    """
+    校验整个课表: 完整轮换周期内每一天的课程数(含晚课和自习)是否与单双周两个时间表的上课时间段数一致
+    三周轮换的周期取自课表所用的日历(classTable.myTime.calendar), 见rotation模块
+
+    Args:
+        classTable (ClassTable): 课表
+        timeTable (TimeTable): 时间表
+        name (str, optional): 课表名称, 用于报告. Defaults to "课表".
+
+    Returns:
+        list[Issue]: 发现的问题, 相同的问题只报告一次
+    """
+
+    weeks: int = classTable.myTime.calendar.weekPeriod2
+    if len(classTable.classTable1) < 5 or len(classTable.classTable2) < weeks or len(classTable.classTable3) < weeks or \
+       any(len(weekEvenClass) < 5 for weekEvenClass in classTable.classTable3[:weeks]):
+        return [Issue(ISSUE_EMPTY, name, f"'{name}' 为空或不完整(需要周一至周五, {weeks}周的周六和{weeks}周的晚课)")]
+
+    issues: list[Issue] = []
+    for weekday, dayName in enumerate(["周一", "周二", "周三", "周四", "周五", "周六"]):
+        layoutKeys: list[str] = LAYOUT_KEYS[2:4] if weekday == 5 else LAYOUT_KEYS[0:2]
+        for weekCount2 in range(weeks):
+            classCount: int = len(classTable.getClassTableOfDay(weekday, weekCount2))
+            planName: str = f"{name} 第{weekCount2 + 1}周{dayName}" if weekday == 5 else f"{name} {dayName}"
+            for layoutKey in layoutKeys:
+                for issue in validateClassCount(classCount, timeTable, layoutKey, planName):
+                    if issue not in issues:
+                        issues.append(issue)
+
+    return issues
+
+def logIssues(issues: list[Issue], context: str) -> None:
+    """
+    输出校验结果, 错误用error, 其余用warning
+
+    Args:
+        issues (list[Issue]): 校验结果
+        context (str): 在什么时候校验, 如"导入时间表"
+    """
+
+    for issue in issues:
+        if isError(issue):
+            logger.error(f"{context}时发现错误: {issue.message}")
+        else:
+            logger.warning(f"{context}时发现问题: {issue.message}")
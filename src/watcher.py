@@ -0,0 +1,300 @@
+# file: watcher.py
+# brief: 监视模式, 课表/时间表文件变化后自动重新导入并生成配置文件
+# time: 2026.10.17
+# TODOs:
+#   暂无
+#
+# 用法:
+#   python src/watcher.py [--classes 课表文件] [--timetable 时间表文件] [-o 输出路径] [--debounce 秒] [--report 报告路径]
+#
+# 轮询文件的修改时间和大小(共享盘上文件系统通知不可靠), 一段时间内的多次保存合并为一次处理(防抖),
+# 只重新解析发生变化的文件, 然后生成并写入配置文件, 报告从保存文件到写入配置的延迟
+# 文件解析失败(如编辑器保存到一半), 为空或校验不通过时继续使用最后一次通过校验的课表/时间表, 不会覆盖已保存的数据
+
+from   class_manager import ClassTable, TimeTable
+from   json_writer   import JsonManager
+from   weektime      import WeekTime
+from   typing        import Any, Callable, Optional
+from   loguru        import logger
+import argparse, datetime, fanout, os, silent, sys, time, orjson, validator
+
+POLL_INTERVAL: float = 0.2                                              # 轮询间隔(秒)
+DEFAULT_DEBOUNCE: float = 0.5                                           # 文件停止变化多久后才处理(秒)
+
+FileState = Optional[tuple[int, int]]                                   # (修改时间ns, 大小), 文件不存在时为None
+
+
+def fileState(filePath: str) -> FileState:
+    try:
+        stat = os.stat(filePath)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class FileWatcher:
+    """
+    轮询式文件监视器, 带防抖
+    """
+
+    paths: list[str]
+    states: dict[str, FileState]
+    callback: Callable[[set[str], int], None]                           # (变化的文件, 最早一次保存的时间ns)
+    debounce: float
+    interval: float
+
+    def __init__(self, paths: list[str], callback: Callable[[set[str], int], None],
+                 debounce: float = DEFAULT_DEBOUNCE, interval: float = POLL_INTERVAL) -> None:
+        """
+        初始化
+
+        Args:
+            paths (list[str]): 需要监视的文件
+            callback (Callable[[set[str], int], None]): 文件变化并稳定后调用, 参数为变化的文件和最早一次保存的时间(ns)
+            debounce (float, optional): 文件停止变化多久后才调用callback(秒). Defaults to DEFAULT_DEBOUNCE.
+            interval (float, optional): 轮询间隔(秒). Defaults to POLL_INTERVAL.
+        """
+
+        self.paths = paths
+        self.callback = callback
+        self.debounce = debounce
+        self.interval = interval
+        self.states = {path: fileState(path) for path in paths}
+
+    def poll(self) -> set[str]:
+        """
+        检查一次所有文件
+
+        Returns:
+            set[str]: 状态发生变化的文件
+        """
+
+        changed: set[str] = set()
+        for path in self.paths:
+            state: FileState = fileState(path)
+            if state != self.states[path]:
+                self.states[path] = state
+                changed.add(path)
+        return changed
+
+    def run(self, stop: Callable[[], bool] = lambda: False) -> None:
+        """
+        开始监视, 直到stop()返回True
+
+        Args:
+            stop (Callable[[], bool], optional): 是否停止监视. Defaults to lambda: False.
+        """
+
+        pending: set[str] = set()                                       # 已变化但还没处理的文件
+        lastChange: float = 0.0                                         # 最近一次发现变化的时间(monotonic)
+        firstSave: int = 0                                              # 本轮变化中最早一次保存的时间(ns)
+
+        while not stop():
+            changed: set[str] = self.poll()
+            if len(changed) > 0:
+                if len(pending) == 0:
+                    firstSave = min((self.states[path] or (time.time_ns(), 0))[0] for path in changed)
+                pending |= changed
+                lastChange = time.monotonic()
+            elif len(pending) > 0 and time.monotonic() - lastChange >= self.debounce:
+                self.callback(pending, firstSave)
+                pending = set()
+
+            time.sleep(self.interval)
+
+
+class WatchSession:
+    """
+    监视模式, 文件变化后只重新解析变化的文件, 通过校验后才替换正在使用的课表/时间表, 然后生成并写入配置文件
+    """
+
+    classesPath: str
+    timetablePath: str
+    outPath: str
+    reportPath: str
+
+    weekTime: WeekTime
+    classTable: ClassTable                                              # 正在使用的课表(最后一次通过校验的)
+    timeTable: TimeTable
+    fileClassTable: Optional[ClassTable]                                # 课表文件当前内容的解析结果, 解析失败时为None
+    fileTimeTable: Optional[TimeTable]
+    jsonManager: JsonManager
+
+    def __init__(self, classesPath: str, timetablePath: str, outPath: str, reportPath: str = "") -> None:
+        self.classesPath = classesPath
+        self.timetablePath = timetablePath
+        self.outPath = outPath
+        self.reportPath = reportPath
+
+        self.weekTime = WeekTime()
+        self.jsonManager = JsonManager(self.weekTime)
+
+        # 先使用上次保存的数据, 文件的内容通过校验后再替换
+        self.classTable = ClassTable(self.weekTime)
+        self.classTable.loadClassTable()
+        self.timeTable = TimeTable()
+        self.timeTable.loadTimeTable()
+        self.fileClassTable = self.parseClassTable()
+        self.fileTimeTable = self.parseTimeTable()
+        self.acceptFiles()
+
+    def parseClassTable(self) -> Optional[ClassTable]:
+        """
+        解析课表文件
+
+        Returns:
+            Optional[ClassTable]: 新的课表, 文件损坏或有格式错误的行时为None
+        """
+
+        classTable: ClassTable = ClassTable(self.weekTime)              # 每次都新建, 避免旧课表的残留行
+        if not classTable.parseClassTable(self.classesPath, os.path.splitext(self.classesPath)[1]):
+            return None
+        return classTable
+
+    def parseTimeTable(self) -> Optional[TimeTable]:
+        """
+        解析时间表文件
+
+        Returns:
+            Optional[TimeTable]: 新的时间表, 文件损坏或有格式错误的行时为None
+        """
+
+        timeTable: TimeTable = TimeTable()
+        if not timeTable.parseTimeTable(self.timetablePath, os.path.splitext(self.timetablePath)[1]):
+            return None
+        return timeTable
+
+    def acceptFiles(self) -> bool:
+        """
+        检查两个文件当前的解析结果, 都解析成功且通过校验(时间表无错误, 每天的课程数与时间表一致)时
+        替换正在使用的课表/时间表并保存(与手动导入一致, 下次启动时使用), 否则保留之前的
+
+        课程数需要两个文件一起校验, 所以先改时间表再改课表时, 两个文件都改完后才会一起生效
+
+        Returns:
+            bool: 是否替换了课表或时间表
+        """
+
+        if self.fileClassTable is None or self.fileTimeTable is None:
+            failed: str = "课表" if self.fileClassTable is None else "时间表"
+            logger.warning(f"{failed}文件解析失败, 继续使用之前导入的课表和时间表")
+            return False
+
+        errors: list[validator.Issue] = validator.errorsOf(validator.validateTimeTable(self.fileTimeTable)) + \
+                                        validator.errorsOf(validator.validateClassTable(self.fileClassTable, self.fileTimeTable))
+        if len(errors) > 0:
+            validator.logIssues(errors, "监视模式校验")
+            logger.warning("课表/时间表未通过校验, 继续使用之前导入的课表和时间表")
+            return False
+
+        replaced: bool = False
+        if self.classTable is not self.fileClassTable:
+            self.classTable = self.fileClassTable
+            self.classTable.saveClassTable()
+            replaced = True
+        if self.timeTable is not self.fileTimeTable:
+            self.timeTable = self.fileTimeTable
+            self.timeTable.saveTimeTable()
+            replaced = True
+        return replaced
+
+    def onChanged(self, changed: set[str], firstSave: int) -> None:
+        """
+        文件变化后的处理函数, 见FileWatcher.callback
+        """
+
+        detected: float = time.time()
+        timing: dict[str, float] = {}
+
+        for path in changed:
+            if fileState(path) is None:
+                logger.warning(f"文件 '{path}' 已被删除或无法访问, 继续使用之前导入的内容")
+
+        t0 = time.perf_counter()
+        reparsed: bool = False
+        if self.classesPath in changed and fileState(self.classesPath) is not None:
+            self.fileClassTable = self.parseClassTable()
+            reparsed = True
+        if self.timetablePath in changed and fileState(self.timetablePath) is not None:
+            self.fileTimeTable = self.parseTimeTable()
+            reparsed = True
+        accepted: bool = reparsed and self.acceptFiles()
+        t1 = time.perf_counter()
+
+        written: bool = self.regenerate(timing)
+        timing["parse"] = round((t1 - t0) * 1000, 3)
+        latency: float = round(time.time() * 1000 - firstSave / 1e6, 3)     # 从保存文件到写入配置
+
+        logger.info(f"文件变化已处理: {', '.join(sorted(changed))}, 保存到写入共 {latency:.1f} ms "
+                    f"(解析 {timing['parse']:.1f} ms, 生成 {timing['generate']:.1f} ms, 写入 {timing['write']:.1f} ms)")
+
+        if self.reportPath != "":
+            self.appendReport({
+                "time": datetime.datetime.now().isoformat(timespec="seconds"),
+                "changed": sorted(changed),
+                "accepted": accepted,
+                "written": written,
+                "latency_ms": latency,
+                "wait_ms": round(detected * 1000 - firstSave / 1e6, 3),    # 发现变化+防抖等待
+                "timing": timing
+            })
+
+    def regenerate(self, timing: dict[str, float]) -> bool:
+        """
+        生成并写入配置文件, 耗时(ms)记录在timing中
+
+        Returns:
+            bool: 是否写入了配置文件
+        """
+
+        t0 = time.perf_counter()
+        self.weekTime.refresh()
+        self.classTable.getClassTableToday()
+        self.jsonManager.generateOverAllDict(self.classTable, self.timeTable)
+        t1 = time.perf_counter()
+        written: bool = self.jsonManager.writeJsonFile(self.outPath)
+        t2 = time.perf_counter()
+
+        timing["generate"] = round((t1 - t0) * 1000, 3)
+        timing["write"]    = round((t2 - t1) * 1000, 3)
+        return written
+
+    def appendReport(self, entry: dict[str, Any]) -> None:
+        """
+        在报告文件末尾追加一行(json lines)
+        """
+
+        with open(self.reportPath, "ab") as reportFile:
+            reportFile.write(orjson.dumps(entry) + b"\n")
+
+    def run(self, debounce: float = DEFAULT_DEBOUNCE) -> None:
+        logger.info(f"开始监视 '{self.classesPath}' 和 '{self.timetablePath}', 输出到 '{self.outPath}'")
+        self.regenerate({})                                             # 启动时先按当前文件生成一次
+        FileWatcher([self.classesPath, self.timetablePath], self.onChanged, debounce).run()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="CIConfig 监视模式, 课表/时间表变化后自动重新生成配置文件")
+    parser.add_argument("--classes", default="./classes.txt", help="课表文件(txt/xlsx), 默认为 ./classes.txt")
+    parser.add_argument("--timetable", default="./timetable.txt", help="时间表文件(txt/xlsx), 默认为 ./timetable.txt")
+    parser.add_argument("-o", "--output", default="", help="配置文件输出路径, 默认按设置文件中的ClassIsland路径")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE, help="文件停止变化多久后才处理(秒)")
+    parser.add_argument("--report", default="", help="将每次处理的延迟追加到该文件(json lines)")
+    args = parser.parse_args(argv)
+
+    settings: dict[str, Any] = silent.loadSettings() or {}
+    outPath: str = args.output or silent.outPathFromSettings(settings.get("pathToCI", ""))
+
+    session: WatchSession = WatchSession(args.classes, args.timetable, outPath, args.report)
+    session.jsonManager.setFullCycle(settings.get("fullCycle", False))
+    session.jsonManager.setOutputTargets(settings.get("backup", True), settings.get("archiveDir", ""),
+                                         settings.get("shareDirs", []), settings.get("writeTimeout", fanout.DEFAULT_TIMEOUT))
+    try:
+        session.run(args.debounce)
+    except KeyboardInterrupt:
+        logger.info("监视模式已退出")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
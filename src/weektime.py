@@ -0,0 +1,107 @@
+# file: weektime.py
+# brief: 无Qt依赖的周数计算模块
+# time: 2026.10.17
+# TODOs:
+#   暂无
+
+from   calendar_index import CalendarIndex, weekStart
+from   clock          import Clock, SYSTEM_CLOCK
+from   holidays       import loadHolidays
+from   rotation       import loadRules, weekPeriod2
+from   typing         import Optional
+from   loguru         import logger
+import datetime, json
+
+
+class WeekTime:
+    """
+    周数计算类, 提供与MyTime相同的周数/偏移量接口, 但不依赖Qt, 也不启动线程
+    用于批量生成等不需要图形界面的场景
+    """
+
+    weekOffset1: int = 0                                                # 单双周偏移量
+    weekOffset2: int = 0                                                # 3周课表轮换偏移
+
+    weekCount1: int = 0                                                 # 修正后的单双周数(0=单周, 1=双周)
+    weekCount2: int = 0                                                 # 修正后的三周周数
+
+    curDateTime: datetime.datetime
+
+    calendar: CalendarIndex                                             # 学期日历索引
+    clock: Clock                                                        # 所有"现在/今天"的查询都通过它完成
+
+    def __init__(self, weekOffset1: Optional[int] = None, weekOffset2: Optional[int] = None,
+                 offsetFilePath: str = "./data/time.json", clock: Clock = SYSTEM_CLOCK) -> None:
+        """
+        初始化
+
+        Args:
+            weekOffset1 (int, optional): 单双周偏移量, 为None时从偏移量文件读取. Defaults to None.
+            weekOffset2 (int, optional): 三周轮换偏移量, 为None时从偏移量文件读取. Defaults to None.
+            offsetFilePath (str, optional): 偏移量文件路径. Defaults to "./data/time.json".
+            clock (Clock, optional): 时钟, 模拟时传入VirtualClock. Defaults to SYSTEM_CLOCK.
+        """
+
+        self.clock = clock
+        if weekOffset1 is None or weekOffset2 is None:
+            self.loadTimeOffset(offsetFilePath)
+        if weekOffset1 is not None:
+            self.weekOffset1 = weekOffset1
+        if weekOffset2 is not None:
+            self.weekOffset2 = weekOffset2
+
+        rules = loadRules()
+        self.calendar = CalendarIndex(weekStart(clock.today()), weekOffset1=self.weekOffset1, weekOffset2=self.weekOffset2,
+                                      customRules=rules, holidays=loadHolidays(weekPeriod2=weekPeriod2(rules)))
+        self.weekOffset1, self.weekOffset2 = self.calendar.weekOffset1, self.calendar.weekOffset2    # 按轮换周期取模后的值
+        self.refresh()
+
+    def loadTimeOffset(self, filePath: str = "./data/time.json") -> None:
+        """
+        加载时间偏移量数据(只读, 不会创建文件)
+
+        Args:
+            filePath (str, optional): 偏移量文件路径. Defaults to "./data/time.json".
+        """
+
+        try:
+            with open(filePath, "r") as timeOffsetFile:
+                data: dict = json.load(timeOffsetFile)
+        except FileNotFoundError:
+            logger.warning(f"读取时间偏移量时路径 '{filePath}' 不存在, 使用默认偏移量")
+            return
+
+        self.weekOffset1 = data.get("weekOffset1", 0)
+        self.weekOffset2 = data.get("weekOffset2", 0)
+
+    def refresh(self) -> None:
+        """
+        按当前时间重新计算周数
+        """
+
+        self.curDateTime = self.clock.now()
+        info = self.calendar.lookup(self.curDateTime.date())
+        self.weekCount1 = info.weekCount1
+        self.weekCount2 = info.weekCount2
+
+    def getWeekCount1(self) -> int:
+        """
+        获取单双周周数
+
+        Returns:
+            int: 单双周周数(修正值, 范围为[0, 1])
+        """
+
+        self.refresh()
+        return self.weekCount1
+
+    def getWeekCount2(self) -> int:
+        """
+        获取三周课表周数
+
+        Returns:
+            int: 三周课表周数(修正值, 范围为[0, 2])
+        """
+
+        self.refresh()
+        return self.weekCount2
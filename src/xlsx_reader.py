@@ -0,0 +1,381 @@
+# file: xlsx_reader.py
+# brief: 无第三方依赖的xlsx流式读取模块, 把表格的每一行转换为与txt格式相同的行交给已有的解析函数
+# time: 2026.10.17
+# TODOs:
+#   1. 写入xlsx
+#
+# xlsx文件本质上是一个zip压缩包, 每个工作表是其中的一个xml文件(xl/worksheets/sheetN.xml),
+# 这里直接从压缩包中边解压边用iterparse增量解析, 每处理完一行就释放, 不会把整个工作表读入内存
+#
+# 表格格式:
+#   课表: 每行为 前缀 | 课程1 | 课程2 | ......, 如 周一 | 数学 | 外语 | ......
+#   时间表: 每行为 名称 | 开始时间 | 终止时间, 或 名称 | 07:30-08:10; 只有一格的行视为标题(如"平日时间", "周六时间")
+#           时间可以是文本, 也可以是Excel的时间格式
+#   全校课表(多个工作表): 每个工作表为一个班级, 工作表名即班级名;
+#           名为"时间表"的工作表为全校共用的时间表, 名为"<班级名>-时间表"的工作表为该班级自己的时间表;
+#           工作表中也可以用只有一格的"[班级名]"行来放多个班级, 格式同school_parser模块
+
+from   typing import Iterator, Optional
+from   loguru import logger
+import posixpath, re, zipfile
+import xml.etree.ElementTree as ET
+
+NS_MAIN: str      = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+NS_REL: str       = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+NS_PKG_REL: str   = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+TIMETABLE_SHEET: str = "时间表"                                          # 时间表工作表名(或名称后缀)
+
+CELL_REF = re.compile(r"([A-Z]+)(\d*)")
+TIME_TEXT = re.compile(r"(?<!\d)(\d):(\d\d)")                           # 只有一位小时数的时间, 如 7:30
+
+
+def columnIndex(ref: str) -> int:
+    """
+    单元格引用(如"AB12")转换为列下标(从0开始)
+    """
+
+    match = CELL_REF.match(ref)
+    if match is None:
+        return -1
+
+    index: int = 0
+    for ch in match.group(1):
+        index = index * 26 + (ord(ch) - ord("A") + 1)
+    return index - 1
+
+def numberToText(value: str) -> str:
+    """
+    数字单元格转换为文本, 0-1之间的小数视为Excel的时间格式(一天的几分之几), 转换为hh:mm
+    """
+
+    try:
+        number: float = float(value)
+    except ValueError:
+        return value
+
+    if number.is_integer():
+        return str(int(number))
+    if 0 <= number < 1:
+        minutes: int = round(number * 24 * 60)
+        return f"{minutes // 60:02d}:{minutes % 60:02d}"
+    return value
+
+def normalizeTime(text: str) -> str:
+    """
+    把文本中一位小时数的时间补齐为两位(7:30 -> 07:30), 时间表解析按固定位置读取时间
+    """
+
+    return TIME_TEXT.sub(lambda m: f"0{m.group(1)}:{m.group(2)}", text)
+
+def iterparseSafe(source, name: str, errors: Optional[list[str]] = None) -> Iterator[tuple[str, ET.Element]]:
+    """
+    增量解析xml, 遇到损坏的xml时记录错误并停止, 已经解析出的内容仍然有效
+    给出errors时错误信息也会追加到其中, 调用方可以据此判断读取是否完整
+    """
+
+    try:
+        yield from ET.iterparse(source, events=("start", "end"))
+    except (ET.ParseError, zipfile.BadZipFile, EOFError) as e:
+        logger.error(f"xlsx文件 '{name}' 已损坏, 后续内容无法读取: {e}")
+        if errors is not None:
+            errors.append(f"'{name}' 已损坏: {e}")
+
+def openReader(filePath: str, errors: Optional[list[str]] = None) -> Optional["XlsxReader"]:
+    """
+    打开xlsx文件, 失败时记录错误并返回None, 给出errors时错误信息也会追加到其中
+    """
+
+    try:
+        return XlsxReader(filePath, errors)
+    except (OSError, zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+        logger.error(f"无法打开xlsx文件 '{filePath}': {type(e).__name__}: {e}")
+        if errors is not None:
+            errors.append(f"无法打开 '{filePath}': {type(e).__name__}: {e}")
+        return None
+
+
+class XlsxReader:
+    """
+    xlsx流式读取类
+    """
+
+    filePath: str
+    zipFile: zipfile.ZipFile
+    sharedStrings: list[str]                                            # 共享字符串表, 文本单元格中存放的是它的下标
+    sheets: list[tuple[str, str]]                                       # (工作表名, 压缩包内的路径), 顺序同Excel中
+    errors: list[str]                                                   # 读取过程中遇到的错误
+
+    def __init__(self, filePath: str, errors: Optional[list[str]] = None) -> None:
+        """
+        打开xlsx文件并读取工作表列表和共享字符串表
+
+        Args:
+            filePath (str): xlsx文件路径
+            errors (list[str], optional): 读取过程中遇到的错误会追加到其中. Defaults to None.
+        """
+
+        self.filePath = filePath
+        self.errors = errors if errors is not None else []
+        self.zipFile = zipfile.ZipFile(filePath, "r")
+        self.sharedStrings = []
+        self.sheets = []
+
+        self.loadSheets()
+        self.loadSharedStrings()
+
+    def __enter__(self) -> "XlsxReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.zipFile.close()
+
+    def loadSheets(self) -> None:
+        """
+        从xl/workbook.xml和对应的关系文件读取工作表名和路径
+        """
+
+        targets: dict[str, str] = {}
+        with self.zipFile.open("xl/_rels/workbook.xml.rels") as relsFile:
+            for rel in ET.parse(relsFile).getroot().iter(f"{NS_PKG_REL}Relationship"):
+                target: str = rel.get("Target", "")
+                # 路径可以是相对于xl/的, 也可以是以/开头的绝对路径
+                targets[rel.get("Id", "")] = target.lstrip("/") if target.startswith("/") else posixpath.join("xl", target)
+
+        with self.zipFile.open("xl/workbook.xml") as workbookFile:
+            for sheet in ET.parse(workbookFile).getroot().iter(f"{NS_MAIN}sheet"):
+                path: Optional[str] = targets.get(sheet.get(f"{NS_REL}id", ""))
+                if path is None:
+                    logger.warning(f"xlsx中的工作表 '{sheet.get('name')}' 找不到对应的文件, 已跳过")
+                    continue
+                self.sheets.append((sheet.get("name", ""), posixpath.normpath(path)))
+
+    def loadSharedStrings(self) -> None:
+        """
+        流式读取共享字符串表(没有文本单元格的文件中不存在)
+        """
+
+        if "xl/sharedStrings.xml" not in self.zipFile.namelist():
+            return
+
+        with self.zipFile.open("xl/sharedStrings.xml") as stringsFile:
+            sst: Optional[ET.Element] = None
+            for event, elem in iterparseSafe(stringsFile, f"{self.filePath}:sharedStrings", self.errors):
+                if event == "start":
+                    if elem.tag == f"{NS_MAIN}sst":
+                        sst = elem
+                    continue
+                if elem.tag != f"{NS_MAIN}si":
+                    continue
+
+                # 富文本会被拆成多个<r><t>, 拼起来即可; <rPh>为注音, 不要
+                phonetic: set[ET.Element] = {t for rph in elem.iter(f"{NS_MAIN}rPh") for t in rph.iter(f"{NS_MAIN}t")}
+                self.sharedStrings.append("".join(t.text or "" for t in elem.iter(f"{NS_MAIN}t") if t not in phonetic))
+
+                if sst is not None:
+                    sst.clear()
+                else:
+                    elem.clear()
+
+    def sheetNames(self) -> list[str]:
+        return [name for name, _path in self.sheets]
+
+    def cellText(self, cell: ET.Element) -> str:
+        """
+        获取单元格的文本
+        """
+
+        cellType: str = cell.get("t", "n")
+
+        if cellType == "inlineStr":
+            return "".join(t.text or "" for t in cell.iter(f"{NS_MAIN}t")).strip()
+
+        v: Optional[ET.Element] = cell.find(f"{NS_MAIN}v")
+        if v is None or v.text is None:
+            return ""
+
+        if cellType == "s":
+            index: int = int(v.text)
+            return self.sharedStrings[index].strip() if 0 <= index < len(self.sharedStrings) else ""
+        elif cellType == "n":
+            return numberToText(v.text)
+        else:                                                           # str(公式结果), b(布尔), e(错误)等
+            return v.text.strip()
+
+    def iterRows(self, sheetName: str) -> Iterator[tuple[int, list[str]]]:
+        """
+        流式读取一个工作表的所有行
+
+        Args:
+            sheetName (str): 工作表名
+
+        Yields:
+            tuple[int, list[str]]: 行号(从1开始, 与Excel中一致), 该行每个单元格的文本(去掉了末尾的空单元格)
+        """
+
+        path: Optional[str] = next((p for name, p in self.sheets if name == sheetName), None)
+        if path is None:
+            logger.error(f"xlsx中不存在工作表 '{sheetName}'")
+            self.errors.append(f"不存在工作表 '{sheetName}'")
+            return
+
+        rowNumber: int = 0
+        with self.zipFile.open(path) as sheetFile:
+            sheetData: Optional[ET.Element] = None
+            for event, elem in iterparseSafe(sheetFile, f"{self.filePath}:{sheetName}", self.errors):
+                if event == "start":
+                    if elem.tag == f"{NS_MAIN}sheetData":
+                        sheetData = elem
+                    continue
+                if elem.tag != f"{NS_MAIN}row":
+                    continue
+
+                rowNumber = int(elem.get("r", rowNumber + 1))
+                cells: list[str] = []
+                for cell in elem.iter(f"{NS_MAIN}c"):
+                    col: int = columnIndex(cell.get("r", ""))
+                    if col == -1:                                       # 没有引用时按顺序排列
+                        col = len(cells)
+                    while len(cells) < col:                             # 中间跳过的空单元格
+                        cells.append("")
+                    cells.append(self.cellText(cell))
+
+                while len(cells) > 0 and cells[-1] == "":
+                    cells.pop()
+
+                # 处理完的行立刻释放, 内存占用只与一行的大小有关
+                if sheetData is not None:
+                    sheetData.clear()
+                else:
+                    elem.clear()
+
+                yield (rowNumber, cells)
+
+
+def classRowToLine(cells: list[str]) -> str:
+    """
+    课表的一行转换为txt格式(周一:数学,外语,......)
+    """
+
+    if len(cells) == 0:
+        return ""
+    if len(cells) == 1:
+        # "[班级名]"或者本身就是txt格式的行, 其余只有一格的行视为标题, 跳过
+        return cells[0] if cells[0].startswith("[") or ":" in cells[0] else ""
+    return f"{cells[0].rstrip(':：')}:{','.join(cells[1:])}"
+
+def timeRowToLine(cells: list[str]) -> str:
+    """
+    时间表的一行转换为txt格式(第一节课:07:30-08:10)
+    """
+
+    cells = [normalizeTime(cell) for cell in cells]
+
+    if len(cells) == 0:
+        return ""
+    if len(cells) == 1:
+        if cells[0].startswith("[") or "-" in cells[0] or "~" in cells[0]:
+            return cells[0]
+        return cells[0].rstrip(":：") + ":"                             # 标题行, 如"平日时间:"
+    if len(cells) == 2:
+        return f"{cells[0].rstrip(':：')}:{cells[1]}"
+    return f"{cells[0].rstrip(':：')}:{cells[1]}-{cells[2]}"
+
+def isTimeTableSection(name: str) -> bool:
+    return name == TIMETABLE_SHEET or name.endswith("/" + TIMETABLE_SHEET)
+
+def findSheet(reader: XlsxReader, timeTable: bool) -> Optional[str]:
+    """
+    单个班级的xlsx中查找课表/时间表所在的工作表: 名称含"时间"的为时间表, 否则为课表; 找不到时使用第一个工作表
+    """
+
+    names: list[str] = reader.sheetNames()
+    if len(names) == 0:
+        return None
+    for name in names:
+        if ("时间" in name) == timeTable:
+            return name
+    return names[0]
+
+def iterClassTableLines(filePath: str, errors: Optional[list[str]] = None) -> Iterator[tuple[int, str]]:
+    """
+    读取xlsx中的课表, 转换为(行号, txt格式的行), 交给ClassTable.parseClassTableLines
+
+    Args:
+        filePath (str): xlsx文件路径
+        errors (list[str], optional): 文件损坏等读取错误会追加到其中. Defaults to None.
+    """
+
+    reader: Optional[XlsxReader] = openReader(filePath, errors)
+    if reader is None:
+        return
+
+    with reader:
+        sheet: Optional[str] = findSheet(reader, False)
+        if sheet is None:
+            logger.error(f"xlsx文件 '{filePath}' 中没有工作表")
+            reader.errors.append("没有工作表")
+            return
+        for rowNumber, cells in reader.iterRows(sheet):
+            yield (rowNumber, classRowToLine(cells))
+
+def iterTimeTableLines(filePath: str, errors: Optional[list[str]] = None) -> Iterator[tuple[int, str]]:
+    """
+    读取xlsx中的时间表, 转换为(行号, txt格式的行), 交给TimeTable.parseTimeTableLines
+
+    Args:
+        filePath (str): xlsx文件路径
+        errors (list[str], optional): 文件损坏等读取错误会追加到其中. Defaults to None.
+    """
+
+    reader: Optional[XlsxReader] = openReader(filePath, errors)
+    if reader is None:
+        return
+
+    with reader:
+        sheet: Optional[str] = findSheet(reader, True)
+        if sheet is None:
+            logger.error(f"xlsx文件 '{filePath}' 中没有工作表")
+            reader.errors.append("没有工作表")
+            return
+        for rowNumber, cells in reader.iterRows(sheet):
+            yield (rowNumber, timeRowToLine(cells))
+
+def iterSchoolLines(filePath: str) -> Iterator[tuple[int, str]]:
+    """
+    把多工作表的全校课表xlsx转换为school_parser的格式, 逐行返回
+
+    Args:
+        filePath (str): xlsx文件路径
+
+    Yields:
+        tuple[int, str]: (行号, txt格式的行), 行号为该行在其工作表中的行号
+    """
+
+    reader: Optional[XlsxReader] = openReader(filePath)
+    if reader is None:
+        return
+
+    with reader:
+        for sheet in reader.sheetNames():
+            # 工作表名即节名, "<班级名>-时间表"对应"[<班级名>/时间表]"
+            section: str = sheet.strip()
+            if section != TIMETABLE_SHEET and section.endswith(TIMETABLE_SHEET):
+                section = section[: -len(TIMETABLE_SHEET)].rstrip(" -_") + "/" + TIMETABLE_SHEET
+            sheetHeader: bool = False                                   # 是否已经输出了工作表名对应的节名
+
+            for rowNumber, cells in reader.iterRows(sheet):
+                if len(cells) == 0:
+                    continue
+                if len(cells) == 1 and cells[0].startswith("[") and cells[0].endswith("]"):
+                    section = cells[0][1:-1].strip()                    # 工作表中又分了多个班级
+                    sheetHeader = True
+                    yield (rowNumber, cells[0])
+                    continue
+                if not sheetHeader:
+                    sheetHeader = True
+                    yield (0, f"[{section}]")
+                yield (rowNumber, timeRowToLine(cells) if isTimeTableSection(section) else classRowToLine(cells))